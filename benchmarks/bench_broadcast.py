@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+브로드캐스트 처리량 벤치마크
+로컬 가짜 Bot API(fake_bot_api.py)를 별도 프로세스로 띄우고 TelegramModel의 "지금 전송"(send_message)과
+스케줄 실행(아웃박스 경로)을 채팅방 수 / 동시 전송 수 / 오류 비율별로 측정한다.
+결과는 JSON으로 출력하며, --baseline으로 이전 결과와 비교해 성능 저하를 찾을 수 있다.
+
+    python benchmarks/bench_broadcast.py --chats 10 1000 50000 --concurrency 16 64 \\
+        --error-rates 0 0.01 --output result.json
+    python benchmarks/bench_broadcast.py --baseline result.json --tolerance 0.15
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import platform
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from models.retry_policy import RetryPolicy
+from models.telegram_model import TelegramModel
+
+FAKE_SERVER = os.path.join(ROOT, "benchmarks", "fake_bot_api.py")
+BOT_TOKEN = "123456:bench"
+MODES = ("send", "scheduled")
+# 결과를 비교할 때 같은 측정으로 보는 키
+CASE_KEYS = ("mode", "chats", "concurrency", "error_rate", "flood_rate")
+
+
+class FakeServerProcess:
+    """가짜 Bot API를 별도 프로세스로 실행 (서버 메모리/CPU가 측정에 섞이지 않도록)"""
+
+    def __init__(self, latency: float, error_rate: float, flood_rate: float, seed: int = 42):
+        self._process = subprocess.Popen(
+            [sys.executable, FAKE_SERVER, "--port", "0", "--latency", str(latency),
+             "--error-rate", str(error_rate), "--flood-rate", str(flood_rate), "--seed", str(seed)],
+            stdout=subprocess.PIPE, text=True)
+        # 첫 줄에 실제 주소가 출력됨
+        self.base_url = self._process.stdout.readline().rsplit(" ", 1)[-1].strip()
+        if not self.base_url.startswith("http"):
+            self._process.kill()
+            raise RuntimeError("가짜 Bot API 서버를 시작하지 못했습니다")
+
+    def stop(self) -> dict:
+        """서버를 종료하고 서버 쪽 통계 반환"""
+        self._process.send_signal(signal.SIGINT)
+        try:
+            output, _ = self._process.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            return {}
+        lines = output.strip().splitlines()
+        return json.loads(lines[-1]) if lines else {}
+
+
+def percentiles(samples: list) -> dict:
+    """p50 / p95 / p99 / 최대값 (밀리초)"""
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(round(p * len(ordered))) - 1))] * 1000
+
+    return {"p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99), "max": ordered[-1] * 1000}
+
+
+def instrument(model: TelegramModel, samples: list):
+    """채팅방 하나에 대한 전송 시간(재시도/flood-wait 포함) 기록"""
+    send = model._async_send_message
+
+    async def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await send(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - started)
+
+    model._async_send_message = timed
+
+
+def build_model(base_url: str, chats: int, concurrency: int, db_path, base_delay: float) -> TelegramModel:
+    model = TelegramModel(max_concurrency=concurrency, send_workers=concurrency, db_path=db_path,
+                          retry_policy=RetryPolicy(base_delay=base_delay), base_url=base_url)
+    # 전송 한도는 끄고 전송 경로 자체를 측정
+    model.set_rate_limits(1e9, 1e9, 1e9)
+    model.set_chat_ids([str(chat_id) for chat_id in range(1, chats + 1)])
+    model.set_bot_token(BOT_TOKEN)
+    return model
+
+
+def run_send(model: TelegramModel) -> dict:
+    return model.send_message("벤치마크 메시지")
+
+
+def run_scheduled(model: TelegramModel) -> dict:
+    """이미 실행 시각이 된 스케줄 하나를 스케줄러로 실행하고 모든 채팅방 전송이 끝날 때까지 대기"""
+    done = threading.Event()
+    results = {}
+
+    def on_event(event_type, data):
+        if event_type == "message_sent":
+            results.update(data)
+            done.set()
+
+    model.set_callback(on_event)
+    record = model.add_scheduled_message("벤치마크 메시지", "00:00")
+    # 다음 실행 시각을 지금으로 다시 등록해 두고 스케줄러가 직접 실행하게 함
+    model._scheduler.cancel(model._jobs[record.id])
+    model._register_job(record, deadline=time.time())
+    model._scheduler.run_pending()
+    done.wait()
+    return results
+
+
+def bench_case(mode: str, chats: int, concurrency: int, error_rate: float, flood_rate: float,
+               args) -> dict:
+    """측정 한 번 (처리량/지연 시간, 그리고 tracemalloc으로 최대 메모리를 따로 측정)"""
+    server = FakeServerProcess(args.latency, error_rate, flood_rate)
+    run = run_send if mode == "send" else run_scheduled
+    result = {"mode": mode, "chats": chats, "concurrency": concurrency, "error_rate": error_rate,
+              "flood_rate": flood_rate, "server_latency_ms": args.latency * 1000}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "bench.db") if mode == "scheduled" else None
+            model = build_model(server.base_url, chats, concurrency, db_path, args.base_delay)
+            try:
+                # 커넥션 풀과 전송 워커를 미리 띄워 첫 측정에 섞이지 않게 함
+                model.send_message("warmup")
+                samples = []
+                instrument(model, samples)
+                started = time.perf_counter()
+                outcome = run(model)
+                duration = time.perf_counter() - started
+                latency = percentiles(samples)
+
+                if not args.no_memory:
+                    tracemalloc.start()
+                    run(model)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    result["peak_memory_bytes"] = peak
+            finally:
+                model.shutdown()
+    finally:
+        result["server"] = server.stop()
+
+    sent = outcome.get("sent_count", 0)
+    result.update({
+        "duration_s": duration,
+        "sent": sent,
+        "failed": outcome.get("total_count", 0) - sent,
+        "retries": outcome.get("retry_count", 0),
+        "sends_per_sec": sent / duration if duration else 0.0,
+        "latency_ms": latency,
+    })
+    return result
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    """기준 결과보다 처리량이 줄었거나 p99 지연 시간이 늘어난 측정 목록"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {tuple(case[key] for key in CASE_KEYS): case for case in json.load(f)["results"]}
+
+    regressions = []
+    for case in results:
+        before = baseline.get(tuple(case[key] for key in CASE_KEYS))
+        if before is None:
+            continue
+        if case["sends_per_sec"] < before["sends_per_sec"] * (1 - tolerance):
+            regressions.append({"case": {key: case[key] for key in CASE_KEYS}, "metric": "sends_per_sec",
+                                "baseline": before["sends_per_sec"], "current": case["sends_per_sec"]})
+        if case["latency_ms"]["p99"] > before["latency_ms"]["p99"] * (1 + tolerance):
+            regressions.append({"case": {key: case[key] for key in CASE_KEYS}, "metric": "latency_p99_ms",
+                                "baseline": before["latency_ms"]["p99"], "current": case["latency_ms"]["p99"]})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브로드캐스트 처리량 벤치마크")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--chats", type=int, nargs="+", default=[10, 1_000, 50_000])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16, 64])
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0.0, 0.01])
+    parser.add_argument("--flood-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--latency", type=float, default=0.005, help="가짜 서버 응답 지연 (초)")
+    parser.add_argument("--base-delay", type=float, default=0.05, help="재시도 백오프 기본 대기 (초)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본값: 표준 출력)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="허용하는 성능 저하 비율")
+    args = parser.parse_args()
+
+    results = []
+    for mode, chats, concurrency, error_rate in itertools.product(args.modes, args.chats, args.concurrency,
+                                                                   args.error_rates):
+        # 모델의 오류 로그가 표준 출력의 JSON에 섞이지 않도록 함
+        with contextlib.redirect_stdout(sys.stderr):
+            result = bench_case(mode, chats, concurrency, error_rate, args.flood_rate, args)
+        print(f"{mode:<9} chats={chats:<6} concurrency={concurrency:<4} errors={error_rate:<5} "
+              f"{result['sends_per_sec']:>9.0f} sends/s  p99={result['latency_ms']['p99']:.1f}ms",
+              file=sys.stderr)
+        results.append(result)
+
+    report = {
+        "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "platform": platform.platform(), "args": vars(args)},
+        "results": results,
+    }
+    if args.baseline:
+        report["regressions"] = compare(results, args.baseline, args.tolerance)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+스케줄 레코드 메모리 벤치마크
+이전 방식(dict 레코드 + 작업마다 클로저 + 작업마다 Trigger)과 현재 방식
+(__slots__ ScheduledMessage + 공유 디스패처 + 공유 Trigger)의 스케줄당 메모리를 tracemalloc으로 비교한다.
+
+    python benchmarks/bench_memory.py --count 100000
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.scheduler import INTERVALS, Trigger
+from models.telegram_model import TelegramModel
+
+
+def make_inputs(count: int, seed: int = 42) -> list:
+    """(메시지, "HH:MM", 반복 주기) 입력 생성"""
+    rng = random.Random(seed)
+    return [(f"메시지 {i}", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}", rng.choice(INTERVALS))
+            for i in range(count)]
+
+
+def measure(build) -> int:
+    """build()가 할당한 뒤 남아 있는 메모리(바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    keep = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return memory
+
+
+def build_legacy(model: TelegramModel, inputs: list):
+    """이전 방식 - dict 레코드, 작업마다 클로저와 Trigger 생성"""
+    def make_job(message, schedule_id):
+        def job(_):
+            model._send_scheduled_message(message, schedule_id)
+        return job
+
+    records = []
+    for schedule_id, (message, time_str, interval) in enumerate(inputs):
+        hour, minute = time_str.split(":")
+        model._scheduler.add(Trigger(interval, int(hour), int(minute)), make_job(message, schedule_id))
+        records.append({
+            'id': schedule_id,
+            'message': message,
+            'time': time_str,
+            'interval': interval,
+            'enabled': True
+        })
+    return records
+
+
+def build_current(model: TelegramModel, inputs: list):
+    """현재 방식 - TelegramModel.add_scheduled_message"""
+    for message, time_str, interval in inputs:
+        model.add_scheduled_message(message, time_str, interval)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스케줄 레코드 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # 메시지 문자열은 두 방식이 같으므로 측정 전에 만들어 둠
+    inputs = make_inputs(args.count)
+    legacy = measure(lambda: build_legacy(TelegramModel(), inputs))
+    current = measure(lambda: build_current(TelegramModel(), inputs))
+
+    print(f"스케줄 {args.count}개")
+    print(f"  이전 방식: {legacy / args.count:8.1f} B/스케줄 ({legacy / 2**20:7.1f} MiB)")
+    print(f"  현재 방식: {current / args.count:8.1f} B/스케줄 ({current / 2**20:7.1f} MiB)")
+    print(f"  절감: {(1 - current / legacy) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+스케줄러 엔진 벤치마크
+힙 엔진(HeapScheduler)과 타이밍 휠 엔진(TimingWheelScheduler)의 등록/취소 시간, 메모리,
+하루치 실행 시간을 작업 수별로 비교한다.
+
+    python benchmarks/bench_scheduler.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.scheduler import HeapScheduler, Trigger
+from models.timing_wheel import TimingWheelScheduler
+
+ENGINES = {
+    "heap": HeapScheduler,
+    "wheel": TimingWheelScheduler,
+}
+
+START_TIME = 1_760_000_000.0
+
+
+def make_triggers(count: int, seed: int = 42) -> list:
+    """일간/주간 트리거를 무작위 시각으로 생성 (같은 트리거 객체는 공유)"""
+    rng = random.Random(seed)
+    triggers = []
+    for _ in range(count):
+        key = (rng.choice(("daily", "weekly")), rng.randrange(24), rng.randrange(60))
+        triggers.append(Trigger.of(*key))
+    return triggers
+
+
+def measure_memory(name: str, triggers: list) -> int:
+    """작업 등록에 쓰인 메모리(바이트)"""
+    engine = ENGINES[name](lambda: START_TIME)
+    gc.collect()
+    tracemalloc.start()
+    for trigger in triggers:
+        engine.add(trigger, int)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory
+
+
+def bench_engine(name: str, triggers: list) -> dict:
+    """엔진 하나에 대해 등록 / 취소 / 메모리 / 하루치 실행 측정"""
+    clock = [START_TIME]
+    engine = ENGINES[name](lambda: clock[0])
+    fired = [0]
+
+    def callback(key):
+        fired[0] += 1
+
+    gc.collect()
+    started = time.perf_counter()
+    handles = [engine.add(trigger, callback, index) for index, trigger in enumerate(triggers)]
+    add_seconds = time.perf_counter() - started
+
+    # 10%를 취소한 뒤 같은 수만큼 다시 등록 (실행 시 남은 작업 수는 그대로)
+    cancelled = random.Random(7).sample(range(len(handles)), len(handles) // 10)
+    started = time.perf_counter()
+    for index in cancelled:
+        engine.cancel(handles[index])
+    cancel_seconds = time.perf_counter() - started
+    for index in cancelled:
+        handles[index] = engine.add(triggers[index], callback, index)
+    del handles
+
+    # 분 단위로 시계를 하루만큼 진행하며 실행
+    started = time.perf_counter()
+    for _ in range(24 * 60):
+        clock[0] += 60
+        engine.run_pending()
+    run_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(1000):
+        engine.next_deadline()
+    wakeup_us = (time.perf_counter() - started) / 1000 * 1e6
+
+    return {
+        "engine": name,
+        "jobs": len(triggers),
+        "add_us_per_job": add_seconds / len(triggers) * 1e6,
+        "cancel_us_per_job": cancel_seconds / max(1, len(cancelled)) * 1e6,
+        "memory_bytes_per_job": measure_memory(name, triggers) / len(triggers),
+        "fired": fired[0],
+        "run_day_seconds": run_seconds,
+        "next_deadline_us": wakeup_us,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스케줄러 엔진 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    args = parser.parse_args()
+
+    print(f"{'engine':<6} {'jobs':>9} {'add(us)':>9} {'cancel(us)':>10} {'mem(B)':>8} {'fired':>9} "
+          f"{'day(s)':>8} {'wakeup(us)':>11}")
+    for size in args.sizes:
+        triggers = make_triggers(size)
+        for name in args.engines:
+            result = bench_engine(name, triggers)
+            print(f"{result['engine']:<6} {result['jobs']:>9} {result['add_us_per_job']:>9.2f} "
+                  f"{result['cancel_us_per_job']:>10.2f} "
+                  f"{result['memory_bytes_per_job']:>8.0f} {result['fired']:>9} "
+                  f"{result['run_day_seconds']:>8.2f} {result['next_deadline_us']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+로컬 가짜 텔레그램 Bot API 서버 (asyncio, 표준 라이브러리만 사용)
+실제 API를 호출하지 않고 TelegramModel의 처리량과 실패 처리를 측정하기 위한 대역이다.
+응답 지연, 오류 비율, 429(RetryAfter) 주입을 설정할 수 있다.
+
+    python benchmarks/fake_bot_api.py --port 8081 --latency 0.05 --error-rate 0.01 --flood-rate 0.01
+
+모델은 TelegramModel(base_url="http://127.0.0.1:8081/bot")으로 이 서버를 가리킨다.
+지원 메서드: getMe, getChat, getChatMember, sendMessage, sendPhoto, sendDocument, sendVideo, copyMessage,
+forwardMessage, deleteMessage
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import parse_qsl
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.event_loop import EventLoopThread
+
+# multipart 본문에서 필드를 찾을 때 보관하는 앞부분 크기 (파일 내용은 세기만 하고 버림)
+HEAD_LIMIT = 64 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+BOT_USER = {"id": 1000, "is_bot": True, "first_name": "Fake Bot", "username": "fake_bot"}
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 429: "Too Many Requests",
+               500: "Internal Server Error", 502: "Bad Gateway"}
+
+
+class ApiError(Exception):
+    """Bot API 오류 응답 (error_code / description / parameters)"""
+
+    def __init__(self, code: int, description: str, parameters: Optional[dict] = None):
+        super().__init__(description)
+        self.code = code
+        self.description = description
+        self.parameters = parameters
+
+
+class FakeBotAPI:
+    """가짜 Bot API HTTP 서버
+
+    latency: 요청마다 응답 전 대기 시간(초), jitter: 대기 시간에 더하는 최대 무작위 값
+    error_rate: error_code(기본 502, 일시적 오류)로 실패시키는 비율
+    flood_rate: 429와 retry_after를 돌려주는 비율
+    token: 지정하면 다른 토큰의 요청은 401로 거부 (잘못된 토큰 처리 확인용)
+    보낸 메시지는 (채팅방, 메시지 ID)만 기억해 copyMessage / forwardMessage / deleteMessage 원본을 확인한다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_code: int = 502, flood_rate: float = 0.0,
+                 retry_after: int = 1, seed: Optional[int] = None, token: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.flood_rate = flood_rate
+        self.retry_after = retry_after
+        self.token = token
+        self._rng = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop_thread: Optional[EventLoopThread] = None
+        # 연결 처리 작업 -> 연결 (종료 시 keep-alive 연결을 닫기 위해 보관)
+        self._handlers: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._message_ids: Dict[str, itertools.count] = {}
+        self._messages: Set[Tuple[str, int]] = set()
+        self._file_ids = itertools.count(1)
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.upload_bytes = 0
+
+    @property
+    def base_url(self) -> str:
+        """Bot(base_url=...)에 넘길 주소 (토큰이 뒤에 붙음)"""
+        return f"http://{self.host}:{self.port}/bot"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # keep-alive 연결은 서버를 닫아도 남아 있으므로 직접 닫고 처리 작업이 끝나기를 기다림
+            for writer in list(self._handlers.values()):
+                writer.close()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def serve_in_thread(self) -> "FakeBotAPI":
+        """전용 이벤트 루프 스레드에서 서버 시작 (동기 코드에서 사용)"""
+        self._loop_thread = EventLoopThread("fake-bot-api")
+        self._loop_thread.run(self.start())
+        return self
+
+    def close(self):
+        if self._loop_thread is not None:
+            self._loop_thread.run(self.stop())
+            self._loop_thread.stop()
+            self._loop_thread = None
+
+    def __enter__(self) -> "FakeBotAPI":
+        return self.serve_in_thread()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> dict:
+        return {"requests": dict(self.requests), "errors": dict(self.errors),
+                "messages": len(self._messages), "upload_bytes": self.upload_bytes}
+
+    def reset_stats(self):
+        self.requests.clear()
+        self.errors.clear()
+        self.upload_bytes = 0
+
+    # HTTP
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """keep-alive 연결에서 요청을 차례로 처리"""
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                _, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                head, size = await self._read_body(reader, headers)
+                status, payload = await self._dispatch(target, headers.get("content-type", ""), head, size)
+                body = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Error')}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                             .encode() + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._handlers.pop(task, None)
+            writer.close()
+
+    @staticmethod
+    async def _read_body(reader: asyncio.StreamReader, headers: dict) -> Tuple[bytes, int]:
+        """본문의 앞부분(HEAD_LIMIT까지)과 전체 크기 반환 - 업로드 파일을 메모리에 쌓지 않음"""
+        head = bytearray()
+        size = 0
+
+        def keep(chunk: bytes):
+            nonlocal size
+            if len(head) < HEAD_LIMIT:
+                head.extend(chunk[:HEAD_LIMIT - len(head)])
+            size += len(chunk)
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                length = int((await reader.readline()).split(b";")[0], 16)
+                if not length:
+                    await reader.readline()
+                    break
+                while length:
+                    chunk = await reader.read(min(length, READ_CHUNK_SIZE))
+                    if not chunk:
+                        raise asyncio.IncompleteReadError(b"", length)
+                    keep(chunk)
+                    length -= len(chunk)
+                await reader.readline()
+        else:
+            remaining = int(headers.get("content-length", 0))
+            while remaining:
+                chunk = await reader.read(min(remaining, READ_CHUNK_SIZE))
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                keep(chunk)
+                remaining -= len(chunk)
+        return bytes(head), size
+
+    @staticmethod
+    def _parse_form(content_type: str, head: bytes) -> Tuple[dict, Set[str]]:
+        """(필드, 파일로 올라온 필드 이름) 반환"""
+        if not content_type.startswith("multipart/form-data"):
+            return dict(parse_qsl(head.decode())), set()
+
+        boundary = content_type.split("boundary=", 1)[1].strip('"').encode()
+        fields, files = {}, set()
+        for part in head.split(b"--" + boundary)[1:]:
+            part_headers, sep, value = part.partition(b"\r\n\r\n")
+            if not sep:
+                continue
+            disposition = part_headers.decode("latin-1")
+            name = disposition.split('name="', 1)[1].split('"', 1)[0] if 'name="' in disposition else ""
+            if "filename=" in disposition:
+                files.add(name)
+            elif value.endswith(b"\r\n"):
+                fields[name] = value[:-2].decode()
+        return fields, files
+
+    # Bot API
+
+    async def _dispatch(self, target: str, content_type: str, head: bytes, size: int) -> Tuple[int, dict]:
+        method = target.rsplit("/", 1)[-1].split("?", 1)[0]
+        self.requests[method] += 1
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            if self.token is not None and target.rsplit("/", 2)[-2] != f"bot{self.token}":
+                raise ApiError(401, "Unauthorized")
+            if method != "getMe":
+                roll = self._rng.random()
+                if roll < self.flood_rate:
+                    raise ApiError(429, f"Too Many Requests: retry after {self.retry_after}",
+                                   {"retry_after": self.retry_after})
+                if roll < self.flood_rate + self.error_rate:
+                    raise ApiError(self.error_code, "Bad Gateway" if self.error_code == 502 else "Internal Error")
+
+            handler = getattr(self, f"_api_{method}", None)
+            if handler is None:
+                raise ApiError(404, "Not Found")
+            fields, files = self._parse_form(content_type, head)
+            if files:
+                self.upload_bytes += size
+            return 200, {"ok": True, "result": handler(fields, files)}
+        except ApiError as e:
+            self.errors[e.code] += 1
+            payload = {"ok": False, "error_code": e.code, "description": e.description}
+            if e.parameters:
+                payload["parameters"] = e.parameters
+            return e.code, payload
+
+    def _new_message(self, chat_id: str, **content) -> dict:
+        if not chat_id:
+            raise ApiError(400, "Bad Request: chat_id is empty")
+        counter = self._message_ids.get(chat_id)
+        if counter is None:
+            counter = self._message_ids[chat_id] = itertools.count(1)
+        message_id = next(counter)
+        self._messages.add((chat_id, message_id))
+        return {"message_id": message_id, "date": int(time.time()), "chat": self._chat(chat_id), **content}
+
+    @staticmethod
+    def _chat(chat_id: str) -> dict:
+        """음수 ID는 슈퍼그룹, 양수 ID는 개인 채팅방으로 취급"""
+        if not chat_id.lstrip("-").isdigit():
+            raise ApiError(400, "Bad Request: chat not found")
+        if chat_id.startswith("-"):
+            return {"id": int(chat_id), "type": "supergroup", "title": f"Group {chat_id}"}
+        return {"id": int(chat_id), "type": "private", "first_name": f"User {chat_id}"}
+
+    def _file(self, fields: dict, files: Set[str], name: str) -> dict:
+        """업로드한 파일이면 새 file_id, 이 서버가 발급한 file_id로 보냈으면 그대로 반환"""
+        if name in files:
+            file_id = f"fake-{name}-{next(self._file_ids)}"
+        elif fields.get(name):
+            file_id = fields[name]
+            if not file_id.startswith(f"fake-{name}-"):
+                raise ApiError(400, "Bad Request: wrong file identifier/http url specified")
+        else:
+            raise ApiError(400, f"Bad Request: there is no {name} in the request")
+        return {"file_id": file_id, "file_unique_id": file_id}
+
+    def _source(self, fields: dict) -> Tuple[str, int]:
+        source = (fields.get("from_chat_id", ""), int(fields.get("message_id", 0)))
+        if source not in self._messages:
+            raise ApiError(400, "Bad Request: message to copy not found")
+        return source
+
+    def _api_getMe(self, fields: dict, files: Set[str]) -> dict:
+        return dict(BOT_USER, can_join_groups=True, can_read_all_group_messages=False,
+                    supports_inline_queries=False)
+
+    def _api_getChat(self, fields: dict, files: Set[str]) -> dict:
+        return self._chat(fields.get("chat_id", ""))
+
+    def _api_getChatMember(self, fields: dict, files: Set[str]) -> dict:
+        self._chat(fields.get("chat_id", ""))
+        user_id = int(fields.get("user_id", 0))
+        user = BOT_USER if user_id == BOT_USER["id"] else {"id": user_id, "is_bot": False, "first_name": "User"}
+        return {"status": "member", "user": user}
+
+    def _api_sendMessage(self, fields: dict, files: Set[str]) -> dict:
+        if not fields.get("text"):
+            raise ApiError(400, "Bad Request: message text is empty")
+        return self._new_message(fields.get("chat_id", ""), text=fields["text"])
+
+    def _api_sendPhoto(self, fields: dict, files: Set[str]) -> dict:
+        photo = dict(self._file(fields, files, "photo"), width=1280, height=720)
+        return self._new_message(fields.get("chat_id", ""), photo=[photo], caption=fields.get("caption"))
+
+    def _api_sendDocument(self, fields: dict, files: Set[str]) -> dict:
+        return self._new_message(fields.get("chat_id", ""), document=self._file(fields, files, "document"),
+                                 caption=fields.get("caption"))
+
+    def _api_sendVideo(self, fields: dict, files: Set[str]) -> dict:
+        video = dict(self._file(fields, files, "video"), width=1280, height=720, duration=1)
+        return self._new_message(fields.get("chat_id", ""), video=video, caption=fields.get("caption"))
+
+    def _api_copyMessage(self, fields: dict, files: Set[str]) -> dict:
+        self._source(fields)
+        return {"message_id": self._new_message(fields.get("chat_id", ""))["message_id"]}
+
+    def _api_forwardMessage(self, fields: dict, files: Set[str]) -> dict:
+        self._source(fields)
+        return self._new_message(fields.get("chat_id", ""), forward_date=int(time.time()))
+
+    def _api_deleteMessage(self, fields: dict, files: Set[str]) -> bool:
+        key = (fields.get("chat_id", ""), int(fields.get("message_id", 0)))
+        if key not in self._messages:
+            raise ApiError(400, "Bad Request: message to delete not found")
+        self._messages.discard(key)
+        return True
+
+
+async def serve(args):
+    server = FakeBotAPI(args.host, args.port, args.latency, args.jitter, args.error_rate, args.error_code,
+                        args.flood_rate, args.retry_after, args.seed)
+    await server.start()
+    print(f"가짜 Bot API 실행 중: {server.base_url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        print(json.dumps(server.stats(), ensure_ascii=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 텔레그램 Bot API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연에 더하는 최대 무작위 값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-code", type=int, default=502, help="오류 응답 HTTP 코드")
+    parser.add_argument("--flood-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 retry_after (초)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_info (
+    bot_id TEXT NOT NULL,
+    chat_id TEXT NOT NULL,
+    title TEXT,
+    chat_type TEXT,
+    member_status TEXT,
+    can_send INTEGER NOT NULL,
+    error TEXT NOT NULL DEFAULT '',
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (bot_id, chat_id)
+) WITHOUT ROWID;
+"""
+
+# 권한을 따로 확인하지 않아도 전송할 수 있는 멤버 상태
+SENDING_STATUSES = ("creator", "administrator", "member")
+
+
+@dataclass(slots=True)
+class BotIdentity:
+    """getMe 결과 (토큰 확인용이라 캐시하지 않고 연결할 때마다 다시 받음)"""
+    bot_id: str
+    user_id: int
+    username: Optional[str]
+    first_name: Optional[str]
+    checked_at: float
+
+
+@dataclass(slots=True)
+class ChatInfo:
+    """채팅방 확인 결과 (getChat + 봇의 getChatMember)"""
+    chat_id: str
+    title: Optional[str]
+    chat_type: Optional[str]
+    member_status: Optional[str]
+    can_send: bool
+    error: str = ""
+    checked_at: float = 0.0
+
+
+def can_send_to(chat, member) -> bool:
+    """봇이 채팅방에 메시지를 보낼 수 있는지 (채널은 관리자 게시 권한, 그룹은 멤버/채팅방 권한)"""
+    if member is None:
+        # 개인 채팅방은 getChat이 성공하면 전송 가능
+        return True
+    status = member.status
+    if chat.type == "channel":
+        return status == "creator" or (status == "administrator" and bool(member.can_post_messages))
+    if status == "restricted":
+        return bool(member.can_send_messages)
+    if status not in SENDING_STATUSES:
+        return False
+    if status == "member" and chat.permissions is not None:
+        return chat.permissions.can_send_messages is not False
+    return True
+
+
+class BotInfoCache:
+    """채팅방 확인 결과 캐시 (SQLite에 영구 저장, 봇 ID별)
+
+    재시작 후 다시 연결할 때 max_age 안에 확인한 채팅방은 getChat/getChatMember 없이 재사용한다.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def get_chats(self, bot_id: str, max_age: float) -> Dict[str, ChatInfo]:
+        """max_age 안에 확인한 채팅방 결과 (실패한 결과는 다시 확인하도록 제외)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT chat_id, title, chat_type, member_status, can_send, error, checked_at FROM chat_info "
+                "WHERE bot_id = ? AND checked_at >= ? AND error = ''", (bot_id, time.time() - max_age)).fetchall()
+        return {row[0]: ChatInfo(row[0], row[1], row[2], row[3], bool(row[4]), row[5], row[6]) for row in rows}
+
+    def put_chats(self, bot_id: str, chats: Iterable[ChatInfo]):
+        """채팅방 결과를 한 트랜잭션으로 기록"""
+        rows = [(bot_id, chat.chat_id, chat.title, chat.chat_type, chat.member_status, int(chat.can_send),
+                 chat.error, chat.checked_at) for chat in chats]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO chat_info "
+                    "(bot_id, chat_id, title, chat_type, member_status, can_send, error, checked_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,228 @@
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    key BLOB PRIMARY KEY,
+    delivered_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_deliveries_delivered_at ON deliveries (delivered_at);
+CREATE TABLE IF NOT EXISTS delivery_filters (
+    start REAL PRIMARY KEY,
+    size INTEGER NOT NULL,
+    hashes INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    bits BLOB NOT NULL,
+    saved_at REAL NOT NULL
+);
+"""
+
+# 한 세대(bloom filter 하나)가 담당하는 기간(초)과 유지하는 세대 수
+# 중복 방지는 최소 GENERATION_SPAN * (GENERATIONS - 1)초 전 전송까지 보장된다
+GENERATION_SPAN = 7 * 86400
+GENERATIONS = 2
+
+
+def idempotency_key(schedule_id: int, fire_time: float, chat_id: str) -> bytes:
+    """(스케줄 ID, 예정 실행 시각, 채팅방 ID)로 정해지는 16바이트 전송 키"""
+    return hashlib.blake2b(f"{schedule_id}:{round(fire_time)}:{chat_id}".encode(),
+                           digest_size=16).digest()
+
+
+class BloomFilter:
+    """고정 크기 bloom filter (키는 이미 균일한 해시값이라고 가정)"""
+
+    __slots__ = ("size", "hashes", "count", "_bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: bytes):
+        # 두 64비트 값으로 k개 위치를 만드는 double hashing
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: bytes):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def restore(self, size: int, hashes: int, count: int, bits: bytes) -> bool:
+        """저장해 둔 비트로 복원 (크기/해시 수가 다르면 복원하지 않고 False)"""
+        if size != self.size or hashes != self.hashes or len(bits) != len(self._bits):
+            return False
+        self._bits = bytearray(bits)
+        self.count = count
+        return True
+
+
+class DeliveryLog:
+    """전송 완료된 idempotency 키 집합 - 메모리 bloom filter + SQLite 정확 저장
+
+    조회는 먼저 세대별 bloom filter를 확인하고, 있을 수도 있다고 나올 때만 SQLite(키 기본 키)를
+    확인한다. 대부분의 조회(아직 보내지 않은 키)는 디스크를 읽지 않는다. 세대는 GENERATION_SPAN초마다
+    교체되고, 가장 오래된 세대가 빠질 때 그 기간의 기록도 저장소에서 삭제하므로 filter와 저장소가
+    같은 범위를 유지한다.
+    filter 비트는 close()할 때 저장하고 시작할 때 불러오므로, 시작 시에는 마지막 저장 이후 기록만
+    다시 읽는다 (비정상 종료였다면 그 이전 저장 이후 기록).
+    _lock은 메모리(filter, 대기 키)만 보호하고 SQLite는 _db_lock으로 따로 직렬화하므로, 이벤트 루프의
+    might_contain() / add()는 flush()의 트랜잭션이나 오래된 기록 삭제를 기다리지 않는다.
+    """
+
+    def __init__(self, path: str, capacity: int = 1_000_000, error_rate: float = 0.001,
+                 generation_span: float = GENERATION_SPAN, generations: int = GENERATIONS):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.generation_span = generation_span
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        # 아직 저장소에 쓰지 않은 키와 flush()가 쓰는 중인 키
+        self._pending: dict = {}
+        self._flushing: dict = {}
+        # 세대 교체로 버려진 기간 (다음 flush()에서 이 시각 이전 기록을 삭제)
+        self._expire_before: Optional[float] = None
+
+        # 세대 시작 시각 (오래된 것부터) 과 filter
+        now = time.time()
+        current = now - now % generation_span
+        self._starts: List[float] = [current - i * generation_span for i in range(generations - 1, -1, -1)]
+        self._filters: List[BloomFilter] = [BloomFilter(capacity, error_rate) for _ in self._starts]
+        self._conn.execute("DELETE FROM deliveries WHERE delivered_at < ?", (self._starts[0],))
+        since = self._restore_filters()
+        for key, delivered_at in self._conn.execute(
+                "SELECT key, delivered_at FROM deliveries WHERE delivered_at >= ?", (since,)):
+            self._filter_for(delivered_at).add(key)
+
+    def _restore_filters(self) -> float:
+        """저장된 filter 비트를 불러오고, 그 뒤에 기록된 것만 다시 읽도록 시작 시각 반환
+
+        저장은 모든 세대를 한 번에 하므로, 저장된 행이 없는 세대는 저장 이후에 시작된 세대다.
+        설정(용량/오류율)이 바뀌어 복원할 수 없으면 전체 기록을 다시 읽는다.
+        """
+        rows = self._conn.execute(
+            "SELECT start, size, hashes, count, bits, saved_at FROM delivery_filters").fetchall()
+        if not rows:
+            return float("-inf")
+        saved = {start: row for start, *row in rows}
+        saved_at = min(row[-1] for row in saved.values())
+        for start, bloom in zip(self._starts, self._filters):
+            row = saved.get(start)
+            if row is not None and not bloom.restore(*row[:4]):
+                self._filters = [BloomFilter(self.capacity, self.error_rate) for _ in self._starts]
+                return float("-inf")
+        return saved_at
+
+    def _save_filters(self):
+        """현재 세대들의 filter 비트 저장 (flush()된 뒤 호출)"""
+        now = time.time()
+        with self._lock:
+            rows = [(start, bloom.size, bloom.hashes, bloom.count, bytes(bloom._bits), now)
+                    for start, bloom in zip(self._starts, self._filters)]
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM delivery_filters")
+                self._conn.executemany(
+                    "INSERT INTO delivery_filters (start, size, hashes, count, bits, saved_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _filter_for(self, delivered_at: float) -> BloomFilter:
+        for start, bloom in zip(reversed(self._starts), reversed(self._filters)):
+            if delivered_at >= start:
+                return bloom
+        return self._filters[0]
+
+    def _rotate(self, now: float):
+        """현재 세대 기간이 지났으면 새 세대를 만들고 가장 오래된 세대를 버림 (기록 삭제는 flush()에서)"""
+        while now >= self._starts[-1] + self.generation_span:
+            self._starts.append(self._starts[-1] + self.generation_span)
+            self._filters.append(BloomFilter(self.capacity, self.error_rate))
+            del self._starts[0], self._filters[0]
+            self._expire_before = self._starts[0]
+
+    def might_contain(self, key: bytes) -> bool:
+        """bloom filter만 확인 (False면 확실히 없음, 디스크를 읽지 않으므로 이벤트 루프에서 호출 가능)"""
+        with self._lock:
+            return key in self._pending or key in self._flushing or any(key in bloom for bloom in self._filters)
+
+    def __contains__(self, key: bytes) -> bool:
+        """정확한 확인 (있을 수도 있으면 SQLite 조회)"""
+        with self._lock:
+            if not any(key in bloom for bloom in self._filters):
+                return False
+            if key in self._pending or key in self._flushing:
+                return True
+        with self._db_lock:
+            return self._conn.execute("SELECT 1 FROM deliveries WHERE key = ?", (key,)).fetchone() is not None
+
+    def add(self, key: bytes, delivered_at: Optional[float] = None):
+        """전송 완료 기록 (flush()할 때 저장소에 반영)"""
+        delivered_at = time.time() if delivered_at is None else delivered_at
+        with self._lock:
+            self._rotate(delivered_at)
+            self._filters[-1].add(key)
+            self._pending[key] = delivered_at
+
+    def flush(self):
+        """모아 둔 키 저장과 버려진 세대의 기록 삭제를 한 트랜잭션으로 반영
+
+        대기 키는 짧게 락을 잡고 바꿔치기만 하고, SQL은 락 밖에서 실행한다.
+        """
+        with self._db_lock:
+            with self._lock:
+                if not self._pending and self._expire_before is None:
+                    return
+                pending, self._pending = self._pending, {}
+                expire_before, self._expire_before = self._expire_before, None
+                self._flushing = pending
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany("INSERT OR IGNORE INTO deliveries (key, delivered_at) VALUES (?, ?)",
+                                           list(pending.items()))
+                    if expire_before is not None:
+                        self._conn.execute("DELETE FROM deliveries WHERE delivered_at < ?", (expire_before,))
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # 실패한 키와 삭제 범위는 다음 flush()에서 다시 시도
+                with self._lock:
+                    for key, delivered_at in pending.items():
+                        self._pending.setdefault(key, delivered_at)
+                    if self._expire_before is None:
+                        self._expire_before = expire_before
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(bloom.count for bloom in self._filters)
+
+    def close(self):
+        self.flush()
+        self._save_filters()
+        with self._db_lock:
+            self._conn.close()
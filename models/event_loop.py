@@ -0,0 +1,75 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+
+class EventLoopThread:
+    """전용 스레드에서 계속 실행되는 asyncio 이벤트 루프
+
+    동기 호출자(스케줄러 스레드, GUI 등)는 코루틴을 이 루프에 넘겨 실행한다.
+    루프가 살아있는 동안 Bot과 httpx 커넥션 풀이 유지되므로 keep-alive 연결을 재사용할 수 있다.
+    """
+
+    def __init__(self, name: str = "telegram-event-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 이벤트 루프 반환 (필요하면 시작)"""
+        self.start()
+        return self._loop
+
+    def is_running(self) -> bool:
+        """루프 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """현재 스레드가 루프 스레드인지 여부"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self):
+        """루프 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.is_running():
+                return
+
+            started = threading.Event()
+            loop = asyncio.new_event_loop()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run_loop, name=self._name, daemon=True)
+            self._thread.start()
+            started.wait()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """코루틴을 루프에 등록하고 concurrent.futures.Future 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """코루틴을 루프에서 실행하고 결과를 기다림 (동기 호출자용)"""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("이벤트 루프 스레드 안에서는 run()을 호출할 수 없습니다")
+        return self.submit(coro).result(timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """루프를 멈추고 스레드 종료를 기다림"""
+        with self._lock:
+            if not self.is_running():
+                return
+            loop, thread = self._loop, self._thread
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+            self._loop = None
+            self._thread = None
@@ -0,0 +1,149 @@
+import asyncio
+import contextlib
+import contextvars
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+
+# 레인 하나가 기다리는 동안 다른 레인이 실행될 수 있도록 기본 레인 수는 실행 슬롯보다 많이 둠
+LANES_PER_SLOT = 4
+
+
+class _LaneSlot:
+    """레인 태스크가 실행 슬롯을 잡고 있는지 여부 (idle()에서 잠시 내려놓을 때 사용)"""
+
+    __slots__ = ("executor", "task", "held")
+
+    def __init__(self, executor: "KeyedExecutor", task: asyncio.Task):
+        self.executor = executor
+        self.task = task
+        self.held = False
+
+
+_current_slot: contextvars.ContextVar[Optional[_LaneSlot]] = contextvars.ContextVar(
+    "keyed_executor_slot", default=None)
+
+
+class KeyedExecutor:
+    """키(채팅방 ID)별 FIFO 레인으로 작업을 실행하는 asyncio 실행기
+
+    같은 키의 작업은 넣은 순서대로 하나씩 실행되고, 다른 키의 작업은 max_active개까지 병렬로 실행된다.
+    레인은 작업이 들어올 때 만들어지고 비는 즉시 삭제되므로, 채팅방이 많아도 메모리는 대기 중인
+    작업 수에 비례한다. 이미 레인이 있는 키의 작업은 바로 들어가고, 레인이 max_lanes개면 새 키의
+    submit()만 레인이 빌 때까지 기다린다. 따라서 한 채팅방에 밀린 작업이 많아도 다른 채팅방을 막는
+    것은 레인 하나뿐이다. 재시도/flood-wait로 잠든 작업은 idle() 안에서 실행 슬롯을 내려놓는다.
+    이벤트 루프 스레드 안에서만 사용한다.
+    """
+
+    def __init__(self, max_active: int, max_lanes: Optional[int] = None):
+        self.max_active = max(1, max_active)
+        self.max_lanes = max(1, max_lanes or self.max_active * LANES_PER_SLOT)
+        self._slots = asyncio.Semaphore(self.max_active)
+        self._lanes: Dict[Hashable, Deque[Tuple[Callable[[], Awaitable], asyncio.Future]]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._pending = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def __len__(self) -> int:
+        """대기 중이거나 실행 중인 작업 수"""
+        return self._pending
+
+    @property
+    def lane_count(self) -> int:
+        return len(self._lanes)
+
+    async def submit(self, key: Hashable, fn: Callable[[], Awaitable]) -> asyncio.Future:
+        """key 레인 끝에 fn()을 추가하고 결과 future 반환 (레인에 들어가면 바로 반환)"""
+        loop = asyncio.get_running_loop()
+        while key not in self._lanes and len(self._lanes) >= self.max_lanes:
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+                raise
+
+        future = loop.create_future()
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            task = loop.create_task(self._run_lane(key, lane))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        lane.append((fn, future))
+        self._pending += 1
+        return future
+
+    async def _run_lane(self, key: Hashable, lane: Deque):
+        slot = _LaneSlot(self, asyncio.current_task())
+        _current_slot.set(slot)
+        try:
+            while lane:
+                fn, future = lane[0]
+                if not future.done():
+                    await self._slots.acquire()
+                    slot.held = True
+                    try:
+                        result = await fn()
+                    except asyncio.CancelledError:
+                        future.cancel()
+                        raise
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+                    finally:
+                        if slot.held:
+                            slot.held = False
+                            self._slots.release()
+                lane.popleft()
+                self._pending -= 1
+        finally:
+            # 빈 레인은 바로 삭제 (취소된 경우 남은 작업도 취소)
+            for _, future in lane:
+                future.cancel()
+            self._pending -= len(lane)
+            lane.clear()
+            if self._lanes.get(key) is lane:
+                del self._lanes[key]
+            self._wake_submitter()
+
+    @contextlib.asynccontextmanager
+    async def idle(self) -> AsyncIterator[None]:
+        """레인 작업 안에서 오래 기다리는 동안(재시도 대기 등) 실행 슬롯을 다른 레인에 넘김
+
+        레인 밖(다른 태스크)에서 호출하면 아무것도 하지 않는다. 레인 순서는 그대로 유지된다.
+        """
+        slot = _current_slot.get()
+        if slot is None or slot.executor is not self or slot.task is not asyncio.current_task() or not slot.held:
+            yield
+            return
+        slot.held = False
+        self._slots.release()
+        try:
+            yield
+        finally:
+            await self._slots.acquire()
+            slot.held = True
+
+    def _wake_submitter(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {"lanes": len(self._lanes), "pending": self._pending,
+                "max_active": self.max_active, "max_lanes": self.max_lanes}
+
+    async def shutdown(self):
+        """실행 중인 레인을 모두 취소"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
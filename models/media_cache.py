@@ -0,0 +1,127 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# 지원하는 첨부 종류
+MEDIA_PHOTO = "photo"
+MEDIA_DOCUMENT = "document"
+MEDIA_VIDEO = "video"
+MEDIA_TYPES = (MEDIA_PHOTO, MEDIA_DOCUMENT, MEDIA_VIDEO)
+
+# 파일 해시를 계산할 때 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1 << 20
+
+# file_id 자체가 더 이상 쓸 수 없을 때 Bot API가 돌려주는 BadRequest 설명 (소문자 일부)
+FILE_ID_ERRORS = ("wrong file identifier", "wrong remote file identifier", "file reference expired",
+                  "file_reference_expired", "wrong padding in the string")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_files (
+    bot_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    media_type TEXT NOT NULL,
+    file_id TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    uploaded_at REAL NOT NULL,
+    PRIMARY KEY (bot_id, content_hash, media_type)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class Attachment:
+    """메시지에 첨부할 로컬 파일"""
+    media_type: str
+    path: str
+
+    def __post_init__(self):
+        if self.media_type not in MEDIA_TYPES:
+            raise ValueError(f"지원하지 않는 첨부 종류입니다: {self.media_type}")
+
+
+def file_id_of(message, media_type: str) -> Optional[str]:
+    """전송 결과 Message에서 재사용할 file_id 추출"""
+    if media_type == MEDIA_PHOTO:
+        # 사진은 여러 해상도로 저장되며 마지막이 원본 크기
+        return message.photo[-1].file_id if message.photo else None
+    media = getattr(message, media_type, None)
+    return media.file_id if media is not None else None
+
+
+def is_file_id_error(error: Exception) -> bool:
+    """캐시된 file_id를 버리고 다시 업로드해야 하는 오류인지 여부 (채팅방 오류 등은 해당 없음)"""
+    description = str(error).lower()
+    return any(marker in description for marker in FILE_ID_ERRORS)
+
+
+class MediaCache:
+    """내용 해시 -> 텔레그램 file_id 캐시 (SQLite에 영구 저장)
+
+    같은 파일은 처음 한 번만 업로드하고, 이후에는 어느 채팅방이든 file_id로 전송한다.
+    file_id는 봇마다 다르므로 봇 ID별로 따로 보관한다.
+    파일 해시는 (경로, 크기, 수정 시각)이 같으면 다시 계산하지 않는다.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._file_ids: Dict[Tuple[str, str, str], str] = {}
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+
+    def content_hash(self, path: str) -> str:
+        """파일 내용의 SHA-256 (파일이 바뀌지 않았으면 이전 값을 재사용)"""
+        stat = os.stat(path)
+        cached = self._hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        self._hashes[path] = (stat.st_size, stat.st_mtime_ns, content_hash)
+        return content_hash
+
+    def cached(self, bot_id: str, content_hash: str, media_type: str) -> Optional[str]:
+        """메모리에 있는 file_id만 확인 (디스크를 읽지 않으므로 이벤트 루프에서 호출 가능)"""
+        return self._file_ids.get((bot_id, content_hash, media_type))
+
+    def get(self, bot_id: str, content_hash: str, media_type: str) -> Optional[str]:
+        key = (bot_id, content_hash, media_type)
+        file_id = self._file_ids.get(key)
+        if file_id is None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT file_id FROM media_files WHERE bot_id = ? AND content_hash = ? AND media_type = ?",
+                    key).fetchone()
+            if row is not None:
+                file_id = self._file_ids[key] = row[0]
+        return file_id
+
+    def put(self, bot_id: str, content_hash: str, media_type: str, file_id: str, size: int = 0):
+        """file_id 저장 (메모리에 먼저 반영하므로 기록이 끝나기 전에도 cached()로 보임)"""
+        self._file_ids[(bot_id, content_hash, media_type)] = file_id
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO media_files "
+                "(bot_id, content_hash, media_type, file_id, size, uploaded_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (bot_id, content_hash, media_type, file_id, size, time.time()))
+
+    def discard(self, bot_id: str, content_hash: str, media_type: str):
+        """더 이상 유효하지 않은 file_id 삭제 (다음 전송 때 다시 업로드)"""
+        self._file_ids.pop((bot_id, content_hash, media_type), None)
+        with self._lock:
+            self._conn.execute("DELETE FROM media_files WHERE bot_id = ? AND content_hash = ? AND media_type = ?",
+                               (bot_id, content_hash, media_type))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,221 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from models.storage import migrate
+
+# 아웃박스 행 상태
+PENDING = 0
+CLAIMED = 1
+DONE = 2
+FAILED = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox_fires (
+    id INTEGER PRIMARY KEY,
+    schedule_id INTEGER NOT NULL,
+    fire_time REAL NOT NULL,
+    message TEXT NOT NULL,
+    media_type TEXT,
+    media_path TEXT,
+    source_chat_id TEXT,
+    source_message_id INTEGER,
+    created_at REAL NOT NULL,
+    completed_at REAL
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    fire_id INTEGER NOT NULL REFERENCES outbox_fires (id),
+    chat_id TEXT NOT NULL,
+    status INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_status ON outbox (status, id);
+CREATE INDEX IF NOT EXISTS idx_outbox_fire ON outbox (fire_id, status);
+CREATE INDEX IF NOT EXISTS idx_outbox_fires_completed ON outbox_fires (completed_at);
+"""
+
+# 이전 버전 DB에 없는 컬럼
+MIGRATIONS = (
+    ("outbox_fires", "media_type", "TEXT"),
+    ("outbox_fires", "media_path", "TEXT"),
+    ("outbox_fires", "source_chat_id", "TEXT"),
+    ("outbox_fires", "source_message_id", "INTEGER"),
+)
+
+
+@dataclass(slots=True)
+class OutboxItem:
+    """전송 대기 중인 (실행, 채팅방) 한 건"""
+    id: int
+    fire_id: int
+    chat_id: str
+    schedule_id: int
+    fire_time: float
+    message: str
+    media_type: Optional[str]
+    media_path: Optional[str]
+    attempts: int
+
+
+@dataclass
+class FireSummary:
+    """스케줄 실행 한 번의 전송 결과 (모든 행이 끝났을 때)"""
+    fire_id: int
+    schedule_id: int
+    fire_time: float
+    message: str
+    sent_count: int
+    total_count: int
+    errors: List[str]
+    retry_count: int
+
+
+class Outbox:
+    """스케줄 실행을 (스케줄, 채팅방) 단위 행으로 기록하는 SQLite 기반 트랜잭셔널 아웃박스
+
+    실행 시점에 모든 채팅방 행을 한 트랜잭션으로 기록하고, 전송 워커가 status 인덱스로
+    일정 개수씩 가져가(claim) 처리한다. 처리 중에 프로세스가 죽으면 다음 시작 시 가져간 행을
+    다시 대기 상태로 돌려 이어서 전송한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'outbox_fires'").fetchone():
+            migrate(self._conn, MIGRATIONS)
+        self._conn.executescript(SCHEMA)
+        self._fires: Dict[int, Tuple[int, float, str, Optional[str], Optional[str]]] = {}
+
+        # 지난 실행에서 가져갔지만 끝내지 못한 행은 다시 대기 상태로
+        with self._lock:
+            self._conn.execute("UPDATE outbox SET status = ? WHERE status = ?", (PENDING, CLAIMED))
+
+    @contextmanager
+    def _transaction(self):
+        """autocommit 연결에서 BEGIN/COMMIT 범위 (예외 시 ROLLBACK)"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def enqueue(self, schedule_id: int, fire_time: float, message: str, chat_ids: List[str],
+                media_type: Optional[str] = None, media_path: Optional[str] = None) -> int:
+        """실행 한 번을 채팅방별 행으로 기록하고 fire_id 반환"""
+        now = time.time()
+        with self._lock, self._transaction():
+            fire_id = self._conn.execute(
+                "INSERT INTO outbox_fires (schedule_id, fire_time, message, media_type, media_path, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (schedule_id, fire_time, message, media_type, media_path, now)).lastrowid
+            self._conn.executemany(
+                "INSERT INTO outbox (fire_id, chat_id, status, updated_at) VALUES (?, ?, ?, ?)",
+                [(fire_id, chat_id, PENDING, now) for chat_id in chat_ids])
+        return fire_id
+
+    def claim(self, limit: int) -> List[OutboxItem]:
+        """대기 중인 행을 최대 limit개 가져가 CLAIMED로 표시"""
+        with self._lock, self._transaction():
+            rows = self._conn.execute(
+                "UPDATE outbox SET status = ?, updated_at = ? WHERE id IN "
+                "(SELECT id FROM outbox WHERE status = ? ORDER BY id LIMIT ?) "
+                "RETURNING id, fire_id, chat_id, attempts",
+                (CLAIMED, time.time(), PENDING, limit)).fetchall()
+            if not rows:
+                return []
+            fires = self._load_fires({row[1] for row in rows})
+
+        rows.sort()
+        return [OutboxItem(row_id, fire_id, chat_id, *fires[fire_id], attempts)
+                for row_id, fire_id, chat_id, attempts in rows]
+
+    def _load_fires(self, fire_ids: set) -> Dict[int, Tuple[int, float, str, Optional[str], Optional[str]]]:
+        missing = [fire_id for fire_id in fire_ids if fire_id not in self._fires]
+        if missing:
+            placeholders = ",".join("?" * len(missing))
+            for fire_id, *fire in self._conn.execute(
+                    f"SELECT id, schedule_id, fire_time, message, media_type, media_path FROM outbox_fires "
+                    f"WHERE id IN ({placeholders})", missing):
+                self._fires[fire_id] = tuple(fire)
+        return {fire_id: self._fires[fire_id] for fire_id in fire_ids}
+
+    def get_source(self, fire_id: int) -> Optional[Tuple[str, int]]:
+        """복사 전송 원본 (스테이징 채팅방 ID, 메시지 ID) - 아직 없으면 None"""
+        with self._lock:
+            row = self._conn.execute("SELECT source_chat_id, source_message_id FROM outbox_fires WHERE id = ?",
+                                     (fire_id,)).fetchone()
+        return (row[0], row[1]) if row and row[1] is not None else None
+
+    def set_source(self, fire_id: int, chat_id: str, message_id: int):
+        """스테이징 채팅방에 보낸 원본 기록 (재시작 후에도 같은 원본을 복사)"""
+        with self._lock:
+            self._conn.execute("UPDATE outbox_fires SET source_chat_id = ?, source_message_id = ? WHERE id = ?",
+                               (chat_id, message_id, fire_id))
+
+    def complete(self, results: List[Tuple[int, bool, int, str]]) -> List[FireSummary]:
+        """(행 ID, 성공 여부, 시도 횟수, 오류) 목록을 반영하고, 이번에 모든 행이 끝난 실행의 결과 반환"""
+        now = time.time()
+        with self._lock, self._transaction():
+            self._conn.executemany(
+                "UPDATE outbox SET status = ?, attempts = attempts + ?, error = ?, updated_at = ? WHERE id = ?",
+                [(DONE if success else FAILED, attempts, error or None, now, row_id)
+                 for row_id, success, attempts, error in results])
+            fire_ids = {row[0] for row in self._conn.execute(
+                f"SELECT DISTINCT fire_id FROM outbox WHERE id IN ({','.join('?' * len(results))})",
+                [row_id for row_id, _, _, _ in results])}
+            return [summary for summary in (self._finish_fire(fire_id, now) for fire_id in fire_ids)
+                    if summary is not None]
+
+    def _finish_fire(self, fire_id: int, now: float) -> Optional[FireSummary]:
+        counts = dict(self._conn.execute(
+            "SELECT status, COUNT(*) FROM outbox WHERE fire_id = ? GROUP BY status", (fire_id,)).fetchall())
+        if counts.get(PENDING) or counts.get(CLAIMED):
+            return None
+        # 완료 표시는 한 번만 (동시에 끝난 워커가 중복 보고하지 않도록)
+        if self._conn.execute("UPDATE outbox_fires SET completed_at = ? WHERE id = ? AND completed_at IS NULL",
+                              (now, fire_id)).rowcount != 1:
+            return None
+
+        schedule_id, fire_time, message, _, _ = self._load_fires({fire_id})[fire_id]
+        self._fires.pop(fire_id, None)
+        errors = [f"채팅방 {chat_id}: {error}" for chat_id, error in self._conn.execute(
+            "SELECT chat_id, error FROM outbox WHERE fire_id = ? AND status = ?", (fire_id, FAILED))]
+        retry_count = self._conn.execute(
+            "SELECT COALESCE(SUM(MAX(attempts - 1, 0)), 0) FROM outbox WHERE fire_id = ?", (fire_id,)).fetchone()[0]
+        return FireSummary(fire_id, schedule_id, fire_time, message, counts.get(DONE, 0),
+                           sum(counts.values()), errors, retry_count)
+
+    def release(self, row_ids: List[int]):
+        """가져간 행을 처리하지 못했을 때 다시 대기 상태로 (봇 재연결 등)"""
+        with self._lock, self._transaction():
+            self._conn.executemany("UPDATE outbox SET status = ? WHERE id = ? AND status = ?",
+                                   [(PENDING, row_id, CLAIMED) for row_id in row_ids])
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE status IN (?, ?)",
+                                      (PENDING, CLAIMED)).fetchone()[0]
+
+    def purge(self, older_than: float):
+        """완료된 지 older_than초가 지난 실행 기록 삭제"""
+        cutoff = time.time() - older_than
+        with self._lock, self._transaction():
+            fire_ids = [(row[0],) for row in self._conn.execute(
+                "SELECT id FROM outbox_fires WHERE completed_at < ?", (cutoff,))]
+            self._conn.executemany("DELETE FROM outbox WHERE fire_id = ?", fire_ids)
+            self._conn.executemany("DELETE FROM outbox_fires WHERE id = ?", fire_ids)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """`per`초 동안 `count`개 전송 허용 (burst: 한 번에 몰아서 보낼 수 있는 개수)"""
+    count: float
+    per: float = 1.0
+    burst: float = 1.0
+
+    @property
+    def rate(self) -> float:
+        """초당 허용 전송 수"""
+        return self.count / self.per
+
+
+# 텔레그램 Bot API 권장 한도
+GLOBAL_LIMIT = RateLimit(30, 1.0)    # 봇 전체 초당 30개
+PRIVATE_LIMIT = RateLimit(1, 1.0)    # 개인 채팅방 초당 1개
+GROUP_LIMIT = RateLimit(20, 60.0)    # 그룹/채널 분당 20개
+
+
+class TokenBucket:
+    """예약 방식의 토큰 버킷
+
+    토큰이 부족하면 음수로 내려가며 다음 토큰이 생기는 시점까지의 대기 시간을 돌려준다.
+    예약이 순서대로 쌓이므로 대기 후 전송하면 한도를 넘지 않고 한도에 딱 맞춰 전송된다.
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_updated")
+
+    def __init__(self, limit: RateLimit, now: float):
+        self.rate = limit.rate
+        self.capacity = max(1.0, limit.burst)
+        self._tokens = self.capacity
+        self._updated = now
+
+    def _refill(self, now: float):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self, now: float) -> float:
+        """토큰 하나를 예약하고 사용 가능 시점까지의 대기 시간(초) 반환"""
+        self._refill(now)
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def defer(self, now: float, seconds: float):
+        """다음 토큰이 최소 seconds초 뒤에 생기도록 미룸 (flood-wait 반영)"""
+        self._refill(now)
+        self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+    def is_idle(self, now: float) -> bool:
+        """버킷이 가득 차 있어 상태를 버려도 되는지 여부"""
+        self._refill(now)
+        return self._tokens >= self.capacity
+
+
+class TelegramRateLimiter:
+    """봇 전체 / 개인 채팅방 / 그룹별 한도를 함께 지키는 전송 속도 제한기
+
+    이벤트 루프 안에서만 사용한다 (예약 계산 사이에 await가 없으므로 별도 락이 필요 없음).
+    """
+
+    PRUNE_EVERY = 1024
+
+    def __init__(self, global_limit: RateLimit = GLOBAL_LIMIT,
+                 private_limit: RateLimit = PRIVATE_LIMIT,
+                 group_limit: RateLimit = GROUP_LIMIT,
+                 clock: Callable[[], float] = time.monotonic):
+        self.global_limit = global_limit
+        self.private_limit = private_limit
+        self.group_limit = group_limit
+        self._clock = clock
+        self._global = TokenBucket(global_limit, clock())
+        self._chats: Dict[str, TokenBucket] = {}
+        self._acquired = 0
+
+    @staticmethod
+    def is_group_chat(chat_id: str) -> bool:
+        """그룹/채널 여부 (음수 ID 또는 @채널명)"""
+        chat_id = str(chat_id)
+        return chat_id.startswith("-") or chat_id.startswith("@")
+
+    def _chat_bucket(self, chat_id: str, now: float) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            limit = self.group_limit if self.is_group_chat(chat_id) else self.private_limit
+            bucket = self._chats[chat_id] = TokenBucket(limit, now)
+        return bucket
+
+    def _prune(self, now: float):
+        """가득 찬(한동안 쓰이지 않은) 채팅방 버킷 제거"""
+        idle = [chat_id for chat_id, bucket in self._chats.items() if bucket.is_idle(now)]
+        for chat_id in idle:
+            del self._chats[chat_id]
+
+    def defer(self, chat_id: str, seconds: float):
+        """서버가 RetryAfter를 돌려준 채팅방의 다음 전송을 seconds초 뒤로 미룸"""
+        now = self._clock()
+        self._chat_bucket(str(chat_id), now).defer(now, seconds)
+
+    async def acquire(self, chat_id: str):
+        """chat_id로 전송해도 되는 시점까지 대기"""
+        chat_id = str(chat_id)
+        self._acquired += 1
+        if self._acquired % self.PRUNE_EVERY == 0:
+            self._prune(self._clock())
+
+        # 채팅방 한도를 먼저 기다린 뒤 실제 전송 시점 기준으로 전역 토큰을 예약해야
+        # 지연된 전송들이 한 번에 몰려 전역 한도를 넘지 않는다.
+        delay = self._chat_bucket(chat_id, self._clock()).reserve(self._clock())
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        delay = self._global.reserve(self._clock())
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,74 @@
+import random
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+
+
+class FailureKind(Enum):
+    """전송 실패 분류"""
+    PERMANENT = "permanent"    # 재시도해도 소용없음 (권한 없음, 잘못된 채팅방 등)
+    TRANSIENT = "transient"    # 네트워크 오류, 타임아웃 등 일시적 오류
+    FLOOD_WAIT = "flood_wait"  # 429 - 서버가 알려준 시간만큼 기다린 뒤 재시도
+
+
+@dataclass(frozen=True)
+class SendFailure:
+    kind: FailureKind
+    retry_after: Optional[float] = None
+
+
+def classify_error(error: Exception) -> SendFailure:
+    """텔레그램 예외를 재시도 가능 여부에 따라 분류"""
+    if isinstance(error, RetryAfter):
+        retry_after = error.retry_after
+        if hasattr(retry_after, "total_seconds"):
+            retry_after = retry_after.total_seconds()
+        return SendFailure(FailureKind.FLOOD_WAIT, float(retry_after))
+    # BadRequest는 NetworkError의 하위 클래스이므로 먼저 걸러야 함
+    if isinstance(error, BadRequest):
+        return SendFailure(FailureKind.PERMANENT)
+    if isinstance(error, NetworkError):
+        return SendFailure(FailureKind.TRANSIENT)
+    return SendFailure(FailureKind.PERMANENT)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """지수 백오프 재시도 정책"""
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: float = 0.1
+
+    def should_retry(self, failure: SendFailure, attempt: int) -> bool:
+        """attempt번째 시도가 실패했을 때 다시 시도할지 여부"""
+        return failure.kind is not FailureKind.PERMANENT and attempt < self.max_attempts
+
+    def delay(self, failure: SendFailure, attempt: int) -> float:
+        """다음 재시도까지 대기 시간 (retry_after보다 짧아지지 않음)"""
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        backoff += random.uniform(0, backoff * self.jitter)
+        if failure.retry_after is not None:
+            return max(failure.retry_after, backoff)
+        return backoff
+
+
+@dataclass
+class DeliveryResult:
+    """채팅방 하나에 대한 최종 전송 결과"""
+    chat_id: str
+    success: bool
+    attempts: int = 1
+    failure: Optional[FailureKind] = None
+    error: str = ""
+    # 이미 전송된 idempotency 키라 실제 전송 없이 건너뜀
+    duplicate: bool = False
+    # 전송된 메시지 ID (스테이징 원본 등에 사용)
+    message_id: Optional[int] = None
+
+    @classmethod
+    def failed(cls, chat_id: str, attempts: int, error: TelegramError,
+               failure: SendFailure) -> "DeliveryResult":
+        return cls(chat_id, False, attempts, failure.kind, str(error))
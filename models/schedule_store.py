@@ -0,0 +1,250 @@
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from models.scheduler import DEFAULT_GRACE_TIME, MISFIRE_COALESCE
+
+
+@dataclass(slots=True, eq=False)
+class ScheduledMessage:
+    """스케줄된 메시지 레코드 (시각은 "HH:MM" 문자열 대신 정수로 보관)"""
+    id: int
+    message: str
+    hour: int
+    minute: int
+    interval: str
+    enabled: bool = True
+    misfire: str = MISFIRE_COALESCE
+    grace_time: int = DEFAULT_GRACE_TIME
+    # 첨부 파일 (photo / document / video 와 로컬 경로, 없으면 텍스트 메시지)
+    media_type: Optional[str] = None
+    media_path: Optional[str] = None
+
+    @property
+    def time(self) -> str:
+        """"HH:MM" 형식 시각"""
+        return f"{self.hour:02d}:{self.minute:02d}"
+
+
+class IdAllocator:
+    """단조 증가 스케줄 ID 발급기 (삭제된 ID는 재사용하지 않음)"""
+
+    def __init__(self, start: int = 0):
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+        self.last_id = start - 1
+
+    def next_id(self) -> int:
+        with self._lock:
+            self.last_id = next(self._counter)
+            return self.last_id
+
+    def advance_past(self, schedule_id: int):
+        """외부에서 불러온 ID 이후부터 발급하도록 카운터를 옮김"""
+        with self._lock:
+            if schedule_id > self.last_id:
+                self._counter = itertools.count(schedule_id + 1)
+                self.last_id = schedule_id
+
+
+class ScheduleStore:
+    """스케줄 저장소 - ID로 O(1) 조회, 반복 주기/다음 실행 시각 보조 인덱스 유지
+
+    스케줄러 스레드와 GUI 스레드에서 함께 쓰이므로 모든 접근은 락으로 보호한다.
+    storage(models.storage.Storage)가 있으면 모든 변경을 저장소에도 기록하고, 메모리에는
+    load_window()로 불러온 스케줄과 이번 실행 중 추가된 스케줄만 올려 둔다.
+    보조 인덱스(ids_by_interval, due_before, upcoming)는 메모리에 올라온 스케줄만 대상으로 한다.
+    """
+
+    def __init__(self, id_allocator: Optional[IdAllocator] = None, storage=None):
+        self._ids = id_allocator or IdAllocator()
+        self._storage = storage
+        self._lock = threading.RLock()
+        # ID 순서 = 삽입 순서 (ID가 단조 증가하므로)
+        self._records: Dict[int, ScheduledMessage] = {}
+        self._by_interval: Dict[str, Set[int]] = {}
+        # (다음 실행 시각, ID) 최소 힙과 ID -> 다음 실행 시각
+        # 힙 항목은 바로 지우지 않고, _next_fire와 시각이 다르면 지난 항목으로 보고 건너뜀
+        self._fire_heap: List[Tuple[float, int]] = []
+        self._next_fire: Dict[int, float] = {}
+
+        # 저장소에서 아직 불러오지 않은 스케줄의 시작 위치 (next_fire, id)
+        self._loaded_until: Tuple[float, int] = (float("-inf"), -1)
+        self._total = 0
+        if storage is not None:
+            self._total = storage.count_schedules()
+            max_id = storage.max_schedule_id()
+            if max_id is not None:
+                self._ids.advance_past(max_id)
+
+    def __len__(self) -> int:
+        if self._storage is not None:
+            return self._total
+        return len(self._records)
+
+    def __contains__(self, schedule_id: int) -> bool:
+        return self.get(schedule_id) is not None
+
+    def __iter__(self) -> Iterator[ScheduledMessage]:
+        """ID 순서대로 레코드 반환 (순회 중 변경에 안전하도록 스냅샷)"""
+        if self._storage is not None:
+            return self._iter_storage()
+        with self._lock:
+            return iter(list(self._records.values()))
+
+    def _iter_storage(self) -> Iterator[ScheduledMessage]:
+        for record, _ in self._storage.iter_schedules():
+            # 메모리에 올라온 레코드는 같은 객체를 돌려줌
+            yield self._records.get(record.id, record)
+
+    def page(self, offset: int, limit: int) -> List[ScheduledMessage]:
+        """ID 순서로 offset번째부터 limit개 반환 (전체를 읽지 않고 한 페이지만 조회)"""
+        offset, limit = max(0, offset), max(0, limit)
+        if self._storage is not None:
+            rows = self._storage.page_schedules(offset, limit)
+            return [self._records.get(record.id, record) for record, _ in rows]
+        with self._lock:
+            return list(itertools.islice(self._records.values(), offset, offset + limit))
+
+    def is_resident(self, schedule_id: int) -> bool:
+        """메모리에 올라와 있는지 여부"""
+        return schedule_id in self._records
+
+    def load_window(self, before: float, batch_size: int = 10_000) -> List[Tuple[ScheduledMessage, float]]:
+        """저장소에서 next_fire < before 인 스케줄을 불러와 메모리에 올리고 (레코드, next_fire) 반환
+
+        이미 불러온 구간은 다시 읽지 않는다 (next_fire 인덱스의 keyset 페이지네이션).
+        """
+        if self._storage is None:
+            return []
+        loaded = []
+        with self._lock:
+            while True:
+                rows = self._storage.load_due(self._loaded_until, before, batch_size)
+                for record, next_fire in rows:
+                    if record.id in self._records:
+                        continue
+                    self._index(record)
+                    self._set_next_fire(record.id, next_fire)
+                    loaded.append((record, next_fire))
+                if rows:
+                    last, next_fire = rows[-1]
+                    self._loaded_until = (next_fire, last.id)
+                if len(rows) < batch_size:
+                    break
+        return loaded
+
+    def new_id(self) -> int:
+        return self._ids.next_id()
+
+    def add(self, record: ScheduledMessage):
+        """레코드 추가 (record.id는 new_id()로 발급받은 값)"""
+        with self._lock:
+            self._ids.advance_past(record.id)
+            self._index(record)
+            self._total += 1
+            if self._storage is not None:
+                self._storage.save_schedule(record)
+
+    def _index(self, record: ScheduledMessage):
+        self._records[record.id] = record
+        self._by_interval.setdefault(record.interval, set()).add(record.id)
+
+    def get(self, schedule_id: int) -> Optional[ScheduledMessage]:
+        record = self._records.get(schedule_id)
+        if record is None and self._storage is not None:
+            loaded = self._storage.load_schedule(schedule_id)
+            if loaded is not None:
+                record = loaded[0]
+        return record
+
+    def remove(self, schedule_id: int) -> Optional[ScheduledMessage]:
+        """레코드 제거 후 반환 (없으면 None)"""
+        with self._lock:
+            record = self._records.pop(schedule_id, None)
+            if record is None:
+                record = self.get(schedule_id)
+                if record is None:
+                    return None
+            else:
+                ids = self._by_interval.get(record.interval)
+                if ids is not None:
+                    ids.discard(schedule_id)
+                    if not ids:
+                        del self._by_interval[record.interval]
+                self._drop_next_fire(schedule_id)
+
+            self._total -= 1
+            if self._storage is not None:
+                self._storage.delete_schedule(schedule_id)
+            return record
+
+    def ids_by_interval(self, interval: str) -> List[int]:
+        """반복 주기별 스케줄 ID 목록"""
+        with self._lock:
+            return sorted(self._by_interval.get(interval, ()))
+
+    def set_next_fire(self, schedule_id: int, timestamp: Optional[float]):
+        """다음 실행 시각 인덱스 갱신"""
+        with self._lock:
+            if schedule_id not in self._records:
+                return
+            self._set_next_fire(schedule_id, timestamp)
+            if self._storage is not None:
+                self._storage.update_next_fire(schedule_id, timestamp)
+
+    def _set_next_fire(self, schedule_id: int, timestamp: Optional[float]):
+        if timestamp is None:
+            self._drop_next_fire(schedule_id)
+            return
+        if self._next_fire.get(schedule_id) == timestamp:
+            return
+        self._next_fire[schedule_id] = timestamp
+        heapq.heappush(self._fire_heap, (timestamp, schedule_id))
+        self._compact_fire_heap()
+
+    def get_next_fire(self, schedule_id: int) -> Optional[float]:
+        return self._next_fire.get(schedule_id)
+
+    def _drop_next_fire(self, schedule_id: int):
+        # 힙 항목은 꺼낼 때 건너뛰므로 O(1)
+        if self._next_fire.pop(schedule_id, None) is not None:
+            self._compact_fire_heap()
+
+    def _compact_fire_heap(self):
+        """지난 항목이 절반을 넘으면 힙을 다시 만듦 (힙 크기를 살아 있는 항목 수에 비례하게 유지)"""
+        if len(self._fire_heap) > 1024 and len(self._fire_heap) > 2 * len(self._next_fire):
+            self._fire_heap = [(timestamp, schedule_id) for schedule_id, timestamp in self._next_fire.items()]
+            heapq.heapify(self._fire_heap)
+
+    def _iter_fire_order(self) -> Iterator[Tuple[float, int]]:
+        """(다음 실행 시각, ID)를 시각 순으로 반환
+
+        힙을 바꾸지 않고 후보 힙으로 배열 힙을 따라 내려가므로 앞에서 k개를 꺼내는 비용은 O(k log k).
+        """
+        heap = self._fire_heap
+        candidates = [(heap[0], 0)] if heap else []
+        # 같은 시각으로 되돌아간 스케줄은 힙에 같은 항목이 두 개 있을 수 있음
+        seen = set()
+        while candidates:
+            (timestamp, schedule_id), index = heapq.heappop(candidates)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(candidates, (heap[child], child))
+            if self._next_fire.get(schedule_id) == timestamp and schedule_id not in seen:
+                seen.add(schedule_id)
+                yield timestamp, schedule_id
+
+    def due_before(self, timestamp: float, limit: Optional[int] = None) -> List[ScheduledMessage]:
+        """timestamp 이전에 실행될 스케줄을 실행 시각 순으로 반환"""
+        with self._lock:
+            due = itertools.takewhile(lambda entry: entry[0] < timestamp, self._iter_fire_order())
+            return [self._records[schedule_id] for _, schedule_id in itertools.islice(due, limit)]
+
+    def upcoming(self, limit: int) -> List[ScheduledMessage]:
+        """가장 먼저 실행될 스케줄 limit개"""
+        with self._lock:
+            entries = itertools.islice(self._iter_fire_order(), limit)
+            return [self._records[schedule_id] for _, schedule_id in entries]
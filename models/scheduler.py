@@ -0,0 +1,357 @@
+import heapq
+import itertools
+import math
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Tuple
+
+INTERVALS = ("daily", "hourly", "weekly")
+
+# 반복 주기별 간격(초) - 놓친 실행 횟수를 산술로 계산할 때 사용
+PERIODS = {"hourly": 3600, "daily": 86400, "weekly": 7 * 86400}
+
+# 놓친 실행(misfire) 처리 방식
+MISFIRE_SKIP = "skip"          # 놓친 실행은 버림
+MISFIRE_COALESCE = "coalesce"  # 놓친 실행을 한 번으로 합쳐 실행
+MISFIRE_ALL = "all"            # 유예 시간 안에 있는 놓친 실행을 모두 실행
+MISFIRE_POLICIES = (MISFIRE_SKIP, MISFIRE_COALESCE, MISFIRE_ALL)
+DEFAULT_GRACE_TIME = 60
+
+# 시스템 시계 변경/절전 복귀를 놓치지 않도록 한 번에 기다리는 최대 시간(초)
+MAX_WAIT = 60.0
+
+
+@dataclass(frozen=True)
+class Trigger:
+    """반복 주기와 시각으로 다음 실행 시각을 계산 (weekly는 매주 월요일)"""
+    interval: str
+    hour: int
+    minute: int
+
+    def __post_init__(self):
+        if self.interval not in INTERVALS:
+            raise ValueError(f"지원하지 않는 반복 주기입니다: {self.interval}")
+        if not (0 <= self.hour <= 23 and 0 <= self.minute <= 59):
+            raise ValueError(f"잘못된 시간입니다: {self.hour:02d}:{self.minute:02d}")
+
+    @classmethod
+    def from_time_str(cls, interval: str, time_str: str) -> "Trigger":
+        """"HH:MM" 문자열로 Trigger 생성"""
+        hour, minute = time_str.split(":")
+        return cls.of(interval, int(hour), int(minute))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def of(interval: str, hour: int, minute: int) -> "Trigger":
+        """같은 주기/시각의 Trigger를 공유 (가능한 조합은 최대 3 * 24 * 60개)"""
+        return Trigger(interval, hour, minute)
+
+    @property
+    def period(self) -> int:
+        """실행 간격(초)"""
+        return PERIODS[self.interval]
+
+    def next_after(self, timestamp: float) -> float:
+        """timestamp 이후(초과) 첫 실행 시각 (epoch 초)"""
+        now = datetime.fromtimestamp(timestamp)
+        if self.interval == "hourly":
+            candidate = now.replace(minute=self.minute, second=0, microsecond=0)
+            step = timedelta(hours=1)
+        else:
+            candidate = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+            step = timedelta(days=1)
+            if self.interval == "weekly":
+                candidate -= timedelta(days=candidate.weekday())
+                step = timedelta(weeks=1)
+
+        while candidate.timestamp() <= timestamp:
+            candidate += step
+        return candidate.timestamp()
+
+
+@dataclass(frozen=True)
+class MisfirePolicy:
+    """실행 시각을 놓쳤을 때(절전, 프로세스 중단 등)의 처리 방식
+
+    grace_time 초 이내로 늦은 실행은 정상 실행으로 본다. 놓친 실행 횟수는 주기로 나누어
+    계산하므로 오래 멈춰 있었어도 놓친 실행을 하나씩 되짚지 않는다.
+    """
+    mode: str = MISFIRE_COALESCE
+    grace_time: float = DEFAULT_GRACE_TIME
+
+    def __post_init__(self):
+        if self.mode not in MISFIRE_POLICIES:
+            raise ValueError(f"지원하지 않는 misfire 정책입니다: {self.mode}")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def of(mode: str = MISFIRE_COALESCE, grace_time: float = DEFAULT_GRACE_TIME) -> "MisfirePolicy":
+        """같은 정책 객체를 공유"""
+        return MisfirePolicy(mode, grace_time)
+
+    def runs_to_fire(self, deadline: float, now: float, period: float) -> int:
+        """deadline부터 now까지 놓친 실행 중 지금 실행할 횟수"""
+        late = now - deadline
+        if late <= self.grace_time:
+            return 1
+        if self.mode == MISFIRE_COALESCE:
+            return 1
+
+        # deadline + i * period (i < missed) 중 now - grace_time 이후인 실행 수
+        missed = int(late // period) + 1
+        first_in_grace = max(0, math.ceil((late - self.grace_time) / period))
+        eligible = max(0, missed - first_in_grace)
+        if self.mode == MISFIRE_SKIP:
+            return min(eligible, 1)
+        return eligible
+
+
+DEFAULT_MISFIRE = MisfirePolicy.of()
+
+
+def fire_times(trigger: Trigger, misfire: MisfirePolicy, deadline: float, now: float) -> List[float]:
+    """deadline이 된 작업을 now에 실행할 예정 시각 목록 (놓친 실행 중 misfire 정책이 정한 가장 최근 runs개)"""
+    period = trigger.period
+    runs = misfire.runs_to_fire(deadline, now, period)
+    missed = int(max(0.0, now - deadline) // period) + 1
+    return [deadline + i * period for i in range(missed - runs, missed)]
+
+
+class ScheduledJob:
+    """엔진에 등록된 작업 핸들 (실행 시 callback(key) 호출)"""
+
+    __slots__ = ("trigger", "callback", "key", "deadline", "cancelled", "misfire", "fired_at")
+
+    def __init__(self, trigger: Trigger, callback: Callable[[Any], None], key: Any, deadline: float,
+                 misfire: MisfirePolicy = DEFAULT_MISFIRE):
+        self.trigger = trigger
+        self.callback = callback
+        self.key = key
+        self.deadline = deadline
+        self.cancelled = False
+        self.misfire = misfire
+        # 마지막으로 실행된 예정 시각 (콜백 안에서 이번 실행의 시각으로 사용)
+        self.fired_at: Optional[float] = None
+
+
+class SchedulerEngine:
+    """스케줄러 엔진 공통 부분 (실행 스레드와 조건 변수 대기)
+
+    하위 클래스는 조건 변수 락을 잡은 상태에서 호출되는 _insert / _remove / _clear / _collect_due /
+    _next_wakeup 을 구현한다. add()가 돌려주는 핸들은 엔진마다 다를 수 있으므로 호출자는
+    deadline_of() / fired_at()으로 시각을 읽는다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _insert(self, job: ScheduledJob):
+        raise NotImplementedError
+
+    def _remove(self, job: ScheduledJob) -> bool:
+        """작업을 제거하고 제거했으면 True (이미 취소된 작업이면 False)"""
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+    def _collect_due(self, now: float) -> List[ScheduledJob]:
+        """now까지 실행 시각이 된 작업을 꺼내 반환"""
+        raise NotImplementedError
+
+    def _next_wakeup(self) -> Optional[float]:
+        """다음에 깨어나야 하는 시각 (작업이 없으면 None)"""
+        raise NotImplementedError
+
+    def add(self, trigger: Trigger, callback: Callable[[Any], None], key: Any = None,
+            misfire: MisfirePolicy = DEFAULT_MISFIRE, deadline: Optional[float] = None) -> ScheduledJob:
+        """작업 등록 후 핸들 반환
+
+        작업마다 클로저를 만들지 않도록 공유 콜백과 key(스케줄 ID 등)를 받아 callback(key)로 실행한다.
+        deadline을 주면 (재시작 전에 저장해 둔 다음 실행 시각 등) 그 시각부터 시작하며,
+        이미 지난 시각이면 misfire 정책에 따라 처리된다.
+        """
+        if deadline is None:
+            deadline = trigger.next_after(self._clock())
+        with self._cond:
+            job = self._new_job(trigger, callback, key, deadline, misfire)
+            self._insert(job)
+            # 대기 중인 시각보다 빠른 작업이면 스레드를 깨워 대기 시간을 다시 계산
+            if self._wakeup_at is None or deadline < self._wakeup_at:
+                self._cond.notify()
+        return job
+
+    def _new_job(self, trigger: Trigger, callback: Callable[[Any], None], key: Any, deadline: float,
+                 misfire: MisfirePolicy) -> ScheduledJob:
+        return ScheduledJob(trigger, callback, key, deadline, misfire)
+
+    def cancel(self, job: ScheduledJob):
+        """작업 하나만 취소 (다른 작업과 실행 스레드는 그대로)"""
+        with self._cond:
+            if self._remove(job):
+                self._cond.notify()
+
+    def deadline_of(self, job: ScheduledJob) -> float:
+        """작업의 다음 실행 예정 시각"""
+        return job.deadline
+
+    def fired_at(self, job: ScheduledJob) -> Optional[float]:
+        """마지막으로 실행된 예정 시각 (콜백 안에서 이번 실행의 시각으로 사용)"""
+        return job.fired_at
+
+    def clear(self):
+        """모든 작업 제거"""
+        with self._cond:
+            self._clear()
+            self._cond.notify()
+
+    def next_deadline(self) -> Optional[float]:
+        """다음에 깨어날 시각 (없으면 None)"""
+        with self._cond:
+            return self._next_wakeup()
+
+    def _take_due(self, now: float) -> List[Tuple[ScheduledJob, float]]:
+        """실행할 (작업, 예정 시각)을 꺼내고 작업을 다음 실행 시각으로 다시 등록
+
+        놓친 실행은 misfire 정책이 정한 횟수만큼 반환 목록에 들어간다 (0회면 건너뜀).
+        """
+        due = []
+        for job in self._collect_due(now):
+            if job.cancelled:
+                continue
+            due.extend((job, fire_time) for fire_time in fire_times(job.trigger, job.misfire, job.deadline, now))
+            # 다음 실행 시각을 미리 등록해 두어 콜백이 오래 걸려도 주기가 밀리지 않음
+            job.deadline = job.trigger.next_after(max(job.deadline, now))
+            self._insert(job)
+        return due
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """now까지 실행 시각이 된 작업을 현재 스레드에서 실행하고 실행 개수 반환"""
+        with self._cond:
+            due = self._take_due(self._clock() if now is None else now)
+        self._run_jobs(due)
+        return len(due)
+
+    def start(self):
+        """실행 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="telegram-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """실행 스레드 중지 (등록된 작업은 유지)"""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _wait_due(self) -> Optional[List[Tuple[ScheduledJob, float]]]:
+        """실행할 작업이 생길 때까지 대기 후 꺼냄 (중지되면 None)"""
+        with self._cond:
+            while self._running:
+                self._wakeup_at = self._next_wakeup()
+                if self._wakeup_at is None:
+                    self._cond.wait()
+                    continue
+
+                now = self._clock()
+                delay = self._wakeup_at - now
+                if delay > 0:
+                    self._cond.wait(min(delay, MAX_WAIT))
+                    continue
+
+                due = self._take_due(now)
+                if due:
+                    return due
+            self._wakeup_at = None
+        return None
+
+    @staticmethod
+    def _run_jobs(jobs: List[Tuple[ScheduledJob, float]]):
+        for job, fire_time in jobs:
+            job.fired_at = fire_time
+            try:
+                job.callback(job.key)
+            except Exception as e:
+                print(f"스케줄 작업 실행 오류: {e}")
+
+    def _run(self):
+        while True:
+            due = self._wait_due()
+            if due is None:
+                return
+            self._run_jobs(due)
+
+
+class HeapScheduler(SchedulerEngine):
+    """다음 실행 시각 최소 힙 기반 스케줄러
+
+    가장 이른 실행 시각까지 정확히 잠들고, 작업이 추가/제거되면 조건 변수로 즉시 깨어난다.
+    등록과 실행은 작업당 O(log n).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._seq = itertools.count()
+        # 취소되었지만 아직 힙에 남아 있는 항목 수
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._stale
+
+    def _insert(self, job: ScheduledJob):
+        heapq.heappush(self._heap, (job.deadline, next(self._seq), job))
+
+    def _remove(self, job: ScheduledJob) -> bool:
+        if job.cancelled:
+            return False
+        # 힙에서 바로 빼지 않고 표시만 해 두어 O(1) (꺼낼 때 건너뜀)
+        job.cancelled = True
+        self._stale += 1
+        if self._stale > 1024 and self._stale * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._stale = 0
+        return True
+
+    def _clear(self):
+        for _, _, job in self._heap:
+            job.cancelled = True
+        self._heap.clear()
+        self._stale = 0
+
+    def _pop(self) -> ScheduledJob:
+        job = heapq.heappop(self._heap)[2]
+        if job.cancelled:
+            self._stale -= 1
+        return job
+
+    def _collect_due(self, now: float) -> List[ScheduledJob]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(self._pop())
+        return due
+
+    def _next_wakeup(self) -> Optional[float]:
+        while self._heap and self._heap[0][2].cancelled:
+            self._pop()
+        return self._heap[0][0] if self._heap else None
@@ -0,0 +1,165 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from models.media_cache import Attachment
+
+# 우선순위 (작을수록 먼저 전송)
+PRIORITY_INTERACTIVE = 0  # 사용자가 직접 보낸 메시지 ("지금 전송")
+PRIORITY_BULK = 1         # 스케줄 브로드캐스트
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BULK)
+
+
+@dataclass
+class QueueStats:
+    """우선순위 하나의 대기열 통계"""
+    enqueued: int = 0
+    dequeued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.dequeued if self.dequeued else 0.0
+
+
+class PrioritySendQueue:
+    """크기가 제한된 우선순위 전송 대기열 (asyncio)
+
+    get()은 항상 가장 높은 우선순위 항목을 먼저 꺼내고, 같은 우선순위 안에서는 넣은 순서를 지킨다.
+    가득 차면 put()이 자리가 날 때까지 기다려 생산자(아웃박스 워커, 브로드캐스트)의 속도를 늦춘다.
+    자리가 나면 높은 우선순위 생산자가 먼저 들어가므로 대량 전송 중에도 "지금 전송"이 밀리지 않는다.
+    이벤트 루프 스레드 안에서만 사용한다.
+    """
+
+    def __init__(self, maxsize: int = 1000, clock=time.monotonic):
+        self.maxsize = max(1, maxsize)
+        self._clock = clock
+        self._queues: List[Deque[Tuple[float, Any]]] = [deque() for _ in PRIORITIES]
+        self._size = 0
+        # 기다리는 소비자 / 우선순위별로 자리가 나기를 기다리는 생산자 (깨울 때 하나씩만 깨움)
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: List[Deque[asyncio.Future]] = [deque() for _ in PRIORITIES]
+        self._stats = [QueueStats() for _ in PRIORITIES]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def full(self) -> bool:
+        return self._size >= self.maxsize
+
+    @staticmethod
+    def _wake_first(waiters: Deque[asyncio.Future]) -> bool:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+        return False
+
+    def _wake_putter(self):
+        """가장 높은 우선순위의 대기 생산자 하나를 깨움"""
+        for putters in self._putters:
+            if self._wake_first(putters):
+                return
+
+    async def put(self, item: Any, priority: int = PRIORITY_BULK):
+        """항목 추가 (가득 찼으면 자리가 날 때까지 대기)"""
+        # 같거나 높은 우선순위 생산자가 먼저 기다리고 있으면 그 뒤에 줄을 섬
+        if self.full() or any(self._putters[level] for level in range(priority + 1)):
+            loop = asyncio.get_running_loop()
+            while True:
+                waiter = loop.create_future()
+                self._putters[priority].append(waiter)
+                try:
+                    await waiter
+                except BaseException:
+                    waiter.cancel()
+                    with contextlib.suppress(ValueError):
+                        self._putters[priority].remove(waiter)
+                    # 깨워진 뒤 취소되었으면 받은 자리를 다음 생산자에게 넘김
+                    if not self.full():
+                        self._wake_putter()
+                    raise
+                if not self.full():
+                    break
+
+        self._queues[priority].append((self._clock(), item))
+        self._size += 1
+        self._stats[priority].enqueued += 1
+        self._wake_first(self._getters)
+        if not self.full():
+            self._wake_putter()
+
+    async def get(self) -> Any:
+        """가장 높은 우선순위 항목을 꺼냄 (비어 있으면 대기)"""
+        if not self._size:
+            loop = asyncio.get_running_loop()
+            while not self._size:
+                getter = loop.create_future()
+                self._getters.append(getter)
+                try:
+                    await getter
+                except BaseException:
+                    getter.cancel()
+                    with contextlib.suppress(ValueError):
+                        self._getters.remove(getter)
+                    if self._size:
+                        self._wake_first(self._getters)
+                    raise
+
+        for priority, queue in enumerate(self._queues):
+            if queue:
+                enqueued_at, item = queue.popleft()
+                break
+        self._size -= 1
+        wait = self._clock() - enqueued_at
+        stats = self._stats[priority]
+        stats.dequeued += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        self._wake_putter()
+        return item
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 길이와 우선순위별 대기 시간 통계"""
+        now = self._clock()
+        return {
+            "depth": self._size,
+            "maxsize": self.maxsize,
+            "priorities": {
+                priority: {
+                    "depth": len(queue),
+                    "waiting_producers": sum(not waiter.done() for waiter in self._putters[priority]),
+                    "enqueued": stats.enqueued,
+                    "dequeued": stats.dequeued,
+                    "mean_wait": stats.mean_wait,
+                    "max_wait": stats.max_wait,
+                    # 지금 맨 앞 항목이 기다린 시간
+                    "oldest_wait": now - queue[0][0] if queue else 0.0,
+                }
+                for priority, (queue, stats) in enumerate(zip(self._queues, self._stats))
+            },
+        }
+
+
+@dataclass(frozen=True)
+class CopySource:
+    """스테이징 채팅방에 한 번 보낸 원본 메시지 (각 채팅방에는 copyMessage / forwardMessage로 전송)"""
+    chat_id: str
+    message_id: int
+    forward: bool = False
+
+
+@dataclass(eq=False)
+class SendJob:
+    """대기열에 들어가는 채팅방 하나의 전송 요청 (결과는 future로 전달)"""
+    message: str
+    chat_id: str
+    key: Optional[bytes] = None
+    attachment: Optional[Attachment] = None
+    copy_from: Optional[CopySource] = None
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
@@ -0,0 +1,279 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.schedule_store import ScheduledMessage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chats (
+    chat_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS schedules (
+    id INTEGER PRIMARY KEY,
+    message TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    interval TEXT NOT NULL,
+    enabled INTEGER NOT NULL DEFAULT 1,
+    misfire TEXT NOT NULL DEFAULT 'coalesce',
+    grace_time INTEGER NOT NULL DEFAULT 60,
+    media_type TEXT,
+    media_path TEXT,
+    next_fire REAL
+);
+CREATE INDEX IF NOT EXISTS idx_schedules_next_fire ON schedules (next_fire, id);
+CREATE TABLE IF NOT EXISTS scheduler_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+SCHEDULE_COLUMNS = ("id, message, hour, minute, interval, enabled, misfire, grace_time, "
+                    "media_type, media_path, next_fire")
+
+# 이전 버전 DB에 없는 컬럼 (테이블, 컬럼, 타입)
+MIGRATIONS = (
+    ("schedules", "media_type", "TEXT"),
+    ("schedules", "media_path", "TEXT"),
+)
+
+
+def migrate(conn: sqlite3.Connection, migrations=MIGRATIONS):
+    """없는 컬럼만 추가 (기존 DB를 그대로 열 수 있도록)"""
+    columns: Dict[str, set] = {}
+    for table, column, column_type in migrations:
+        if table not in columns:
+            columns[table] = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns[table]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            columns[table].add(column)
+
+
+def _record_row(record: ScheduledMessage, next_fire: Optional[float]) -> tuple:
+    return (record.id, record.message, record.hour, record.minute, record.interval,
+            int(record.enabled), record.misfire, record.grace_time, record.media_type, record.media_path,
+            next_fire)
+
+
+def _row_record(row: tuple) -> Tuple[ScheduledMessage, Optional[float]]:
+    (schedule_id, message, hour, minute, interval, enabled, misfire, grace_time,
+     media_type, media_path, next_fire) = row
+    record = ScheduledMessage(schedule_id, message, hour, minute, interval,
+                              enabled=bool(enabled), misfire=misfire, grace_time=grace_time,
+                              media_type=media_type, media_path=media_path)
+    return record, next_fire
+
+
+class Storage:
+    """SQLite(WAL) 기반 영구 저장소 - 채팅방, 스케줄, 스케줄러 상태
+
+    채팅방 추가/삭제와 스케줄 쓰기는 메모리에 모아 두었다가 한 트랜잭션으로 일괄 반영한다.
+    버퍼가 batch_size에 도달하거나 flush_interval초가 지나면 자동으로 flush된다.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # 이전 버전 DB는 테이블이 이미 있으므로 컬럼을 먼저 맞춘 뒤 인덱스 생성
+        if self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'schedules'").fetchone():
+            migrate(self._conn)
+        self._conn.executescript(SCHEMA)
+
+        # 아직 디스크에 반영하지 않은 스케줄 변경 (ID 기준으로 마지막 변경만 유지)
+        self._pending_upserts: Dict[int, tuple] = {}
+        self._pending_next_fire: Dict[int, Optional[float]] = {}
+        self._pending_deletes: set = set()
+        # 아직 반영하지 않은 채팅방 변경 (chat_id -> 위치, None이면 삭제)
+        self._pending_chats: Dict[str, Optional[int]] = {}
+        row = self._conn.execute("SELECT MAX(position) FROM chats").fetchone()
+        self._next_chat_position = 0 if row[0] is None else row[0] + 1
+        self._flush_timer: Optional[threading.Timer] = None
+
+    # ----- 채팅방 -----
+
+    def load_chat_ids(self) -> List[str]:
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute("SELECT chat_id FROM chats ORDER BY position").fetchall()
+        return [row[0] for row in rows]
+
+    def save_chat_ids(self, chat_ids: List[str]):
+        """채팅방 목록 전체를 한 트랜잭션으로 교체"""
+        with self._lock:
+            self._pending_chats.clear()
+            with self._transaction():
+                self._conn.execute("DELETE FROM chats")
+                self._conn.executemany("INSERT INTO chats (chat_id, position) VALUES (?, ?)",
+                                       [(chat_id, position) for position, chat_id in enumerate(chat_ids)])
+            self._next_chat_position = len(chat_ids)
+
+    def add_chat_id(self, chat_id: str):
+        """채팅방 하나를 목록 끝에 추가 (일괄 쓰기)"""
+        with self._lock:
+            self._pending_chats[chat_id] = self._next_chat_position
+            self._next_chat_position += 1
+            self._after_write()
+
+    def remove_chat_id(self, chat_id: str):
+        """채팅방 하나 삭제 (일괄 쓰기)"""
+        with self._lock:
+            self._pending_chats[chat_id] = None
+            self._after_write()
+
+    # ----- 스케줄러 상태 -----
+
+    def get_state(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM scheduler_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_state(self, key: str, value: str):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO scheduler_state (key, value) VALUES (?, ?)",
+                               (key, value))
+
+    # ----- 스케줄 (일괄 쓰기) -----
+
+    def save_schedule(self, record: ScheduledMessage, next_fire: Optional[float] = None):
+        with self._lock:
+            self._pending_deletes.discard(record.id)
+            self._pending_next_fire.pop(record.id, None)
+            self._pending_upserts[record.id] = _record_row(record, next_fire)
+            self._after_write()
+
+    def update_next_fire(self, schedule_id: int, next_fire: Optional[float]):
+        with self._lock:
+            upsert = self._pending_upserts.get(schedule_id)
+            if upsert is not None:
+                self._pending_upserts[schedule_id] = upsert[:-1] + (next_fire,)
+            else:
+                self._pending_next_fire[schedule_id] = next_fire
+            self._after_write()
+
+    def delete_schedule(self, schedule_id: int):
+        with self._lock:
+            self._pending_upserts.pop(schedule_id, None)
+            self._pending_next_fire.pop(schedule_id, None)
+            self._pending_deletes.add(schedule_id)
+            self._after_write()
+
+    def _pending_count(self) -> int:
+        return (len(self._pending_upserts) + len(self._pending_next_fire) + len(self._pending_deletes)
+                + len(self._pending_chats))
+
+    def _after_write(self):
+        if self._pending_count() >= self.batch_size:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """모아 둔 스케줄/채팅방 변경을 한 트랜잭션으로 반영"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_count():
+                return
+
+            upserts, self._pending_upserts = self._pending_upserts, {}
+            next_fires, self._pending_next_fire = self._pending_next_fire, {}
+            deletes, self._pending_deletes = self._pending_deletes, set()
+            chats, self._pending_chats = self._pending_chats, {}
+            with self._transaction():
+                if chats:
+                    self._conn.executemany("DELETE FROM chats WHERE chat_id = ?",
+                                           [(chat_id,) for chat_id, position in chats.items() if position is None])
+                    self._conn.executemany("INSERT OR REPLACE INTO chats (chat_id, position) VALUES (?, ?)",
+                                           [(chat_id, position) for chat_id, position in chats.items()
+                                            if position is not None])
+                if deletes:
+                    self._conn.executemany("DELETE FROM schedules WHERE id = ?",
+                                           [(schedule_id,) for schedule_id in deletes])
+                if upserts:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO schedules ({SCHEDULE_COLUMNS}) "
+                        f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", list(upserts.values()))
+                if next_fires:
+                    self._conn.executemany("UPDATE schedules SET next_fire = ? WHERE id = ?",
+                                           [(ts, schedule_id) for schedule_id, ts in next_fires.items()])
+
+    @contextmanager
+    def _transaction(self):
+        """autocommit 연결에서 BEGIN/COMMIT 범위 (예외 시 ROLLBACK)"""
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    # ----- 스케줄 조회 -----
+
+    def count_schedules(self) -> int:
+        with self._lock:
+            self.flush()
+            return self._conn.execute("SELECT COUNT(*) FROM schedules").fetchone()[0]
+
+    def max_schedule_id(self) -> Optional[int]:
+        with self._lock:
+            self.flush()
+            return self._conn.execute("SELECT MAX(id) FROM schedules").fetchone()[0]
+
+    def load_schedule(self, schedule_id: int) -> Optional[Tuple[ScheduledMessage, Optional[float]]]:
+        with self._lock:
+            self.flush()
+            row = self._conn.execute(f"SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE id = ?",
+                                     (schedule_id,)).fetchone()
+        return _row_record(row) if row else None
+
+    def load_due(self, after: Tuple[float, int], before: float,
+                 limit: int = 10_000) -> List[Tuple[ScheduledMessage, Optional[float]]]:
+        """(next_fire, id)가 after보다 크고 next_fire < before 인 스케줄을 실행 시각 순으로 반환 (인덱스 사용)"""
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                f"SELECT {SCHEDULE_COLUMNS} FROM schedules "
+                f"WHERE (next_fire, id) > (?, ?) AND next_fire < ? "
+                f"ORDER BY next_fire, id LIMIT ?", (*after, before, limit)).fetchall()
+        return [_row_record(row) for row in rows]
+
+    def page_schedules(self, offset: int, limit: int) -> List[Tuple[ScheduledMessage, Optional[float]]]:
+        """ID 순서로 offset번째부터 limit개 반환 (목록 화면 페이지 조회)"""
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                f"SELECT {SCHEDULE_COLUMNS} FROM schedules ORDER BY id LIMIT ? OFFSET ?",
+                (limit, offset)).fetchall()
+        return [_row_record(row) for row in rows]
+
+    def iter_schedules(self, chunk_size: int = 10_000) -> Iterator[Tuple[ScheduledMessage, Optional[float]]]:
+        """ID 순서로 모든 스케줄 반환 (chunk_size씩 나누어 읽음)"""
+        last_id = -1
+        while True:
+            with self._lock:
+                self.flush()
+                rows = self._conn.execute(
+                    f"SELECT {SCHEDULE_COLUMNS} FROM schedules WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, chunk_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _row_record(row)
+            last_id = rows[-1][0]
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
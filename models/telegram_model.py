@@ -1,20 +1,153 @@
-import schedule
+import asyncio
+import contextlib
+import functools
+import threading
 import time
 from datetime import datetime
-from typing import Optional, Callable
+from typing import Any, Optional, Callable, Dict, List
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import BadRequest, InvalidToken, TelegramError
+from telegram.request import HTTPXRequest
+
+from models.bot_info_cache import BotIdentity, BotInfoCache, ChatInfo, can_send_to
+from models.delivery_log import DeliveryLog, idempotency_key
+from models.event_loop import EventLoopThread
+from models.keyed_executor import KeyedExecutor
+from models.media_cache import MEDIA_DOCUMENT, Attachment, MediaCache, file_id_of, is_file_id_error
+from models.outbox import FireSummary, Outbox
+from models.upload_source import StreamingInputFile, UploadSources
+from models.rate_limiter import RateLimit, TelegramRateLimiter
+from models.send_queue import PRIORITY_BULK, PRIORITY_INTERACTIVE, CopySource, PrioritySendQueue, SendJob
+from models.retry_policy import DeliveryResult, FailureKind, RetryPolicy, classify_error
+from models.schedule_store import ScheduledMessage, ScheduleStore
+from models.storage import Storage
+from models.scheduler import DEFAULT_GRACE_TIME, MISFIRE_COALESCE, HeapScheduler, MisfirePolicy, Trigger
+from models.timing_wheel import TimingWheelScheduler
+
+
+DEFAULT_MAX_CONCURRENCY = 32
+# 동시에 실행하는 채팅방 레인 수 (재시도/flood-wait로 기다리는 레인은 자리를 내놓음)
+DEFAULT_SEND_WORKERS = 64
+# 전송 대기열 크기 (가득 차면 생산자가 대기)
+SEND_QUEUE_SIZE = 1000
+
+# 스케줄러 엔진 선택 (수십만 개 이상의 스케줄은 작업당 메모리가 작은 "wheel" 권장)
+SCHEDULER_BACKENDS = {
+    "heap": HeapScheduler,
+    "wheel": TimingWheelScheduler,
+}
+
+# 브로드캐스트 방식
+BROADCAST_DIRECT = "direct"    # 채팅방마다 메시지(첨부)를 그대로 전송
+BROADCAST_COPY = "copy"        # 스테이징 채팅방에 한 번 보낸 뒤 copyMessage로 복사
+BROADCAST_FORWARD = "forward"  # 스테이징 채팅방에 한 번 보낸 뒤 forwardMessage로 전달
+BROADCAST_STRATEGIES = (BROADCAST_DIRECT, BROADCAST_COPY, BROADCAST_FORWARD)
+
+# 저장소에서 미리 불러와 스케줄러에 올려 둘 구간(초)
+LOAD_AHEAD = 15 * 60
+
+# 동시에 전송 중인 아웃박스 행 수와 한 번에 가져가는 행 수
+# (OUTBOX_CLAIM_SIZE개 이상 자리가 비면 그만큼 더 가져오므로 느린 행 하나가 다른 행을 막지 않음)
+OUTBOX_IN_FLIGHT = 200
+OUTBOX_CLAIM_SIZE = 50
+# 완료된 아웃박스 기록 보관 기간(초)
+OUTBOX_RETENTION = 7 * 86400
+
+# 채팅방 확인 결과(제목/권한)를 다시 확인하지 않고 재사용하는 기간(초)
+BOT_INFO_MAX_AGE = 86400
+
+
+def _attachment_of(media_type: Optional[str], media_path: Optional[str]) -> Optional[Attachment]:
+    """저장된 첨부 필드로 Attachment 생성 (첨부가 없으면 None)"""
+    return Attachment(media_type, media_path) if media_type and media_path else None
+
+
+def _copy_future_result(source: asyncio.Future, target: asyncio.Future):
+    """레인 작업 결과를 요청자의 future로 옮김"""
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
 
 
 class TelegramModel:
     """텔레그램 API와 메시지 스케줄링을 담당하는 Model 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 rate_limiter: Optional[TelegramRateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 scheduler_backend: str = "heap",
+                 db_path: Optional[str] = None,
+                 send_workers: int = DEFAULT_SEND_WORKERS,
+                 send_queue_size: int = SEND_QUEUE_SIZE,
+                 base_url: Optional[str] = None):
         self.bot: Optional[Bot] = None
-        self.chat_ids: list = []  # 여러 채팅방 ID를 저장하는 리스트
-        self.scheduled_messages = []
+        # getMe로 토큰을 확인한 Bot (self.bot과 같을 때만 아웃박스 행을 가져감)
+        self._verified_bot: Optional[Bot] = None
+        # Bot API 주소 (None이면 https://api.telegram.org/bot, 로컬 가짜 서버로 바꿔 벤치마크할 때 사용)
+        self.base_url = base_url
+        # db_path가 있으면 채팅방/스케줄/스케줄러 상태를 SQLite에 영구 저장
+        self.storage: Optional[Storage] = Storage(db_path) if db_path else None
+        # 스케줄 실행은 (스케줄, 채팅방)별 아웃박스 행으로 기록한 뒤 워커가 전송 (재시작 시 이어서 전송)
+        self.outbox: Optional[Outbox] = Outbox(db_path) if db_path else None
+        # 전송 완료된 (스케줄, 실행 시각, 채팅방) 키 - 재시도/재시작 시 중복 전송 방지
+        self.delivery_log: Optional[DeliveryLog] = DeliveryLog(db_path) if db_path else None
+        # 첨부 파일 내용 해시 -> file_id (DB가 없으면 이번 실행 동안만 유지)
+        self.media_cache = MediaCache(db_path or ":memory:")
+        # 업로드 중인 (내용 해시, 종류) -> 업로드가 끝나면 완료되는 future
+        self._uploads: Dict[tuple, asyncio.Future] = {}
+        self._upload_sources = UploadSources()
+        # 채팅방 확인 결과 캐시 (재시작 후 다시 연결할 때 getChat/getChatMember 없이 재사용)
+        self.bot_info_cache = BotInfoCache(db_path or ":memory:")
+        self.bot_identity: Optional[BotIdentity] = None
+        self.chat_info: Dict[str, ChatInfo] = {}
+        self._connect_future = None
+        # connect()마다 1씩 증가 - 이전 연결 작업이 늦게 보낸 이벤트를 구분
+        self.connect_generation = 0
+        # 복사/전달 브로드캐스트용 스테이징 채팅방과 실행별 스테이징 작업 (fire_id -> task)
+        self.broadcast_strategy = BROADCAST_DIRECT
+        self.staging_chat_id: Optional[str] = None
+        self._staging: Dict[int, asyncio.Future] = {}
+        self._bot_id = ""
+        # 여러 채팅방 ID를 저장하는 리스트
+        self.chat_ids: list = self.storage.load_chat_ids() if self.storage else []
+        self.schedules = ScheduleStore(storage=self.storage)
         self.is_running = False
         self._callback: Optional[Callable] = None
+        
+        # 모든 비동기 전송은 하나의 장기 실행 루프에서 처리 (Bot/커넥션 풀 재사용)
+        self._loop_thread = EventLoopThread()
+        self._bot_init_lock: Optional[asyncio.Lock] = None
+        self.max_concurrency = max(1, max_concurrency)
+        # 모든 전송은 우선순위 대기열을 거쳐 채팅방별 FIFO 레인에서 실행
+        # (레인은 send_workers개까지 병렬, 동시 HTTP 요청 수는 semaphore로 제한)
+        self.send_workers = max(1, send_workers)
+        self._send_queue = PrioritySendQueue(send_queue_size)
+        self._send_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = KeyedExecutor(self.send_workers)
+        self._send_dispatcher: Optional[asyncio.Task] = None
+        self.rate_limiter = rate_limiter or TelegramRateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        if scheduler_backend not in SCHEDULER_BACKENDS:
+            raise ValueError(f"지원하지 않는 스케줄러 엔진입니다: {scheduler_backend}")
+        self._scheduler = SCHEDULER_BACKENDS[scheduler_backend]()
+        # schedule_id -> 스케줄러 작업 핸들 (O(1) 개별 취소용, 핸들 형태는 엔진마다 다름)
+        self._jobs: Dict[int, Any] = {}
+        # 모든 작업이 공유하는 디스패처 (self._dispatch_scheduled는 읽을 때마다 바운드 메서드를 새로 만듦)
+        self._dispatch = self._dispatch_scheduled
+        self._load_timer: Optional[threading.Timer] = None
+        self._outbox_future = None
+        self._outbox_wakeup: Optional[asyncio.Event] = None
+        # 끝났지만 아직 저장소에 기록하지 않은 아웃박스 행 결과 (기록 태스크가 모아서 한 번에 기록)
+        self._outbox_results: list = []
+        self._outbox_recorded: Optional[asyncio.Event] = None
+        if self.storage:
+            self.outbox.purge(OUTBOX_RETENTION)
+            self._load_due_schedules()
     
     def set_callback(self, callback: Callable):
         """ViewModel에서 상태 변경을 알리기 위한 콜백 설정"""
@@ -23,92 +156,711 @@ class TelegramModel:
     def set_bot_token(self, token: str) -> bool:
         """봇 토큰 설정"""
         try:
-            self.bot = Bot(token=token)
+            self._shutdown_bot()
+            # 동시 전송 수만큼 커넥션을 열 수 있도록 풀 크기를 맞춤
+            request = HTTPXRequest(connection_pool_size=self.max_concurrency)
+            self.bot = (Bot(token=token, request=request, base_url=self.base_url) if self.base_url
+                        else Bot(token=token, request=request))
+            # file_id는 봇마다 다르므로 캐시를 봇 ID(토큰 앞부분)별로 구분
+            self._bot_id = token.split(":", 1)[0]
+            self._loop_thread.start()
+            # 아웃박스 워커는 getMe로 토큰을 확인한 뒤에 시작 (잘못된 토큰으로 남은 행을 실패 처리하지 않도록)
             return True
         except Exception as e:
             print(f"봇 토큰 설정 실패: {e}")
             return False
     
+    def connect(self, token: str, refresh: bool = False) -> bool:
+        """봇 연결 후 백그라운드에서 getMe와 채팅방별 확인 실행 (바로 반환)
+        
+        진행 상황은 'connect_progress', 결과는 'connect_finished' 이벤트로 전달되며, 이벤트의
+        'generation'이 connect_generation과 다르면 이전 연결의 이벤트다.
+        토큰은 매번 getMe로 확인하고, BOT_INFO_MAX_AGE 안에 확인한 채팅방만 캐시를 쓴다.
+        refresh=True면 채팅방도 모두 다시 확인한다.
+        """
+        self.connect_generation += 1
+        if self._connect_future is not None:
+            self._connect_future.cancel()
+        if not self.set_bot_token(token):
+            return False
+        self._connect_future = self._loop_thread.submit(
+            self._async_connect(self.connect_generation, list(self.chat_ids), refresh))
+        return True
+    
+    async def _async_connect(self, generation: int, chat_ids: list, refresh: bool = False):
+        notify = functools.partial(self._notify_connect, generation)
+        # 그 사이 다시 연결해 self.bot이 바뀌어도 이 연결의 Bot으로 확인
+        bot = self.bot
+        try:
+            try:
+                # Bot.initialize()가 getMe로 토큰을 확인하고 결과를 bot.bot에 보관 (캐시하지 않음)
+                await self._with_retry(bot.initialize)
+                me = bot.bot
+            except TelegramError as e:
+                if self.bot is bot:
+                    # 확인에 실패한 Bot으로는 전송하지 않음
+                    self.bot = None
+                    await bot.shutdown()
+                notify('connect_finished', {'success': False, 'error': str(e), 'bot': None,
+                                            'chats': [], 'total': len(chat_ids)})
+                return
+            self._bot_verified(bot)
+            # 캐시는 getMe로 확인한 봇 ID로 구분
+            identity = BotIdentity(str(me.id), me.id, me.username, me.first_name, time.time())
+            cache_key = identity.bot_id
+            
+            cached = {} if refresh else await asyncio.to_thread(self.bot_info_cache.get_chats, cache_key,
+                                                                 BOT_INFO_MAX_AGE)
+            chats = [cached[chat_id] for chat_id in chat_ids if chat_id in cached]
+            missing = [chat_id for chat_id in chat_ids if chat_id not in cached]
+            from_cache = not missing
+            notify('connect_progress', {'bot': identity, 'checked': len(chats), 'total': len(chat_ids),
+                                        'chat': None})
+            
+            checked = []
+            try:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                for future in asyncio.as_completed([self._check_chat(bot, chat_id, identity, semaphore)
+                                                    for chat_id in missing]):
+                    info = await future
+                    checked.append(info)
+                    notify('connect_progress', {'bot': identity, 'checked': len(chats) + len(checked),
+                                                'total': len(chat_ids), 'chat': info})
+            finally:
+                # 중간에 취소되어도 확인한 결과는 남김
+                await asyncio.to_thread(self.bot_info_cache.put_chats, cache_key, checked)
+            
+            chats.extend(checked)
+            if generation == self.connect_generation:
+                self.bot_identity = identity
+                self.chat_info = {info.chat_id: info for info in chats}
+            notify('connect_finished', {'success': True, 'error': '', 'bot': identity, 'chats': chats,
+                                        'total': len(chat_ids), 'from_cache': from_cache})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            notify('connect_finished', {'success': False, 'error': str(e), 'bot': None, 'chats': [],
+                                        'total': len(chat_ids)})
+    
+    def _notify_connect(self, generation: int, event_type: str, data: dict):
+        """연결 이벤트에 generation을 붙여 알림 (그 사이 다시 연결했으면 버림)"""
+        if generation != self.connect_generation:
+            return
+        data['generation'] = generation
+        self._notify(event_type, data)
+    
+    async def _check_chat(self, bot: Bot, chat_id: str, identity: BotIdentity,
+                          semaphore: asyncio.Semaphore) -> ChatInfo:
+        """채팅방 제목/종류와 봇의 전송 권한 확인 (실패하면 error에 사유를 담아 반환)"""
+        async with semaphore:
+            try:
+                chat = await self._with_retry(functools.partial(bot.get_chat, chat_id))
+                member = None
+                if chat.type != "private":
+                    member = await self._with_retry(functools.partial(bot.get_chat_member, chat_id,
+                                                                      identity.user_id))
+            except TelegramError as e:
+                return ChatInfo(chat_id, None, None, None, False, str(e), time.time())
+        title = chat.title or chat.full_name or chat.username
+        return ChatInfo(chat_id, title, chat.type, member.status if member else None,
+                        can_send_to(chat, member), "", time.time())
+    
+    async def _with_retry(self, call: Callable):
+        """flood-wait/일시적 오류는 재시도 정책에 따라 다시 시도 (조회 요청용)"""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await call()
+            except TelegramError as e:
+                failure = classify_error(e)
+                if not self.retry_policy.should_retry(failure, attempt):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(failure, attempt))
+    
+    def _notify(self, event_type: str, data):
+        if self._callback:
+            self._callback(event_type, data)
+    
+    def set_max_concurrency(self, max_concurrency: int):
+        """동시 전송 개수 제한 설정 (다음 봇 연결부터 커넥션 풀 크기에도 반영)"""
+        self.max_concurrency = max(1, int(max_concurrency))
+        # 진행 중인 전송은 기존 semaphore를 그대로 쓰고 새 전송부터 적용
+        self._send_semaphore = asyncio.Semaphore(self.max_concurrency)
+    
+    def set_rate_limits(self, global_per_second: float = 30, private_per_second: float = 1,
+                        group_per_minute: float = 20):
+        """봇 전체 / 개인 채팅방 / 그룹 전송 한도 설정"""
+        self.rate_limiter = TelegramRateLimiter(
+            global_limit=RateLimit(global_per_second, 1.0),
+            private_limit=RateLimit(private_per_second, 1.0),
+            group_limit=RateLimit(group_per_minute, 60.0),
+        )
+    
+    def set_broadcast_strategy(self, strategy: str, staging_chat_id: Optional[str] = None):
+        """브로드캐스트 방식 설정 (copy / forward는 원본을 한 번 보낼 스테이징 채팅방이 필요)"""
+        if strategy not in BROADCAST_STRATEGIES:
+            raise ValueError(f"지원하지 않는 브로드캐스트 방식입니다: {strategy}")
+        staging_chat_id = (staging_chat_id or "").strip() or self.staging_chat_id
+        if strategy != BROADCAST_DIRECT and not staging_chat_id:
+            raise ValueError("copy / forward 방식은 스테이징 채팅방 ID가 필요합니다")
+        self.broadcast_strategy = strategy
+        self.staging_chat_id = staging_chat_id
+    
     def set_chat_ids(self, chat_ids: list):
         """채팅방 ID 목록 설정"""
         self.chat_ids = [chat_id.strip() for chat_id in chat_ids if chat_id.strip()]
+        if self.storage:
+            self.storage.save_chat_ids(self.chat_ids)
     
     def add_chat_id(self, chat_id: str):
         """채팅방 ID 추가"""
         chat_id = chat_id.strip()
         if chat_id and chat_id not in self.chat_ids:
             self.chat_ids.append(chat_id)
+            if self.storage:
+                self.storage.add_chat_id(chat_id)
     
     def remove_chat_id(self, chat_id: str):
         """채팅방 ID 제거"""
         if chat_id in self.chat_ids:
             self.chat_ids.remove(chat_id)
+            if self.storage:
+                self.storage.remove_chat_id(chat_id)
     
-    def send_message(self, message: str) -> dict:
-        """메시지 전송 (동기 방식) - 모든 채팅방에 전송"""
+    def send_message(self, message: str, priority: int = PRIORITY_INTERACTIVE,
+                     attachment: Optional[Attachment] = None, strategy: Optional[str] = None) -> dict:
+        """메시지 전송 (동기 방식) - 모든 채팅방에 전송
+        
+        기본은 "지금 전송" 우선순위라 진행 중인 스케줄 브로드캐스트보다 먼저 전송된다.
+        attachment가 있으면 message는 캡션으로 보내며, 파일은 처음 한 번만 업로드한다.
+        strategy: direct / copy / forward (기본값은 set_broadcast_strategy()로 설정한 방식)
+        """
         if not self.bot or not self.chat_ids:
             return {"success": False, "sent_count": 0, "total_count": 0, "errors": []}
         
-        results = {"success": True, "sent_count": 0, "total_count": len(self.chat_ids), "errors": []}
+        try:
+            return self._loop_thread.run(self._async_broadcast(message, list(self.chat_ids), priority, attachment,
+                                                               strategy))
+        except Exception as e:
+            return {"success": False, "sent_count": 0, "total_count": len(self.chat_ids),
+                    "errors": [f"전송 실패: {e}"]}
+    
+    def _ensure_send_workers(self):
+        """루프 안에서 전송 디스패처를 한 번만 시작"""
+        if self._send_dispatcher is None or self._send_dispatcher.done():
+            self._send_dispatcher = asyncio.get_running_loop().create_task(self._dispatch_sends())
+    
+    async def _dispatch_sends(self):
+        """대기열에서 우선순위 순으로 꺼낸 전송 요청을 채팅방 레인에 넘김
         
-        for chat_id in self.chat_ids:
-            try:
-                import asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                success = loop.run_until_complete(self._async_send_message(message, chat_id))
-                loop.close()
-                
-                if success:
-                    results["sent_count"] += 1
-                else:
-                    results["errors"].append(f"채팅방 {chat_id}: 전송 실패")
-                    results["success"] = False
-            except Exception as e:
-                results["errors"].append(f"채팅방 {chat_id}: {str(e)}")
+        같은 채팅방의 요청은 꺼낸 순서대로 레인에 들어가므로 도착 순서가 유지된다.
+        레인 수가 한도에 닿으면 새 채팅방 요청에서 멈추고 다음 요청을 꺼내지 않으므로 대기열의
+        우선순위가 그대로 적용된다. 이미 레인이 있는 채팅방의 요청은 기다리지 않고 들어간다.
+        """
+        while True:
+            job = await self._send_queue.get()
+            if job.future.done():
+                continue
+            result = await self._executor.submit(
+                job.chat_id, functools.partial(self._async_send_message, job.message, job.chat_id,
+                                               self._send_semaphore, job.key, job.attachment, job.copy_from))
+            result.add_done_callback(functools.partial(_copy_future_result, target=job.future))
+    
+    async def _enqueue_send(self, message: str, chat_id: str, priority: int, key: Optional[bytes] = None,
+                            attachment: Optional[Attachment] = None,
+                            copy_from: Optional[CopySource] = None) -> DeliveryResult:
+        """전송 대기열에 넣고 결과를 기다림 (대기열이 가득 차면 자리가 날 때까지 대기)"""
+        self._ensure_send_workers()
+        job = SendJob(message, chat_id, key, attachment, copy_from, asyncio.get_running_loop().create_future())
+        await self._send_queue.put(job, priority)
+        return await job.future
+    
+    async def _stop_send_workers(self):
+        dispatcher, self._send_dispatcher = self._send_dispatcher, None
+        if dispatcher is not None:
+            dispatcher.cancel()
+            await asyncio.gather(dispatcher, return_exceptions=True)
+        await self._executor.shutdown()
+    
+    def get_send_queue_stats(self) -> dict:
+        """전송 대기열 길이와 우선순위별 대기 시간 통계"""
+        if not self._loop_thread.is_running():
+            return {**self._send_queue.stats(), "lanes": self._executor.stats()}
+        
+        async def collect():
+            return {**self._send_queue.stats(), "lanes": self._executor.stats()}
+        return self._loop_thread.run(collect(), timeout=5)
+    
+    async def _async_broadcast(self, message: str, chat_ids: list, priority: int = PRIORITY_INTERACTIVE,
+                               attachment: Optional[Attachment] = None, strategy: Optional[str] = None) -> dict:
+        """모든 채팅방에 전송 (전송 대기열을 거쳐 워커가 병렬 처리)"""
+        results = {"success": True, "sent_count": 0, "total_count": len(chat_ids), "errors": [],
+                   "retry_count": 0}
+        copy_from = await self._stage(message, attachment, strategy)
+        
+        outcomes = await asyncio.gather(
+            *(self._enqueue_send(message, chat_id, priority, attachment=attachment, copy_from=copy_from)
+              for chat_id in chat_ids),
+            return_exceptions=True)
+        
+        for chat_id, outcome in zip(chat_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                results["errors"].append(f"채팅방 {chat_id}: {str(outcome)}")
+                results["success"] = False
+                continue
+            
+            results["retry_count"] += outcome.attempts - 1
+            if outcome.success:
+                results["sent_count"] += 1
+            else:
+                results["errors"].append(
+                    f"채팅방 {chat_id}: [{outcome.failure.value}] {outcome.error} ({outcome.attempts}회 시도)")
                 results["success"] = False
         
         return results
     
-    async def _async_send_message(self, message: str, chat_id: str) -> bool:
-        """비동기 메시지 전송"""
+    async def _async_send_message(self, message: str, chat_id: str,
+                                  semaphore: Optional[asyncio.Semaphore] = None,
+                                  key: Optional[bytes] = None,
+                                  attachment: Optional[Attachment] = None,
+                                  copy_from: Optional[CopySource] = None) -> DeliveryResult:
+        """비동기 메시지 전송 (일시적 오류/flood-wait는 백오프 후 재시도)
+        
+        재시도 대기는 semaphore 밖에서 하므로 한 채팅방의 flood-wait가 다른 채팅방 전송을 막지 않는다.
+        key(idempotency 키)가 있으면 전송 직전에 전송 기록을 확인해 이미 보낸 메시지는 건너뛴다.
+        copy_from이 있으면 메시지/첨부 대신 원본 메시지 ID로 복사(전달)한다.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            media = None
+            try:
+                if attachment is not None and copy_from is None:
+                    # 다른 채팅방이 같은 파일을 업로드 중이면 semaphore 밖에서 file_id를 기다림
+                    media = await self._resolve_media(attachment)
+                async with semaphore or contextlib.nullcontext():
+                    # 대부분은 bloom filter에서 끝나고, 있을 수도 있을 때만 기본 키 조회 한 번 (루프 밖에서)
+                    if (key is not None and self.delivery_log and self.delivery_log.might_contain(key)
+                            and await asyncio.to_thread(self.delivery_log.__contains__, key)):
+                        return DeliveryResult(chat_id, True, attempt, duplicate=True)
+                    await self._ensure_bot_initialized()
+                    await self.rate_limiter.acquire(chat_id)
+                    if copy_from is not None:
+                        sent = await self._copy_message(chat_id, copy_from)
+                    elif attachment is None:
+                        sent = await self.bot.send_message(chat_id=chat_id, text=message)
+                    else:
+                        sent = await self._send_media(chat_id, message, attachment, *media)
+                if key is not None and self.delivery_log:
+                    self.delivery_log.add(key)
+                return DeliveryResult(chat_id, True, attempt, message_id=getattr(sent, "message_id", None))
+            except InvalidToken:
+                # 채팅방과 무관한 토큰 오류 - 호출자가 처리 (아웃박스 행은 실패로 기록하지 않고 되돌림)
+                raise
+            except OSError as e:
+                # 첨부 파일을 읽을 수 없음 (재시도해도 같은 결과)
+                return DeliveryResult(chat_id, False, attempt, FailureKind.PERMANENT, str(e))
+            except TelegramError as e:
+                if (media is not None and media[1] is not None and isinstance(e, BadRequest)
+                        and is_file_id_error(e)):
+                    # 캐시된 file_id가 더 이상 유효하지 않음 - 지우고 바로 다시 업로드
+                    # (채팅방을 찾을 수 없음 등 파일과 무관한 오류는 다시 업로드하지 않고 그대로 분류)
+                    await asyncio.to_thread(self.media_cache.discard, self._bot_id, media[0],
+                                            attachment.media_type)
+                    if attempt == 1:
+                        continue
+                failure = classify_error(e)
+                if not self.retry_policy.should_retry(failure, attempt):
+                    print(f"텔레그램 API 오류 (채팅방 {chat_id}): {e}")
+                    return DeliveryResult.failed(chat_id, attempt, e, failure)
+                
+                if failure.kind is FailureKind.FLOOD_WAIT:
+                    self.rate_limiter.defer(chat_id, failure.retry_after)
+                # 기다리는 동안 레인 실행 슬롯을 다른 채팅방에 넘김
+                async with self._executor.idle():
+                    await asyncio.sleep(self.retry_policy.delay(failure, attempt))
+            finally:
+                if media is not None and media[1] is None:
+                    self._finish_upload(media[0], attachment.media_type)
+    
+    async def _resolve_media(self, attachment: Attachment) -> tuple:
+        """(내용 해시, 캐시된 file_id) 반환
+        
+        file_id가 None이면 호출자가 업로드를 맡은 것이고, 끝나면 _finish_upload()를 호출해야 한다.
+        같은 파일을 다른 채팅방이 업로드 중이면 그 업로드가 끝날 때까지 기다린다.
+        """
+        content_hash = await asyncio.to_thread(self.media_cache.content_hash, attachment.path)
+        upload_key = (content_hash, attachment.media_type)
+        while True:
+            # 메모리에 없을 때만 루프 밖에서 저장소 조회 (조회 중 끝난 업로드는 메모리에서 다시 확인)
+            file_id = (self.media_cache.cached(self._bot_id, content_hash, attachment.media_type)
+                       or await asyncio.to_thread(self.media_cache.get, self._bot_id, content_hash,
+                                                  attachment.media_type)
+                       or self.media_cache.cached(self._bot_id, content_hash, attachment.media_type))
+            if file_id is not None:
+                return content_hash, file_id
+            pending = self._uploads.get(upload_key)
+            if pending is None:
+                self._uploads[upload_key] = asyncio.get_running_loop().create_future()
+                return content_hash, None
+            # 업로드가 실패했으면 깨어난 대기자 중 하나가 다시 업로드를 맡음
+            await asyncio.shield(pending)
+    
+    def _finish_upload(self, content_hash: str, media_type: str):
+        pending = self._uploads.pop((content_hash, media_type), None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
+    
+    async def _send_media(self, chat_id: str, caption: str, attachment: Attachment,
+                          content_hash: str, file_id: Optional[str]):
+        """file_id가 있으면 재사용하고, 없으면 파일을 업로드한 뒤 결과 file_id를 캐시"""
+        send = getattr(self.bot, f"send_{attachment.media_type}")
+        if file_id is not None:
+            return await send(chat_id=chat_id, caption=caption or None, **{attachment.media_type: file_id})
+        
+        # 파일을 메모리로 읽지 않고 mmap에서 multipart 본문으로 스트리밍
+        source = self._upload_sources.acquire(attachment.path)
         try:
-            await self.bot.send_message(chat_id=chat_id, text=message)
-            return True
-        except TelegramError as e:
-            print(f"텔레그램 API 오류 (채팅방 {chat_id}): {e}")
-            return False
+            sent = await send(chat_id=chat_id, caption=caption or None,
+                              **{attachment.media_type: StreamingInputFile(source)})
+            size = source.size
+        finally:
+            self._upload_sources.release(attachment.path)
+        file_id = file_id_of(sent, attachment.media_type)
+        if file_id is not None:
+            await asyncio.to_thread(self.media_cache.put, self._bot_id, content_hash, attachment.media_type,
+                                    file_id, size)
+        return sent
+    
+    async def _copy_message(self, chat_id: str, source: CopySource):
+        """스테이징 원본을 채팅방으로 복사(전달) - 본문/첨부를 다시 보내지 않고 메시지 ID만 전송"""
+        if source.forward:
+            return await self.bot.forward_message(chat_id=chat_id, from_chat_id=source.chat_id,
+                                                  message_id=source.message_id)
+        return await self.bot.copy_message(chat_id=chat_id, from_chat_id=source.chat_id,
+                                           message_id=source.message_id)
+    
+    async def _stage(self, message: str, attachment: Optional[Attachment],
+                     strategy: Optional[str] = None, fire_id: Optional[int] = None) -> Optional[CopySource]:
+        """copy / forward 방식이면 스테이징 채팅방에 원본을 한 번 보내고 복사 원본 반환
+        
+        direct 방식이거나 스테이징 전송이 실패하면 None (채팅방마다 직접 전송으로 대체).
+        fire_id가 있으면 원본을 아웃박스에 기록해 같은 실행의 나머지 행과 재시작 후에도 재사용한다.
+        """
+        strategy = strategy or self.broadcast_strategy
+        if strategy == BROADCAST_DIRECT or not self.staging_chat_id:
+            return None
+        forward = strategy == BROADCAST_FORWARD
+        if fire_id is None:
+            return await self._send_staging(message, attachment, forward)
+        
+        # 같은 실행의 행을 동시에 처리해도 원본은 한 번만 보내고, 실행이 끝날 때까지 결과를 재사용
+        pending = self._staging.get(fire_id)
+        if pending is None:
+            pending = self._staging[fire_id] = asyncio.ensure_future(
+                self._load_staging(message, attachment, forward, fire_id))
+            pending.add_done_callback(functools.partial(self._forget_failed_staging, fire_id))
+        return await asyncio.shield(pending)
+    
+    async def _load_staging(self, message: str, attachment: Optional[Attachment], forward: bool,
+                            fire_id: int) -> Optional[CopySource]:
+        """아웃박스에 기록된 원본이 있으면 재사용 (재시작 전에 보낸 원본), 없으면 새로 보냄"""
+        source = await asyncio.to_thread(self.outbox.get_source, fire_id)
+        if source is not None:
+            return CopySource(*source, forward)
+        return await self._send_staging(message, attachment, forward, fire_id)
+    
+    def _forget_failed_staging(self, fire_id: int, future: asyncio.Future):
+        if future.cancelled() or future.exception() is not None:
+            self._staging.pop(fire_id, None)
+    
+    async def _send_staging(self, message: str, attachment: Optional[Attachment], forward: bool,
+                            fire_id: Optional[int] = None) -> Optional[CopySource]:
+        staging_chat_id = self.staging_chat_id
+        result = await self._async_send_message(message, staging_chat_id, self._send_semaphore,
+                                                attachment=attachment)
+        if not result.success or result.message_id is None:
+            print(f"스테이징 채팅방 전송 실패, 직접 전송으로 대체합니다: {result.error}")
+            return None
+        if fire_id is not None:
+            await asyncio.to_thread(self.outbox.set_source, fire_id, staging_chat_id, result.message_id)
+        return CopySource(staging_chat_id, result.message_id, forward)
+    
+    async def _ensure_bot_initialized(self):
+        """루프 안에서 Bot을 한 번만 initialize (httpx 커넥션 풀 생성)"""
+        if self._bot_init_lock is None:
+            self._bot_init_lock = asyncio.Lock()
+        bot = self.bot
+        async with self._bot_init_lock:
+            await bot.initialize()
+        self._bot_verified(bot)
+    
+    def _bot_verified(self, bot: Bot):
+        """getMe로 확인된 Bot이 현재 Bot이면 아웃박스 워커를 시작하거나 깨움 (루프 안에서 호출)"""
+        if bot is self.bot and self._verified_bot is not bot:
+            self._verified_bot = bot
+            self._start_outbox_workers()
+    
+    def _shutdown_bot(self):
+        """기존 Bot의 커넥션 풀 정리"""
+        bot, self.bot = self.bot, None
+        if bot is None or not self._loop_thread.is_running():
+            return
+        try:
+            self._loop_thread.run(bot.shutdown(), timeout=10)
+        except Exception as e:
+            print(f"봇 종료 실패: {e}")
+    
+    def _start_outbox_workers(self):
+        """아웃박스 전송 워커 시작 (이미 실행 중이면 깨우기만 함)"""
+        if not self.outbox:
+            return
+        if self._outbox_future is None or self._outbox_future.done():
+            self._outbox_future = self._loop_thread.submit(self._run_outbox_workers())
+        else:
+            self._wake_outbox_workers()
+    
+    def _wake_outbox_workers(self):
+        """새 행이 기록되었음을 알림 (워커가 아직 없으면 봇 확인을 시작하고, 확인이 끝나면 워커가 시작됨)"""
+        if (self._outbox_future is None or self._outbox_future.done()) and self.bot is not None:
+            self._loop_thread.submit(self._ensure_bot_initialized()).add_done_callback(
+                lambda future: future.cancelled() or future.exception())
+            return
+        wakeup = self._outbox_wakeup
+        if wakeup is not None and self._loop_thread.is_running():
+            self._loop_thread.loop.call_soon_threadsafe(wakeup.set)
+    
+    async def _run_outbox_workers(self):
+        """아웃박스 행을 가져가 전송 대기열(대량 우선순위)에 넣음
+        
+        OUTBOX_IN_FLIGHT개까지 행별 태스크로 동시에 전송하고, 끝난 행만큼 자리가 나면 더 가져온다.
+        재시도/flood-wait로 오래 걸리는 행은 자리 하나만 차지하므로 다른 행과 새 실행은 계속 전송된다.
+        봇이 없거나 getMe로 확인되지 않았으면 행을 가져가지 않고 기다린다.
+        """
+        self._outbox_wakeup = asyncio.Event()
+        self._outbox_recorded = asyncio.Event()
+        recorder = asyncio.create_task(self._outbox_recorder())
+        tasks = set()
+        
+        def on_done(task):
+            tasks.discard(task)
+            self._outbox_wakeup.set()
+        
+        try:
+            while True:
+                self._outbox_wakeup.clear()
+                room = OUTBOX_IN_FLIGHT - len(tasks)
+                # 자리가 조금씩 날 때마다 가져가지 않고 OUTBOX_CLAIM_SIZE개씩 모아서 가져감
+                if (not self.bot or self._verified_bot is not self.bot
+                        or (tasks and room < OUTBOX_CLAIM_SIZE)):
+                    items = []
+                else:
+                    items = await asyncio.to_thread(self.outbox.claim, min(room, OUTBOX_CLAIM_SIZE))
+                if not items:
+                    await self._outbox_wakeup.wait()
+                    continue
+                for item in items:
+                    task = asyncio.create_task(self._deliver_outbox_item(item))
+                    tasks.add(task)
+                    task.add_done_callback(on_done)
+        finally:
+            for task in (*tasks, recorder):
+                task.cancel()
+            self._outbox_wakeup = None
     
-    def add_scheduled_message(self, message: str, time_str: str, interval: str = "daily"):
-        """스케줄된 메시지 추가"""
-        schedule_id = len(self.scheduled_messages)
-        
-        def job():
-            self._send_scheduled_message(message, schedule_id)
-        
-        # 스케줄 설정
-        if interval == "daily":
-            schedule.every().day.at(time_str).do(job)
-        elif interval == "hourly":
-            schedule.every().hour.at(f":{time_str.split(':')[1]}").do(job)
-        elif interval == "weekly":
-            schedule.every().monday.at(time_str).do(job)
-        
-        self.scheduled_messages.append({
-            'id': schedule_id,
-            'message': message,
-            'time': time_str,
-            'interval': interval,
-            'enabled': True
+    async def _deliver_outbox_item(self, item):
+        """아웃박스 행 하나를 전송하고 결과를 기록 대기열에 넣음"""
+        attachment = _attachment_of(item.media_type, item.media_path)
+        try:
+            # 복사/전달 방식이면 실행별로 스테이징 원본을 한 번만 만들어 둠
+            copy_from = await self._stage(item.message, attachment, fire_id=item.fire_id)
+            outcome = await self._enqueue_send(item.message, item.chat_id, PRIORITY_BULK,
+                                               idempotency_key(item.schedule_id, item.fire_time, item.chat_id),
+                                               attachment, copy_from)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self.bot is None or isinstance(e, InvalidToken):
+                # 전송 중 봇이 바뀌었거나 토큰이 거부되어 처리하지 못한 행은 다시 대기 상태로
+                # (행 자체의 실패가 아니므로 다시 연결한 뒤 이어서 전송)
+                if isinstance(e, InvalidToken) and self._verified_bot is self.bot:
+                    self._verified_bot = None
+                await asyncio.to_thread(self.outbox.release, [item.id])
+                return
+            # 예상하지 못한 오류는 실패로 기록 (다시 가져가 같은 오류를 반복하지 않도록)
+            result = (item.id, False, 1, f"전송 실패: {e}")
+        else:
+            if outcome.success:
+                result = (item.id, True, outcome.attempts, "")
+            else:
+                result = (item.id, False, outcome.attempts,
+                          f"[{outcome.failure.value}] {outcome.error} ({outcome.attempts}회 시도)")
+        self._outbox_results.append(result)
+        self._outbox_recorded.set()
+    
+    async def _outbox_recorder(self):
+        """끝난 행 결과를 기록 (이전 기록이 끝나는 동안 끝난 행을 모아 한 트랜잭션으로)"""
+        while True:
+            await self._outbox_recorded.wait()
+            self._outbox_recorded.clear()
+            results, self._outbox_results = self._outbox_results, []
+            try:
+                summaries = await asyncio.to_thread(self._record_outbox_results, results)
+            except Exception as e:
+                # 기록하지 못한 행은 CLAIMED로 남아 재시작 시 다시 전송됨 (전송 기록이 중복을 막음)
+                print(f"아웃박스 결과 기록 실패: {e}")
+                continue
+            for summary in summaries:
+                self._notify_fire_completed(summary)
+    
+    def _record_outbox_results(self, results: list) -> list:
+        """전송 기록을 먼저 저장한 뒤 아웃박스 행을 완료 처리 (순서가 바뀌면 재시작 시 중복 전송)"""
+        self.delivery_log.flush()
+        return self.outbox.complete(results) if results else []
+    
+    def _notify_fire_completed(self, summary: FireSummary):
+        """아웃박스에 기록된 실행 한 번의 모든 행이 끝났을 때 결과 알림"""
+        self._staging.pop(summary.fire_id, None)
+        self._notify_scheduled_sent(summary.message, summary.schedule_id, {
+            'success': not summary.errors,
+            'sent_count': summary.sent_count,
+            'total_count': summary.total_count,
+            'errors': summary.errors,
+            'retry_count': summary.retry_count,
         })
+    
+    def shutdown(self):
+        """스케줄러, 아웃박스 워커, Bot, 이벤트 루프 정리
+        
+        전송 중이던 아웃박스 행은 다음 시작 시 다시 대기 상태가 되어 이어서 전송된다.
+        """
+        self.is_running = False
+        self._scheduler.stop(timeout=5)
+        if self._connect_future is not None:
+            self._connect_future.cancel()
+            self._connect_future = None
+        if self._outbox_future is not None:
+            self._outbox_future.cancel()
+            self._outbox_future = None
+        if self._loop_thread.is_running():
+            try:
+                self._loop_thread.run(self._stop_send_workers(), timeout=5)
+            except Exception as e:
+                print(f"전송 워커 종료 실패: {e}")
+        self._shutdown_bot()
+        self._loop_thread.stop()
+        if self._load_timer is not None:
+            self._load_timer.cancel()
+        if self.outbox:
+            # 루프가 멈춘 뒤 아직 기록하지 못한 결과를 남김 (기록하지 못한 행은 재시작 시 다시 전송)
+            results, self._outbox_results = self._outbox_results, []
+            try:
+                self._record_outbox_results(results)
+            except Exception as e:
+                print(f"아웃박스 결과 기록 실패: {e}")
+            self.outbox.close()
+            self.outbox = None
+        if self.delivery_log:
+            self.delivery_log.close()
+            self.delivery_log = None
+        self.media_cache.close()
+        self.bot_info_cache.close()
+        if self.storage:
+            self.storage.close()
+            self.storage = None
+    
+    def add_scheduled_message(self, message: str, time_str: str, interval: str = "daily",
+                              misfire: str = MISFIRE_COALESCE, grace_time: int = DEFAULT_GRACE_TIME,
+                              media_path: Optional[str] = None,
+                              media_type: Optional[str] = None) -> ScheduledMessage:
+        """스케줄된 메시지 추가 후 레코드 반환
+        
+        misfire: 절전/재시작 등으로 실행 시각을 놓쳤을 때 처리 방식 (skip / coalesce / all)
+        grace_time: 이 시간(초) 이내로 늦은 실행은 정상 실행으로 간주
+        media_path / media_type: 첨부 파일과 종류 (photo / document / video), message는 캡션이 됨
+        """
+        # 지원하지 않는 주기/시간/정책/첨부 종류이면 ValueError
+        trigger = Trigger.from_time_str(interval, time_str)
+        policy = MisfirePolicy.of(misfire, grace_time)
+        attachment = Attachment(media_type or MEDIA_DOCUMENT, media_path) if media_path else None
+        record = ScheduledMessage(self.schedules.new_id(), message, trigger.hour, trigger.minute,
+                                  trigger.interval, misfire=policy.mode, grace_time=grace_time,
+                                  media_type=attachment and attachment.media_type,
+                                  media_path=attachment and attachment.path)
+        self.schedules.add(record)
+        handle = self._register_job(record)
+        self.schedules.set_next_fire(record.id, self._scheduler.deadline_of(handle))
         
         if self._callback:
-            self._callback('message_added', self.scheduled_messages[-1])
+            self._callback('message_added', record)
+        return record
     
-    def _send_scheduled_message(self, message: str, schedule_id: int):
-        """스케줄된 메시지 전송"""
-        results = self.send_message(message)
+    def _register_job(self, record: ScheduledMessage, deadline: Optional[float] = None) -> Any:
+        """레코드를 스케줄러 작업으로 등록 (deadline이 지났으면 misfire 정책 적용)"""
+        trigger = Trigger.of(record.interval, record.hour, record.minute)
+        policy = MisfirePolicy.of(record.misfire, record.grace_time)
+        # 작업마다 클로저를 만들지 않고 공유 디스패처에 스케줄 ID만 넘김
+        handle = self._jobs[record.id] = self._scheduler.add(trigger, self._dispatch, record.id, policy, deadline)
+        return handle
+    
+    def _load_due_schedules(self):
+        """저장소에서 곧 실행될 스케줄만 불러와 스케줄러에 등록 (next_fire 인덱스 사용)
+        
+        시작할 때 전체를 읽지 않고 LOAD_AHEAD 구간씩 나누어 올리며, 다음 구간은 현재 구간이
+        끝나기 전에 미리 불러온다. 재시작 전에 지난 실행은 misfire 정책으로 처리된다.
+        """
+        if not self.storage:
+            return
+        for record, next_fire in self.schedules.load_window(time.time() + LOAD_AHEAD):
+            self._register_job(record, next_fire)
         
+        self._load_timer = threading.Timer(LOAD_AHEAD / 2, self._load_due_schedules)
+        self._load_timer.daemon = True
+        self._load_timer.start()
+    
+    def _dispatch_scheduled(self, schedule_id: int):
+        """스케줄러 작업 실행 - ID로 레코드를 찾아 전송"""
+        record = self.schedules.get(schedule_id)
+        if record is None or not record.enabled:
+            return
+        self._send_scheduled_message(record.message, schedule_id,
+                                     _attachment_of(record.media_type, record.media_path))
+    
+    def _send_scheduled_message(self, message: str, schedule_id: int,
+                                attachment: Optional[Attachment] = None):
+        """스케줄된 메시지 전송 (아웃박스가 있으면 행만 기록하고 전송은 워커가 처리)"""
+        # 엔진이 실행 전에 다음 실행 시각으로 다시 등록해 두었으므로 인덱스도 갱신
+        handle = self._jobs.get(schedule_id)
+        fire_time = time.time()
+        if handle is not None:
+            fire_time = self._scheduler.fired_at(handle) or fire_time
+            self.schedules.set_next_fire(schedule_id, self._scheduler.deadline_of(handle))
+        
+        if self.outbox and self.chat_ids:
+            # 모든 채팅방 행을 한 트랜잭션으로 기록 (봇이 아직 없으면 연결된 뒤 전송)
+            self.outbox.enqueue(schedule_id, fire_time, message, list(self.chat_ids),
+                                attachment and attachment.media_type, attachment and attachment.path)
+            self._wake_outbox_workers()
+            return
+        
+        # 스케줄러 스레드는 전송을 기다리지 않고 다음 작업으로 넘어감
+        if not self.bot or not self.chat_ids:
+            self._notify_scheduled_sent(message, schedule_id,
+                                        self.send_message(message, PRIORITY_BULK, attachment))
+            return
+        self._loop_thread.submit(self._async_send_scheduled(message, schedule_id, attachment))
+    
+    async def _async_send_scheduled(self, message: str, schedule_id: int,
+                                    attachment: Optional[Attachment] = None):
+        try:
+            results = await self._async_broadcast(message, list(self.chat_ids), PRIORITY_BULK, attachment)
+        except Exception as e:
+            results = {"success": False, "sent_count": 0, "total_count": len(self.chat_ids),
+                       "errors": [f"전송 실패: {e}"]}
+        self._notify_scheduled_sent(message, schedule_id, results)
+    
+    def _notify_scheduled_sent(self, message: str, schedule_id: int, results: dict):
         if self._callback:
             self._callback('message_sent', {
                 'schedule_id': schedule_id,
@@ -117,13 +869,16 @@ class TelegramModel:
                 'sent_count': results['sent_count'],
                 'total_count': results['total_count'],
                 'errors': results['errors'],
+                'retry_count': results.get('retry_count', 0),
                 'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             })
     
     def remove_scheduled_message(self, schedule_id: int):
         """스케줄된 메시지 제거"""
-        schedule.clear()
-        self.scheduled_messages = [msg for msg in self.scheduled_messages if msg['id'] != schedule_id]
+        job = self._jobs.pop(schedule_id, None)
+        if job is not None:
+            self._scheduler.cancel(job)
+        self.schedules.remove(schedule_id)
         
         if self._callback:
             self._callback('message_removed', schedule_id)
@@ -131,28 +886,40 @@ class TelegramModel:
     def start_scheduler(self):
         """스케줄러 시작"""
         self.is_running = True
+        if self.storage:
+            self.storage.set_state('scheduler_running', '1')
         if self._callback:
             self._callback('scheduler_started', None)
         
-        def run_scheduler():
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(1)
-        
-        import threading
-        self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        self.scheduler_thread.start()
+        self._scheduler.start()
     
     def stop_scheduler(self):
         """스케줄러 중지"""
         self.is_running = False
-        schedule.clear()
+        self._scheduler.stop(timeout=5)
+        if self.storage:
+            self.storage.set_state('scheduler_running', '0')
         if self._callback:
             self._callback('scheduler_stopped', None)
     
     def get_scheduled_messages(self):
-        """스케줄된 메시지 목록 반환"""
-        return self.scheduled_messages
+        """스케줄된 메시지 목록 반환 (ID 순, 저장소 전체를 읽으므로 목록 화면은 페이지 조회 사용)"""
+        return list(self.schedules)
+    
+    def get_scheduled_message(self, schedule_id: int) -> Optional[ScheduledMessage]:
+        """ID로 스케줄된 메시지 조회"""
+        return self.schedules.get(schedule_id)
+    
+    def get_scheduled_messages_page(self, offset: int, limit: int) -> List[ScheduledMessage]:
+        """ID 순으로 offset번째부터 limit개 반환 (목록 화면용 페이지 조회)"""
+        return self.schedules.page(offset, limit)
+    
+    def count_scheduled_messages(self) -> int:
+        return len(self.schedules)
+    
+    def was_scheduler_running(self) -> bool:
+        """지난 실행 종료 시점에 스케줄러가 실행 중이었는지 여부 (저장소 기준)"""
+        return bool(self.storage) and self.storage.get_state('scheduler_running') == '1'
     
     def get_chat_ids(self):
         """등록된 채팅방 ID 목록 반환"""
@@ -0,0 +1,247 @@
+import math
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from models.scheduler import MisfirePolicy, SchedulerEngine, Trigger, fire_times
+
+# (한 칸의 길이(초), 칸 수) - 초 / 분 / 시 / 일 바퀴 (8일 이후는 overflow 칸)
+WHEEL_LEVELS = ((1, 60), (60, 60), (3600, 24), (86400, 8))
+OVERFLOW_LEVEL = len(WHEEL_LEVELS)
+
+# 칸에 들어 있지 않은 슬롯 / 아직 실행되지 않은 작업의 fired_at
+NO_BUCKET = -1
+NOT_FIRED = math.nan
+
+
+class TimingWheelScheduler(SchedulerEngine):
+    """계층형 타이밍 휠 스케줄러 (초/분/시/일 바퀴)
+
+    작업은 실행 시각까지 남은 시간에 맞는 바퀴의 칸에 들어가고, 상위 바퀴의 칸은 그 칸의
+    시작 시각이 되면 하위 바퀴로 내려온다. 해상도는 1초.
+    작업마다 객체를 만들지 않고 슬롯 번호로 array 열에 보관하며, 칸도 슬롯 번호 array다.
+    (트리거, 콜백, misfire 정책) 조합은 몇 개뿐이므로 한 번만 보관하고 번호로 가리킨다.
+    슬롯마다 칸 안의 위치를 기억해 두므로 등록/취소는 O(1)이다. add()는 슬롯 번호를 핸들로 돌려준다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        super().__init__(clock)
+        # 칸 번호는 바퀴별 칸을 이어 붙인 순서, 마지막 칸이 overflow
+        self._offsets = [sum(size for _, size in WHEEL_LEVELS[:level]) for level in range(OVERFLOW_LEVEL)]
+        self._overflow = sum(size for _, size in WHEEL_LEVELS)
+        self._bucket_levels = array("b", [level for level, (_, size) in enumerate(WHEEL_LEVELS)
+                                          for _ in range(size)] + [OVERFLOW_LEVEL])
+        self._buckets: List[array] = []
+        self._counts: List[int] = []
+
+        # 슬롯별 열 (specs가 -1이면 빈 슬롯)
+        self._deadlines = array("d")
+        self._fired = array("d")
+        self._specs = array("i")
+        self._keys: List[Any] = []
+        self._bucket_of = array("i")
+        self._positions = array("i")
+        self._free = array("i")
+        # (트리거, 콜백, misfire 정책) <-> 번호
+        self._spec_list: List[Tuple[Trigger, Callable[[Any], None], MisfirePolicy]] = []
+        self._spec_ids: Dict[tuple, int] = {}
+
+        # 마지막으로 처리한 시각(초)
+        self._tick = int(clock())
+        self._size = 0
+        self._reset_buckets()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reset_buckets(self):
+        self._buckets = [array("i") for _ in range(self._overflow + 1)]
+        self._counts = [0] * (OVERFLOW_LEVEL + 1)
+
+    def _new_job(self, trigger: Trigger, callback: Callable[[Any], None], key: Any, deadline: float,
+                 misfire: MisfirePolicy) -> int:
+        spec = (trigger, callback, misfire)
+        spec_id = self._spec_ids.get(spec)
+        if spec_id is None:
+            spec_id = self._spec_ids[spec] = len(self._spec_list)
+            self._spec_list.append(spec)
+
+        if self._free:
+            slot = self._free.pop()
+            self._deadlines[slot] = deadline
+            self._fired[slot] = NOT_FIRED
+            self._specs[slot] = spec_id
+            self._keys[slot] = key
+        else:
+            slot = len(self._specs)
+            self._deadlines.append(deadline)
+            self._fired.append(NOT_FIRED)
+            self._specs.append(spec_id)
+            self._keys.append(key)
+            self._bucket_of.append(NO_BUCKET)
+            self._positions.append(0)
+        return slot
+
+    def deadline_of(self, slot: int) -> float:
+        return self._deadlines[slot]
+
+    def fired_at(self, slot: int) -> Optional[float]:
+        fired = self._fired[slot]
+        return None if math.isnan(fired) else fired
+
+    def _place(self, slot: int, base: int):
+        """아직 처리하지 않은 첫 시각 base를 기준으로 슬롯이 들어갈 칸 결정"""
+        tick = max(math.ceil(self._deadlines[slot]), base)
+        for level, (span, size) in enumerate(WHEEL_LEVELS):
+            if tick // span - (-(-base // span)) < size:
+                bucket_id = self._offsets[level] + (tick // span) % size
+                break
+        else:
+            level, bucket_id = OVERFLOW_LEVEL, self._overflow
+
+        bucket = self._buckets[bucket_id]
+        self._bucket_of[slot] = bucket_id
+        self._positions[slot] = len(bucket)
+        bucket.append(slot)
+        self._counts[level] += 1
+
+    def _unlink(self, slot: int):
+        """칸에서 슬롯을 빼고 마지막 슬롯을 그 자리로 옮김 (O(1))"""
+        bucket_id = self._bucket_of[slot]
+        bucket = self._buckets[bucket_id]
+        last = bucket.pop()
+        if last != slot:
+            position = self._positions[slot]
+            bucket[position] = last
+            self._positions[last] = position
+        self._bucket_of[slot] = NO_BUCKET
+        self._counts[self._bucket_levels[bucket_id]] -= 1
+
+    def _insert(self, slot: int):
+        self._place(slot, self._tick + 1)
+        self._size += 1
+
+    def _remove(self, slot: int) -> bool:
+        if slot >= len(self._specs) or self._specs[slot] < 0:
+            return False
+        if self._bucket_of[slot] != NO_BUCKET:
+            self._unlink(slot)
+            self._size -= 1
+        self._specs[slot] = -1
+        self._keys[slot] = None
+        self._free.append(slot)
+        return True
+
+    def _clear(self):
+        self._reset_buckets()
+        for column in (self._deadlines, self._fired, self._specs, self._bucket_of, self._positions, self._free):
+            del column[:]
+        self._keys.clear()
+        self._size = 0
+
+    def _next_event_tick(self, after: int) -> Optional[int]:
+        """after 이후 무언가 처리해야 하는 첫 시각 (칸 내림 또는 실행)"""
+        if self._counts[0]:
+            higher = any(self._counts[1:])
+            seconds = self._buckets
+            for tick in range(after + 1, after + 61):
+                if higher and tick % 60 == 0:
+                    return tick
+                if seconds[tick % 60]:
+                    return tick
+
+        # 비어 있지 않은 가장 낮은 상위 바퀴의 다음 칸 시작 시각 (overflow는 일 단위로 확인)
+        for level in range(1, OVERFLOW_LEVEL):
+            if self._counts[level] or (level == OVERFLOW_LEVEL - 1 and self._counts[OVERFLOW_LEVEL]):
+                span = WHEEL_LEVELS[level][0]
+                return (after // span + 1) * span
+        return None
+
+    def _move_bucket(self, bucket_id: int, tick: int):
+        slots = self._buckets[bucket_id]
+        self._buckets[bucket_id] = array("i")
+        self._counts[self._bucket_levels[bucket_id]] -= len(slots)
+        for slot in slots:
+            self._place(slot, tick)
+
+    def _cascade(self, tick: int):
+        """tick이 상위 바퀴 칸의 시작 시각이면 그 칸의 작업을 하위 바퀴로 내림"""
+        if tick % 86400 == 0 and self._counts[OVERFLOW_LEVEL]:
+            self._move_bucket(self._overflow, tick)
+
+        for level in range(OVERFLOW_LEVEL - 1, 0, -1):
+            span, size = WHEEL_LEVELS[level]
+            if tick % span:
+                continue
+            bucket_id = self._offsets[level] + (tick // span) % size
+            if self._buckets[bucket_id]:
+                self._move_bucket(bucket_id, tick)
+
+    def _rebuild(self, target: int) -> List[int]:
+        """오래 멈춰 있었던 경우 칸을 하나씩 넘기지 않고 전체를 한 번에 다시 배치"""
+        slots = [slot for bucket in self._buckets for slot in bucket]
+        self._reset_buckets()
+        self._tick = target
+
+        due = []
+        for slot in slots:
+            if math.ceil(self._deadlines[slot]) <= target:
+                self._bucket_of[slot] = NO_BUCKET
+                self._size -= 1
+                due.append(slot)
+            else:
+                self._place(slot, target + 1)
+        return due
+
+    def _collect_due(self, now: float) -> List[int]:
+        target = int(now)
+        if target - self._tick > 86400:
+            return self._rebuild(target)
+
+        due = []
+        while self._tick < target:
+            tick = self._next_event_tick(self._tick)
+            if tick is None or tick > target:
+                self._tick = target
+                break
+
+            self._cascade(tick)
+            self._tick = tick
+            bucket = self._buckets[tick % 60]
+            if bucket:
+                self._buckets[tick % 60] = array("i")
+                self._counts[0] -= len(bucket)
+                self._size -= len(bucket)
+                for slot in bucket:
+                    self._bucket_of[slot] = NO_BUCKET
+                due.extend(bucket)
+        return due
+
+    def _next_wakeup(self) -> Optional[float]:
+        tick = self._next_event_tick(self._tick)
+        return None if tick is None else float(tick)
+
+    def _take_due(self, now: float) -> List[Tuple[int, Callable[[Any], None], Any, float]]:
+        """실행할 (슬롯, 콜백, key, 예정 시각)을 꺼내고 슬롯을 다음 실행 시각으로 다시 등록
+
+        콜백과 key는 락 안에서 꺼내 두므로 실행 전에 작업이 취소되어 슬롯이 재사용되어도 섞이지 않는다.
+        """
+        due = []
+        for slot in self._collect_due(now):
+            trigger, callback, misfire = self._spec_list[self._specs[slot]]
+            deadline = self._deadlines[slot]
+            key = self._keys[slot]
+            due.extend((slot, callback, key, fire_time)
+                       for fire_time in fire_times(trigger, misfire, deadline, now))
+            self._deadlines[slot] = trigger.next_after(max(deadline, now))
+            self._insert(slot)
+        return due
+
+    def _run_jobs(self, jobs: List[Tuple[int, Callable[[Any], None], Any, float]]):
+        for slot, callback, key, fire_time in jobs:
+            if self._keys[slot] is key:
+                self._fired[slot] = fire_time
+            try:
+                callback(key)
+            except Exception as e:
+                print(f"스케줄 작업 실행 오류: {e}")
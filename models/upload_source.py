@@ -0,0 +1,117 @@
+import io
+import mmap
+import os
+import threading
+from typing import Dict, Optional
+
+from telegram import InputFile
+
+
+class MappedFile:
+    """읽기 전용 mmap으로 연 첨부 파일 (여러 전송이 같은 매핑을 공유)
+
+    파일 내용은 운영체제 페이지 캐시에 남고 프로세스 메모리로 복사되지 않는다.
+    전송마다 reader()로 위치가 독립적인 읽기 객체를 만들어 쓴다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = os.path.basename(path)
+        with open(path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # 빈 파일은 mmap할 수 없음
+            self._map: Optional[mmap.mmap] = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                                              if self.size else None)
+
+    def reader(self) -> "MappedReader":
+        return MappedReader(self)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class MappedReader(io.RawIOBase):
+    """MappedFile 위의 파일 객체 (httpx가 64KB씩 읽어 multipart 본문으로 스트리밍)"""
+
+    def __init__(self, source: MappedFile):
+        super().__init__()
+        self._source = source
+        self._pos = 0
+        self.name = source.name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._source.size
+        self._pos = min(max(0, offset), self._source.size)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = self._source.size if size is None or size < 0 else min(self._pos + size, self._source.size)
+        if self._source._map is None or end <= self._pos:
+            return b""
+        chunk = self._source._map[self._pos:end]
+        self._pos = end
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class StreamingInputFile(InputFile):
+    """파일을 미리 읽지 않고 전송할 때 MappedFile에서 스트리밍하는 InputFile
+
+    python-telegram-bot의 InputFile은 파일 전체를 bytes로 읽어 두므로, 내용 대신 파일 객체를
+    multipart 필드로 넘겨 httpx가 나누어 읽게 한다.
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: MappedFile, filename: Optional[str] = None):
+        super().__init__(b"", filename=filename or source.name)
+        self._source = source
+
+    @property
+    def field_tuple(self):
+        return self.filename, self._source.reader(), self.mimetype
+
+
+class UploadSources:
+    """경로별 MappedFile 공유 (동시에 여러 전송이 같은 파일을 올려도 한 번만 열고, 마지막 사용자가 닫음)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: Dict[str, MappedFile] = {}
+        self._refs: Dict[str, int] = {}
+
+    def acquire(self, path: str) -> MappedFile:
+        with self._lock:
+            source = self._files.get(path)
+            if source is None:
+                source = self._files[path] = MappedFile(path)
+            self._refs[path] = self._refs.get(path, 0) + 1
+            return source
+
+    def release(self, path: str):
+        with self._lock:
+            self._refs[path] -= 1
+            if not self._refs[path]:
+                del self._refs[path]
+                self._files.pop(path).close()
+
+    def __len__(self) -> int:
+        return len(self._files)
@@ -0,0 +1,28 @@
+import pytest
+
+from benchmarks.fake_bot_api import FakeBotAPI
+from models.telegram_model import TelegramModel
+
+
+@pytest.fixture
+def fake_api():
+    """테스트마다 새로 띄우는 가짜 Bot API 서버"""
+    with FakeBotAPI() as server:
+        yield server
+
+
+@pytest.fixture
+def make_model(tmp_path, fake_api):
+    """가짜 서버를 가리키고 전송 한도를 푼 TelegramModel 생성 (테스트가 끝나면 정리)"""
+    models = []
+
+    def make(**kwargs):
+        kwargs.setdefault("db_path", str(tmp_path / "model.db"))
+        model = TelegramModel(base_url=fake_api.base_url, **kwargs)
+        model.set_rate_limits(1e9, 1e9, 1e9)
+        models.append(model)
+        return model
+
+    yield make
+    for model in models:
+        model.shutdown()
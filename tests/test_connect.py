@@ -0,0 +1,108 @@
+import sqlite3
+import threading
+import time
+
+from models.outbox import PENDING, DONE
+
+
+class Events:
+    """Model 콜백을 받아 두고 원하는 이벤트가 올 때까지 기다림 (다른 이벤트는 순서대로 남겨 둠)"""
+
+    def __init__(self, model):
+        self._condition = threading.Condition()
+        self.received = []
+        model.set_callback(self._on_event)
+
+    def _on_event(self, event_type, data):
+        with self._condition:
+            self.received.append((event_type, data))
+            self._condition.notify_all()
+
+    def wait(self, event_type, timeout=10):
+        with self._condition:
+            for _ in range(2):
+                for index, (received, data) in enumerate(self.received):
+                    if received == event_type:
+                        del self.received[index]
+                        return data
+                self._condition.wait_for(lambda: any(received == event_type for received, _ in self.received),
+                                         timeout)
+        raise AssertionError(f"{event_type} 이벤트가 오지 않음")
+
+
+def outbox_statuses(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT status FROM outbox ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_token_is_checked_on_every_connect_and_chats_come_from_cache(make_model, fake_api):
+    model = make_model()
+    model.set_chat_ids(["1", "-100"])
+    events = Events(model)
+
+    model.connect("1:token")
+    first = events.wait("connect_finished")
+    assert first["success"] and not first["from_cache"]
+    assert {info.chat_id for info in first["chats"]} == {"1", "-100"}
+
+    fake_api.reset_stats()
+    model.connect("1:token")
+    second = events.wait("connect_finished")
+    assert second["success"] and second["from_cache"]
+    assert fake_api.requests == {"getMe": 1}
+    assert second["generation"] == model.connect_generation == 2
+
+
+def test_events_from_previous_connect_are_dropped(make_model, fake_api):
+    fake_api.latency = 0.05
+    model = make_model()
+    model.set_chat_ids(["1", "2", "3"])
+    events = Events(model)
+
+    model.connect("1:token", refresh=True)
+    model.connect("1:token", refresh=True)
+    finished = events.wait("connect_finished")
+    assert finished["generation"] == model.connect_generation
+    time.sleep(0.3)
+    assert all(data["generation"] == model.connect_generation for _, data in events.received)
+
+
+def test_rejected_token_leaves_pending_outbox_rows(make_model, fake_api, tmp_path):
+    fake_api.token = "1:good"
+    model = make_model()
+    model.set_chat_ids(["1", "2"])
+    model.outbox.enqueue(1, time.time(), "hello", ["1", "2"])
+    events = Events(model)
+
+    model.connect("1:typo")
+    assert not events.wait("connect_finished")["success"]
+    time.sleep(0.2)
+    assert model.bot is None
+    assert outbox_statuses(str(tmp_path / "model.db")) == [PENDING, PENDING]
+
+    model.connect("1:good")
+    assert events.wait("connect_finished")["success"]
+    assert events.wait("message_sent")["sent_count"] == 2
+    assert outbox_statuses(str(tmp_path / "model.db")) == [DONE, DONE]
+
+
+def test_revoked_token_releases_claimed_rows(make_model, fake_api, tmp_path):
+    fake_api.token = "1:good"
+    model = make_model()
+    model.set_chat_ids(["1"])
+    events = Events(model)
+    model.connect("1:good")
+    assert events.wait("connect_finished")["success"]
+
+    # 연결 후 토큰이 폐기되면 행은 실패가 아니라 대기 상태로 돌아감
+    fake_api.token = "1:new"
+    model.outbox.enqueue(1, time.time(), "hello", ["1"])
+    model._wake_outbox_workers()
+    deadline = time.monotonic() + 5
+    while fake_api.errors[401] == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    time.sleep(0.2)
+    assert outbox_statuses(str(tmp_path / "model.db")) == [PENDING]
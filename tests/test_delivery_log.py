@@ -0,0 +1,125 @@
+import sqlite3
+import threading
+import time
+
+from models.delivery_log import DeliveryLog, idempotency_key
+
+
+def test_idempotency_key_ignores_sub_second_jitter():
+    assert idempotency_key(1, 100.2, "5") == idempotency_key(1, 99.9, "5")
+    assert idempotency_key(1, 100.0, "5") != idempotency_key(1, 100.0, "6")
+    assert len(idempotency_key(1, 100.0, "5")) == 16
+
+
+def test_membership_before_and_after_flush(tmp_path):
+    log = DeliveryLog(str(tmp_path / "log.db"), capacity=1000)
+    key = idempotency_key(1, 100.0, "5")
+    assert key not in log
+    assert not log.might_contain(key)
+
+    log.add(key)
+    assert key in log and log.might_contain(key)
+    log.flush()
+    assert key in log
+    assert idempotency_key(1, 100.0, "6") not in log
+    assert len(log) == 1
+    log.close()
+
+
+def test_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "log.db")
+    keys = [idempotency_key(1, 100.0, str(chat_id)) for chat_id in range(500)]
+    log = DeliveryLog(path, capacity=1000)
+    for key in keys:
+        log.add(key)
+    log.close()
+
+    log = DeliveryLog(path, capacity=1000)
+    assert all(key in log and log.might_contain(key) for key in keys)
+    assert idempotency_key(2, 100.0, "1") not in log
+    log.close()
+
+
+def test_replays_rows_written_after_last_save(tmp_path):
+    path = str(tmp_path / "log.db")
+    log = DeliveryLog(path, capacity=1000)
+    log.add(idempotency_key(1, 0.0, "1"))
+    log.close()
+
+    # 비정상 종료: flush만 되고 filter 비트는 저장되지 않음
+    log = DeliveryLog(path, capacity=1000)
+    late = idempotency_key(1, 0.0, "2")
+    log.add(late)
+    log.flush()
+
+    reopened = DeliveryLog(path, capacity=1000)
+    assert reopened.might_contain(late) and late in reopened
+    assert idempotency_key(1, 0.0, "1") in reopened
+    reopened.close()
+    log.close()
+
+
+def test_capacity_change_rebuilds_filters(tmp_path):
+    path = str(tmp_path / "log.db")
+    log = DeliveryLog(path, capacity=1000)
+    key = idempotency_key(1, 0.0, "1")
+    log.add(key)
+    log.close()
+
+    log = DeliveryLog(path, capacity=50_000)
+    assert key in log
+    log.close()
+
+
+def test_oldest_generation_expires(tmp_path):
+    log = DeliveryLog(str(tmp_path / "log.db"), capacity=1000, generation_span=1000, generations=2)
+    old = idempotency_key(1, 0.0, "1")
+    log.add(old)
+    log.flush()
+
+    log.add(idempotency_key(1, 0.0, "2"), delivered_at=time.time() + 2000)
+    assert old not in log
+    log.close()
+
+
+def stored_keys(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {row[0] for row in conn.execute("SELECT key FROM deliveries")}
+    finally:
+        conn.close()
+
+
+def test_expired_rows_are_deleted_by_flush(tmp_path):
+    path = str(tmp_path / "log.db")
+    log = DeliveryLog(path, capacity=1000, generation_span=1000, generations=2)
+    old, new = idempotency_key(1, 0.0, "1"), idempotency_key(1, 0.0, "2")
+    log.add(old)
+    log.flush()
+
+    # 세대 교체는 메모리에서만 일어나고, 기록 삭제는 다음 flush()에서 함께 처리
+    log.add(new, delivered_at=time.time() + 2000)
+    assert stored_keys(path) == {old}
+    log.flush()
+    assert stored_keys(path) == {new}
+    log.close()
+
+
+def test_loop_calls_do_not_wait_for_sqlite(tmp_path):
+    log = DeliveryLog(str(tmp_path / "log.db"), capacity=1000)
+    key = idempotency_key(1, 0.0, "1")
+    log.add(key)
+    flushed = threading.Event()
+
+    # 다른 스레드가 SQLite를 쓰는 동안에도 filter 확인과 기록은 바로 끝나야 함
+    with log._db_lock:
+        flusher = threading.Thread(target=lambda: (log.flush(), flushed.set()))
+        flusher.start()
+        started = time.monotonic()
+        assert log.might_contain(key)
+        log.add(idempotency_key(1, 0.0, "2"))
+        assert time.monotonic() - started < 0.5
+        assert not flushed.is_set()
+    flusher.join(5)
+    assert flushed.is_set()
+    log.close()
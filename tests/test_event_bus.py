@@ -0,0 +1,35 @@
+import threading
+
+from viewmodels.event_bus import UIEventBus
+
+
+def test_drain_merges_only_adjacent_events():
+    bus = UIEventBus()
+    for event_type, data in [("sent", 1), ("sent", 2), ("scheduler_stopped", None),
+                             ("scheduler_started", None), ("sent", 3)]:
+        bus.publish(event_type, data)
+
+    assert bus.drain() == [("sent", [1, 2]), ("scheduler_stopped", [None]),
+                           ("scheduler_started", [None]), ("sent", [3])]
+    assert bus.drain() == []
+    assert len(bus) == 0
+    assert (bus.published, bus.batches) == (5, 4)
+
+
+def test_publish_from_many_threads_keeps_per_thread_order():
+    bus = UIEventBus()
+
+    def publish(thread_id):
+        for index in range(1000):
+            bus.publish("event", (thread_id, index))
+
+    threads = [threading.Thread(target=publish, args=(thread_id,)) for thread_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ((event_type, items),) = bus.drain()
+    assert event_type == "event" and len(items) == 4000
+    for thread_id in range(4):
+        assert [index for owner, index in items if owner == thread_id] == list(range(1000))
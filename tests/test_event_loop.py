@@ -0,0 +1,58 @@
+import asyncio
+import threading
+
+import pytest
+
+from models.event_loop import EventLoopThread
+
+
+def test_run_executes_on_one_persistent_loop():
+    loop_thread = EventLoopThread("test-loop")
+
+    async def current():
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    try:
+        first_loop, name = loop_thread.run(current())
+        second_loop, _ = loop_thread.run(current())
+        assert first_loop is second_loop
+        assert name == "test-loop"
+        assert loop_thread.submit(asyncio.sleep(0, "done")).result(5) == "done"
+    finally:
+        loop_thread.stop()
+    assert not loop_thread.is_running()
+
+
+def test_run_inside_loop_thread_is_rejected():
+    loop_thread = EventLoopThread()
+
+    async def nested():
+        with pytest.raises(RuntimeError):
+            loop_thread.run(asyncio.sleep(0))
+
+    try:
+        loop_thread.run(nested())
+    finally:
+        loop_thread.stop()
+
+
+def test_restart_after_stop():
+    loop_thread = EventLoopThread()
+    loop_thread.run(asyncio.sleep(0))
+    loop_thread.stop()
+    assert loop_thread.run(asyncio.sleep(0, 1)) == 1
+    loop_thread.stop()
+
+
+def test_sends_reuse_one_bot(make_model, fake_api):
+    model = make_model()
+    model.set_bot_token("1:token")
+    model.set_chat_ids(["1", "2"])
+    bot = model.bot
+
+    for _ in range(3):
+        assert model.send_message("hello")["sent_count"] == 2
+    # Bot은 한 번만 initialize(getMe)되고 같은 루프에서 계속 재사용됨
+    assert model.bot is bot
+    assert fake_api.requests["getMe"] == 1
+    assert fake_api.requests["sendMessage"] == 6
@@ -0,0 +1,63 @@
+import httpx
+
+from benchmarks.fake_bot_api import FakeBotAPI
+
+
+def call(client, server, method, token="1:token", files=None, **fields):
+    response = client.post(f"{server.base_url}{token}/{method}", data=fields, files=files)
+    return response.status_code, response.json()
+
+
+def test_messages_get_per_chat_ids_and_can_be_copied(fake_api):
+    with httpx.Client() as client:
+        status, body = call(client, fake_api, "sendMessage", chat_id="5", text="hi")
+        assert status == 200 and body["result"]["message_id"] == 1
+        assert call(client, fake_api, "sendMessage", chat_id="5", text="hi")[1]["result"]["message_id"] == 2
+        assert call(client, fake_api, "sendMessage", chat_id="-100", text="hi")[1]["result"]["chat"]["type"] == \
+            "supergroup"
+
+        status, body = call(client, fake_api, "copyMessage", chat_id="6", from_chat_id="5", message_id="1")
+        assert status == 200 and body["result"]["message_id"] == 1
+        status, body = call(client, fake_api, "copyMessage", chat_id="6", from_chat_id="5", message_id="9")
+        assert status == 400 and "not found" in body["description"]
+        assert call(client, fake_api, "deleteMessage", chat_id="5", message_id="1")[0] == 200
+        assert call(client, fake_api, "deleteMessage", chat_id="5", message_id="1")[0] == 400
+
+    assert fake_api.requests["sendMessage"] == 3
+    assert fake_api.errors[400] == 2
+
+
+def test_uploads_return_reusable_file_ids(fake_api):
+    with httpx.Client() as client:
+        status, body = call(client, fake_api, "sendDocument", chat_id="1",
+                            files={"document": ("a.bin", b"x" * 5000)})
+        file_id = body["result"]["document"]["file_id"]
+        assert status == 200 and fake_api.upload_bytes >= 5000
+
+        assert call(client, fake_api, "sendDocument", chat_id="2", document=file_id)[0] == 200
+        status, body = call(client, fake_api, "sendDocument", chat_id="2", document="someone-else")
+        assert status == 400 and "wrong file identifier" in body["description"]
+
+
+def test_unknown_chat_method_and_token(fake_api):
+    fake_api.token = "1:good"
+    with httpx.Client() as client:
+        assert call(client, fake_api, "getMe", token="1:good")[0] == 200
+        assert call(client, fake_api, "getMe", token="1:bad")[0] == 401
+        assert call(client, fake_api, "getChat", token="1:good", chat_id="@name")[0] == 400
+        assert call(client, fake_api, "sendSticker", token="1:good", chat_id="1")[0] == 404
+
+
+def test_injected_errors_and_flood_waits():
+    with FakeBotAPI(error_rate=1.0) as server, httpx.Client() as client:
+        # getMe는 연결 확인용이므로 주입 오류에서 제외
+        assert call(client, server, "getMe")[0] == 200
+        assert call(client, server, "sendMessage", chat_id="1", text="hi")[0] == 502
+
+        server.error_rate, server.flood_rate, server.retry_after = 0.0, 1.0, 7
+        status, body = call(client, server, "sendMessage", chat_id="1", text="hi")
+        assert status == 429 and body["parameters"]["retry_after"] == 7
+        assert server.errors == {502: 1, 429: 1}
+
+        server.reset_stats()
+        assert not server.requests and not server.errors and server.upload_bytes == 0
@@ -0,0 +1,130 @@
+import asyncio
+import random
+
+import pytest
+
+from models.keyed_executor import KeyedExecutor
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+
+def test_same_key_runs_in_submit_order_and_respects_max_active():
+    async def main():
+        executor = KeyedExecutor(max_active=3)
+        done = {key: [] for key in "abcde"}
+        active = peak = 0
+
+        def job(key, index):
+            async def fn():
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(random.uniform(0, 0.002))
+                active -= 1
+                done[key].append(index)
+                return index
+            return fn
+
+        futures = [await executor.submit(key, job(key, index)) for index in range(20) for key in "abcde"]
+        results = await asyncio.gather(*futures)
+        return executor, done, peak, results
+
+    executor, done, peak, results = run(main())
+    assert all(order == list(range(20)) for order in done.values())
+    assert peak <= 3
+    assert results == [index for index in range(20) for _ in "abcde"]
+    assert len(executor) == 0 and executor.lane_count == 0
+
+
+def test_exception_goes_to_future_and_lane_continues():
+    async def main():
+        executor = KeyedExecutor(max_active=1)
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return "ok"
+
+        failed = await executor.submit("a", fail)
+        succeeded = await executor.submit("a", ok)
+        with pytest.raises(RuntimeError):
+            await failed
+        return await succeeded
+
+    assert run(main()) == "ok"
+
+
+def test_busy_key_does_not_block_other_keys():
+    async def main():
+        executor = KeyedExecutor(max_active=1, max_lanes=2)
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+
+        async def quick():
+            return "b"
+
+        # 기존 레인이 있는 키는 레인 수 한도와 관계없이 바로 들어감
+        first = [await executor.submit("a", blocked) for _ in range(100)]
+        other = await executor.submit("b", quick)
+        assert executor.lane_count == 2
+
+        # 레인 수 한도에 걸린 새 키만 기다림
+        waiting = asyncio.ensure_future(executor.submit("c", quick))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        release.set()
+        assert await other == "b"
+        assert await (await waiting) == "b"
+        await asyncio.gather(*first)
+
+    run(main())
+
+
+def test_idle_releases_slot_to_other_lanes():
+    async def main():
+        executor = KeyedExecutor(max_active=1)
+        woken = asyncio.Event()
+
+        async def waiter():
+            async with executor.idle():
+                await woken.wait()
+            return "a"
+
+        async def waker():
+            woken.set()
+            return "b"
+
+        first = await executor.submit("a", waiter)
+        second = await executor.submit("b", waker)
+        return await first, await second
+
+    assert run(main()) == ("a", "b")
+
+
+def test_idle_outside_lane_is_noop():
+    async def main():
+        executor = KeyedExecutor(max_active=1)
+        async with executor.idle():
+            pass
+        return executor.stats()
+
+    assert run(main())["lanes"] == 0
+
+
+def test_shutdown_cancels_queued_work():
+    async def main():
+        executor = KeyedExecutor(max_active=1)
+        futures = [await executor.submit("a", lambda: asyncio.sleep(10)) for _ in range(3)]
+        await asyncio.sleep(0)
+        await executor.shutdown()
+        return futures, executor
+
+    futures, executor = run(main())
+    assert all(future.cancelled() for future in futures)
+    assert len(executor) == 0 and executor.lane_count == 0
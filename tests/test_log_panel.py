@@ -0,0 +1,111 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from views import log_panel
+
+
+class FakeWidget:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class FakeText(FakeWidget):
+    """LogPanel이 쓰는 tk.Text 기능만 흉내 (줄 번호는 1부터, 내용은 항상 줄바꿈으로 끝남)"""
+
+    def __init__(self, *args, **kwargs):
+        self.content = ""
+        self.callbacks = []
+
+    def insert(self, index, *chunks):
+        assert index == "end"
+        self.content += "".join(chunks[::2])
+
+    def index(self, index):
+        assert index == "end-1c"
+        return f"{self.content.count(chr(10)) + 1}.0"
+
+    def delete(self, start, end):
+        assert start == "1.0"
+        if end == "end":
+            self.content = ""
+        else:
+            lines = self.content.splitlines(keepends=True)
+            self.content = "".join(lines[int(end.split(".")[0]) - 1:])
+
+    def yview(self):
+        return (0.0, 1.0)
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def run_after(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def lines(self):
+        return [line.split("] ", 1)[1] for line in self.content.splitlines()]
+
+
+@pytest.fixture
+def panel(monkeypatch):
+    monkeypatch.setattr(log_panel, "ttk", SimpleNamespace(Frame=FakeWidget, Label=FakeWidget, Combobox=FakeWidget))
+    monkeypatch.setattr(log_panel, "scrolledtext", SimpleNamespace(ScrolledText=FakeText))
+    monkeypatch.setattr(log_panel, "tk", SimpleNamespace(StringVar=FakeVar, END="end", W="w", E="e", N="n", S="s"))
+    return log_panel.LogPanel(None, capacity=3)
+
+
+def test_append_is_drawn_once_per_flush(panel):
+    panel.append(["a", "b"])
+    panel.append(["c"])
+    assert panel.text.content == ""
+    assert len(panel.text.callbacks) == 1
+    panel.text.run_after()
+    assert panel.text.lines() == ["a", "b", "c"]
+
+
+def test_widget_is_trimmed_to_capacity(panel):
+    panel.append(["a", "b"])
+    panel.text.run_after()
+    panel.append(["c", "d"])
+    panel.text.run_after()
+    assert panel.text.lines() == ["b", "c", "d"]
+
+    # 한 프레임에 capacity보다 많이 들어오면 마지막 capacity줄만 그림
+    panel.append([str(index) for index in range(100)])
+    panel.text.run_after()
+    assert panel.text.lines() == ["97", "98", "99"]
+    assert [line.split("] ", 1)[1] for _, line in panel._lines] == ["97\n", "98\n", "99\n"]
+
+
+def test_level_filter_redraws_from_ring_buffer(panel):
+    panel.append(["info"])
+    panel.append(["warning"], logging.WARNING)
+    panel.text.run_after()
+
+    panel.level_var.set("경고")
+    panel._on_level_changed()
+    assert panel.text.lines() == ["warning"]
+
+    panel.level_var.set("전체")
+    panel._on_level_changed()
+    assert panel.text.lines() == ["info", "warning"]
+
+    panel.clear()
+    assert panel.text.content == "" and not panel._lines
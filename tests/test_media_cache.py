@@ -0,0 +1,73 @@
+import os
+
+from telegram.error import BadRequest
+
+from models.media_cache import Attachment, MediaCache, is_file_id_error
+
+
+def test_content_hash_is_reused_until_file_changes(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"one")
+    cache = MediaCache()
+    first = cache.content_hash(str(path))
+    assert cache.content_hash(str(path)) == first
+
+    path.write_bytes(b"other")
+    os.utime(path, ns=(0, 1))
+    assert cache.content_hash(str(path)) != first
+
+
+def test_file_ids_persist_per_bot(tmp_path):
+    path = str(tmp_path / "media.db")
+    cache = MediaCache(path)
+    cache.put("1", "hash", "photo", "file-1", 10)
+    assert cache.cached("1", "hash", "photo") == "file-1"
+    assert cache.get("2", "hash", "photo") is None
+    cache.close()
+
+    cache = MediaCache(path)
+    # 재시작 직후에는 메모리에 없고 저장소에서 읽어 온 뒤부터 cached()로 보임
+    assert cache.cached("1", "hash", "photo") is None
+    assert cache.get("1", "hash", "photo") == "file-1"
+    assert cache.cached("1", "hash", "photo") == "file-1"
+
+    cache.discard("1", "hash", "photo")
+    assert cache.get("1", "hash", "photo") is None
+    cache.close()
+
+
+def test_is_file_id_error():
+    assert is_file_id_error(BadRequest("Wrong file identifier/http url specified"))
+    assert is_file_id_error(BadRequest("FILE_REFERENCE_EXPIRED"))
+    assert not is_file_id_error(BadRequest("Chat not found"))
+    assert not is_file_id_error(BadRequest("Message text is empty"))
+
+
+def test_broadcast_uploads_once_despite_bad_chats(make_model, fake_api, tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(os.urandom(200_000))
+    model = make_model()
+    model.set_bot_token("1:token")
+    model.set_chat_ids(["1", "bad1", "2", "bad2", "3", "bad3"])
+
+    result = model.send_message("caption", attachment=Attachment("document", str(path)))
+    assert result["sent_count"] == 3 and len(result["errors"]) == 3
+    # 채팅방 오류로 file_id를 버리고 다시 업로드하지 않으므로 채팅방마다 요청은 한 번
+    # (업로드를 맡은 채팅방이 잘못된 채팅방이면 다음 채팅방이 다시 업로드할 수는 있음)
+    assert fake_api.requests["sendDocument"] == 6
+    content_hash = model.media_cache.content_hash(str(path))
+    assert model.media_cache.cached(model._bot_id, content_hash, "document") is not None
+
+
+def test_stale_file_id_is_discarded_and_reuploaded(make_model, fake_api, tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(os.urandom(50_000))
+    model = make_model()
+    model.set_bot_token("1:token")
+    model.set_chat_ids(["1"])
+    content_hash = model.media_cache.content_hash(str(path))
+    model.media_cache.put(model._bot_id, content_hash, "document", "expired")
+
+    assert model.send_message("", attachment=Attachment("document", str(path)))["sent_count"] == 1
+    assert fake_api.upload_bytes >= 50_000
+    assert model.media_cache.get(model._bot_id, content_hash, "document").startswith("fake-document-")
@@ -0,0 +1,70 @@
+import pytest
+
+from models.scheduler import (MISFIRE_ALL, MISFIRE_COALESCE, MISFIRE_SKIP, HeapScheduler, MisfirePolicy, Trigger,
+                              fire_times)
+
+
+@pytest.mark.parametrize("mode", [MISFIRE_SKIP, MISFIRE_COALESCE, MISFIRE_ALL])
+def test_runs_within_grace_fire_once(mode):
+    policy = MisfirePolicy(mode, grace_time=60)
+    assert policy.runs_to_fire(deadline=0, now=0, period=10) == 1
+    assert policy.runs_to_fire(deadline=0, now=60, period=10) == 1
+
+
+def test_coalesce_fires_once_after_long_pause():
+    policy = MisfirePolicy(MISFIRE_COALESCE, grace_time=60)
+    assert policy.runs_to_fire(deadline=0, now=100_000, period=10) == 1
+
+
+def test_all_fires_only_runs_inside_grace():
+    policy = MisfirePolicy(MISFIRE_ALL, grace_time=60)
+    # 940, 950, ..., 1000 일곱 번이 now - grace_time 이후
+    assert policy.runs_to_fire(deadline=0, now=1000, period=10) == 7
+    assert policy.runs_to_fire(deadline=0, now=1005, period=10) == 6
+
+
+def test_skip_fires_at_most_once():
+    policy = MisfirePolicy(MISFIRE_SKIP, grace_time=60)
+    assert policy.runs_to_fire(deadline=0, now=1000, period=10) == 1
+
+
+def test_missed_runs_outside_grace_are_dropped():
+    # 유예 시간이 주기보다 짧으면 유예 안에 든 실행이 없을 수 있음
+    for mode in (MISFIRE_SKIP, MISFIRE_ALL):
+        policy = MisfirePolicy(mode, grace_time=1)
+        assert policy.runs_to_fire(deadline=0, now=1005, period=10) == 0
+
+
+def test_large_gap_is_computed_without_iterating():
+    policy = MisfirePolicy(MISFIRE_ALL, grace_time=3600)
+    assert policy.runs_to_fire(deadline=0, now=60 * 10 ** 10, period=60) == 61
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        MisfirePolicy("later")
+
+
+def test_of_shares_instances():
+    assert MisfirePolicy.of(MISFIRE_ALL, 30) is MisfirePolicy.of(MISFIRE_ALL, 30)
+
+
+def test_fire_times_are_the_latest_runs_inside_grace():
+    trigger = Trigger.of("hourly", 0, 0)
+    policy = MisfirePolicy.of(MISFIRE_ALL, 3 * 3600)
+    # 10시간 늦으면 유예 시간(3시간) 안에 든 마지막 네 번만 실행
+    assert fire_times(trigger, policy, deadline=0, now=10 * 3600) == [7 * 3600, 8 * 3600, 9 * 3600, 10 * 3600]
+    assert fire_times(trigger, MisfirePolicy.of(MISFIRE_COALESCE, 60), deadline=0, now=10 * 3600) == [10 * 3600]
+    assert fire_times(trigger, MisfirePolicy.of(MISFIRE_SKIP, 60), deadline=0, now=10 * 3600 + 120) == []
+
+
+def test_engine_applies_the_policy_to_a_saved_deadline():
+    now = 1_760_000_000.0
+    scheduler = HeapScheduler(lambda: now)
+    fired = []
+    # 재시작 전에 저장해 둔 시각이 하루 전이면 coalesce는 한 번만 실행하고 다음 주기로 넘어감
+    job = scheduler.add(Trigger.of("hourly", 0, 0), fired.append, "a", MisfirePolicy.of(MISFIRE_COALESCE, 60),
+                        deadline=now - 86400)
+    assert scheduler.run_pending() == 1
+    assert fired == ["a"]
+    assert now < scheduler.deadline_of(job) <= now + 3600
@@ -0,0 +1,131 @@
+import sqlite3
+import time
+
+from models.outbox import CLAIMED, DONE, FAILED, PENDING, Outbox
+
+
+def statuses(path):
+    conn = sqlite3.connect(path)
+    try:
+        return [row[0] for row in conn.execute("SELECT status FROM outbox ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_claim_returns_rows_in_order_with_fire_data(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    fire_id = outbox.enqueue(7, 100.0, "hello", ["1", "2", "3"], "photo", "/tmp/a.jpg")
+
+    items = outbox.claim(2)
+    assert [item.chat_id for item in items] == ["1", "2"]
+    assert all(item.fire_id == fire_id and item.schedule_id == 7 for item in items)
+    assert (items[0].message, items[0].media_type, items[0].media_path) == ("hello", "photo", "/tmp/a.jpg")
+    assert [item.chat_id for item in outbox.claim(10)] == ["3"]
+    assert outbox.claim(10) == []
+    assert outbox.pending_count() == 3
+    outbox.close()
+
+
+def test_claimed_rows_are_reset_on_reopen(tmp_path):
+    path = str(tmp_path / "outbox.db")
+    outbox = Outbox(path)
+    outbox.enqueue(1, 0.0, "m", ["1", "2"])
+    items = outbox.claim(10)
+    outbox.complete([(items[0].id, True, 1, "")])
+    outbox.close()
+    assert statuses(path) == [DONE, CLAIMED]
+
+    # 처리 중에 종료된 행은 다음 시작 시 다시 대기 상태
+    outbox = Outbox(path)
+    assert statuses(path) == [DONE, PENDING]
+    assert [item.chat_id for item in outbox.claim(10)] == ["2"]
+    outbox.close()
+
+
+def test_release_returns_rows_to_pending(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    outbox.enqueue(1, 0.0, "m", ["1", "2"])
+    items = outbox.claim(10)
+    outbox.release([item.id for item in items])
+    assert [item.id for item in outbox.claim(10)] == [item.id for item in items]
+    outbox.close()
+
+
+def test_complete_reports_fire_once_all_rows_finish(tmp_path):
+    path = str(tmp_path / "outbox.db")
+    outbox = Outbox(path)
+    fire_id = outbox.enqueue(3, 50.0, "m", ["1", "2", "3"])
+    first, second, third = outbox.claim(10)
+
+    assert outbox.complete([(first.id, True, 1, "")]) == []
+    assert outbox.complete([(second.id, False, 3, "Forbidden")]) == []
+    (summary,) = outbox.complete([(third.id, True, 2, "")])
+    assert (summary.fire_id, summary.schedule_id, summary.fire_time) == (fire_id, 3, 50.0)
+    assert (summary.sent_count, summary.total_count) == (2, 3)
+    assert summary.errors == ["채팅방 2: Forbidden"]
+    assert summary.retry_count == 3
+    assert statuses(path) == [DONE, FAILED, DONE]
+    assert outbox.pending_count() == 0
+    outbox.close()
+
+
+def test_purge_removes_only_old_completed_fires(tmp_path):
+    path = str(tmp_path / "outbox.db")
+    outbox = Outbox(path)
+    outbox.enqueue(1, 0.0, "done", ["1"])
+    outbox.enqueue(2, 0.0, "waiting", ["1"])
+    done = outbox.claim(1)
+    outbox.complete([(done[0].id, True, 1, "")])
+
+    outbox.purge(3600)
+    assert len(statuses(path)) == 2
+    outbox.purge(-1)
+    assert statuses(path) == [PENDING]
+    outbox.close()
+
+
+def wait_until(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "시간 안에 조건이 만족되지 않음"
+        time.sleep(0.02)
+
+
+def connect(model):
+    model.connect("1:token")
+    wait_until(lambda: model._verified_bot is not None)
+
+
+def test_model_sends_to_every_chat(make_model, fake_api):
+    model = make_model()
+    model.set_chat_ids(["1", "2", "-100"])
+    connect(model)
+
+    result = model.send_message("hello")
+    assert result["success"] and result["sent_count"] == 3
+    assert fake_api.requests["sendMessage"] == 3
+
+
+def test_scheduled_fire_is_delivered_through_the_outbox(make_model, fake_api, tmp_path):
+    model = make_model()
+    model.set_chat_ids(["1", "2", "3"])
+    connect(model)
+    record = model.add_scheduled_message("hello", "09:00")
+
+    # 실행 시각이 되면 채팅방마다 행이 기록되고 워커가 보냄
+    model._scheduler.run_pending(model._scheduler.deadline_of(model._jobs[record.id]))
+    wait_until(lambda: statuses(str(tmp_path / "model.db")) == [DONE] * 3)
+    assert fake_api.requests["sendMessage"] == 3
+    assert model.outbox.pending_count() == 0
+
+
+def test_permanent_error_marks_rows_failed(make_model, fake_api, tmp_path):
+    model = make_model()
+    model.set_chat_ids(["1", "2"])
+    connect(model)
+    fake_api.error_rate, fake_api.error_code = 1.0, 400
+
+    model.outbox.enqueue(1, time.time(), "hello", ["1", "2"])
+    model._wake_outbox_workers()
+    wait_until(lambda: statuses(str(tmp_path / "model.db")) == [FAILED] * 2)
+    assert fake_api.requests["sendMessage"] == 2
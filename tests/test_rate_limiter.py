@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from models.rate_limiter import RateLimit, TelegramRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_reserve_uses_burst_then_waits_in_order():
+    bucket = TokenBucket(RateLimit(2, 1.0, burst=2), now=0.0)
+    assert bucket.reserve(0.0) == 0.0
+    assert bucket.reserve(0.0) == 0.0
+    # 버스트를 다 쓰면 예약이 쌓인 순서대로 1/rate초씩 늦어짐
+    assert bucket.reserve(0.0) == pytest.approx(0.5)
+    assert bucket.reserve(0.0) == pytest.approx(1.0)
+
+
+def test_reserve_refills_over_time_up_to_capacity():
+    bucket = TokenBucket(RateLimit(2, 1.0, burst=2), now=0.0)
+    for _ in range(4):
+        bucket.reserve(0.0)
+    assert bucket.reserve(1.0) == pytest.approx(0.5)
+    assert bucket.is_idle(100.0)
+    # 오래 쉬어도 capacity보다 많이 쌓이지 않음
+    assert bucket.reserve(100.0) == 0.0
+    assert bucket.reserve(100.0) == 0.0
+    assert bucket.reserve(100.0) > 0.0
+
+
+def test_defer_pushes_next_token_back():
+    bucket = TokenBucket(RateLimit(1, 1.0), now=0.0)
+    bucket.defer(0.0, 5.0)
+    assert bucket.reserve(0.0) == pytest.approx(5.0)
+    assert not bucket.is_idle(5.0)
+
+
+def test_defer_never_shortens_existing_wait():
+    bucket = TokenBucket(RateLimit(1, 1.0), now=0.0)
+    for _ in range(10):
+        bucket.reserve(0.0)
+    bucket.defer(0.0, 1.0)
+    assert bucket.reserve(0.0) == pytest.approx(10.0)
+
+
+def test_is_group_chat():
+    assert TelegramRateLimiter.is_group_chat("-100123")
+    assert TelegramRateLimiter.is_group_chat("@channel")
+    assert not TelegramRateLimiter.is_group_chat("12345")
+
+
+def test_limiter_applies_chat_defer_and_prunes_idle_buckets():
+    clock = FakeClock()
+    limiter = TelegramRateLimiter(RateLimit(1000, 1.0, burst=1000), RateLimit(1, 1.0), RateLimit(20, 60.0),
+                                  clock=clock)
+    asyncio.run(limiter.acquire("1"))
+    limiter.defer("1", 3.0)
+    assert limiter._chats["1"].reserve(clock.now) == pytest.approx(3.0)
+
+    clock.now = 1000.0
+    limiter._prune(clock.now)
+    assert limiter._chats == {}
@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TimedOut
+
+from models.retry_policy import FailureKind, RetryPolicy, SendFailure, classify_error
+
+
+@pytest.mark.parametrize("error, kind", [
+    (BadRequest("Chat not found"), FailureKind.PERMANENT),
+    (Forbidden("bot was blocked by the user"), FailureKind.PERMANENT),
+    (NetworkError("connection reset"), FailureKind.TRANSIENT),
+    (TimedOut(), FailureKind.TRANSIENT),
+    (ValueError("unexpected"), FailureKind.PERMANENT),
+])
+def test_classify_error(error, kind):
+    assert classify_error(error).kind is kind
+
+
+def test_classify_retry_after():
+    failure = classify_error(RetryAfter(7))
+    assert failure.kind is FailureKind.FLOOD_WAIT
+    assert failure.retry_after == 7.0
+
+
+def test_classify_retry_after_timedelta():
+    error = RetryAfter(1)
+    error.retry_after = datetime.timedelta(seconds=2.5)
+    assert classify_error(error).retry_after == 2.5
+
+
+def test_should_retry():
+    policy = RetryPolicy(max_attempts=3)
+    transient = SendFailure(FailureKind.TRANSIENT)
+    assert policy.should_retry(transient, 1)
+    assert policy.should_retry(transient, 2)
+    assert not policy.should_retry(transient, 3)
+    assert policy.should_retry(SendFailure(FailureKind.FLOOD_WAIT, 1.0), 1)
+    assert not policy.should_retry(SendFailure(FailureKind.PERMANENT), 1)
+
+
+def test_delay_backs_off_exponentially_up_to_max():
+    policy = RetryPolicy(base_delay=1.0, max_delay=10.0, jitter=0.0)
+    transient = SendFailure(FailureKind.TRANSIENT)
+    assert [policy.delay(transient, attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 8.0, 10.0]
+
+
+def test_delay_respects_retry_after():
+    policy = RetryPolicy(base_delay=1.0, jitter=0.0)
+    assert policy.delay(SendFailure(FailureKind.FLOOD_WAIT, 30.0), 1) == 30.0
+    assert policy.delay(SendFailure(FailureKind.FLOOD_WAIT, 0.5), 3) == 4.0
+
+
+def test_delay_jitter_bounds():
+    policy = RetryPolicy(base_delay=2.0, jitter=0.5)
+    transient = SendFailure(FailureKind.TRANSIENT)
+    for _ in range(100):
+        assert 2.0 <= policy.delay(transient, 1) <= 3.0
@@ -0,0 +1,83 @@
+from models.schedule_store import IdAllocator, ScheduledMessage, ScheduleStore
+
+
+def make_store(count: int = 0) -> ScheduleStore:
+    store = ScheduleStore()
+    for index in range(count):
+        store.add(ScheduledMessage(store.new_id(), f"m{index}", 9, index % 60,
+                                   ("daily", "hourly")[index % 2]))
+    return store
+
+
+def test_ids_are_monotonic_and_never_reused():
+    store = make_store(3)
+    store.remove(2)
+    assert store.new_id() == 3
+    assert [record.id for record in store] == [0, 1]
+
+
+def test_advance_past_skips_loaded_ids():
+    ids = IdAllocator()
+    ids.advance_past(41)
+    assert ids.next_id() == 42
+    ids.advance_past(10)
+    assert ids.next_id() == 43
+
+
+def test_get_remove_and_interval_index():
+    store = make_store(4)
+    assert store.get(1).message == "m1"
+    assert store.ids_by_interval("hourly") == [1, 3]
+
+    assert store.remove(1).id == 1
+    assert store.remove(1) is None
+    assert 1 not in store
+    assert store.ids_by_interval("hourly") == [3]
+    assert len(store) == 3
+
+
+def test_page_follows_id_order():
+    store = make_store(10)
+    assert [record.id for record in store.page(3, 4)] == [3, 4, 5, 6]
+    assert store.page(8, 5)[-1].id == 9
+    assert store.page(-1, 0) == []
+
+
+def test_next_fire_index_orders_and_skips_stale_entries():
+    store = make_store(4)
+    for schedule_id, timestamp in ((0, 400.0), (1, 100.0), (2, 300.0), (3, 200.0)):
+        store.set_next_fire(schedule_id, timestamp)
+    # 시각을 옮기면 이전 힙 항목은 지난 항목이 되어 건너뜀
+    store.set_next_fire(1, 500.0)
+    store.remove(2)
+
+    assert [record.id for record in store.upcoming(10)] == [3, 0, 1]
+    assert [record.id for record in store.due_before(450.0)] == [3, 0]
+    assert [record.id for record in store.due_before(1000.0, limit=1)] == [3]
+    assert store.get_next_fire(2) is None
+
+    store.set_next_fire(3, None)
+    assert [record.id for record in store.upcoming(10)] == [0, 1]
+
+
+def test_fire_heap_is_compacted():
+    store = make_store(2000)
+    for round_ in range(3):
+        for schedule_id in range(2000):
+            store.set_next_fire(schedule_id, float(round_ * 10_000 + schedule_id))
+    assert len(store._fire_heap) <= 2 * len(store._next_fire)
+    assert store.upcoming(1)[0].id == 0
+
+
+def test_records_are_slotted():
+    record = ScheduledMessage(0, "m", 9, 5, "daily")
+    assert not hasattr(record, "__dict__")
+    assert record.time == "09:05"
+
+
+def test_jobs_share_one_dispatcher(make_model):
+    model = make_model()
+    for minute in range(3):
+        model.add_scheduled_message("m", f"09:{minute:02d}")
+    callbacks = {id(job.callback) for job in model._jobs.values()}
+    assert len(callbacks) == 1
@@ -0,0 +1,119 @@
+import threading
+import time
+from datetime import datetime
+
+from models.scheduler import HeapScheduler, Trigger
+
+START = datetime(2026, 3, 2, 8, 0).timestamp()  # 월요일 08:00
+
+
+class Clock:
+    def __init__(self, now: float = START):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_next_after_for_each_interval():
+    assert Trigger.of("daily", 9, 30).next_after(START) == datetime(2026, 3, 2, 9, 30).timestamp()
+    assert Trigger.of("daily", 7, 0).next_after(START) == datetime(2026, 3, 3, 7, 0).timestamp()
+    assert Trigger.of("hourly", 0, 15).next_after(START) == datetime(2026, 3, 2, 8, 15).timestamp()
+    assert Trigger.of("weekly", 8, 0).next_after(START) == datetime(2026, 3, 9, 8, 0).timestamp()
+
+
+def test_run_pending_fires_due_jobs_in_deadline_order():
+    clock = Clock()
+    scheduler = HeapScheduler(clock)
+    fired = []
+    scheduler.add(Trigger.of("daily", 10, 0), fired.append, "late")
+    scheduler.add(Trigger.of("daily", 9, 0), fired.append, "early")
+    scheduler.add(Trigger.of("daily", 23, 0), fired.append, "tonight")
+
+    assert scheduler.run_pending() == 0
+    clock.now = datetime(2026, 3, 2, 12, 0).timestamp()
+    assert scheduler.run_pending() == 2
+    assert fired == ["early", "late"]
+    assert scheduler.next_deadline() == datetime(2026, 3, 2, 23, 0).timestamp()
+
+
+def test_fired_job_is_rescheduled_for_the_next_period():
+    clock = Clock()
+    scheduler = HeapScheduler(clock)
+    seen = []
+    job = scheduler.add(Trigger.of("hourly", 0, 30), lambda key: seen.append(scheduler.fired_at(job)))
+    first = scheduler.deadline_of(job)
+
+    clock.now = first + 1
+    scheduler.run_pending()
+    assert seen == [first]
+    assert scheduler.deadline_of(job) == first + 3600
+    assert len(scheduler) == 1
+
+
+def test_callback_error_does_not_stop_other_jobs():
+    clock = Clock()
+    scheduler = HeapScheduler(clock)
+    fired = []
+    scheduler.add(Trigger.of("daily", 9, 0), lambda key: 1 / 0)
+    scheduler.add(Trigger.of("daily", 9, 0), fired.append, "ok")
+    clock.now += 3 * 3600
+    assert scheduler.run_pending() == 2
+    assert fired == ["ok"]
+
+
+def test_thread_wakes_up_for_an_earlier_job():
+    scheduler = HeapScheduler()
+    fired = threading.Event()
+    scheduler.add(Trigger.of("weekly", 0, 0), print, "far")
+    scheduler.start()
+    try:
+        # 스레드는 먼 작업까지 잠들어 있다가 더 이른 작업이 추가되면 바로 깨어나야 함
+        time.sleep(0.05)
+        scheduler.add(Trigger.of("daily", 0, 0), lambda key: fired.set(), deadline=time.time() + 0.05)
+        assert fired.wait(2)
+    finally:
+        scheduler.stop(timeout=2)
+    assert not scheduler.is_running()
+
+
+def test_cancel_removes_only_that_job():
+    clock = Clock()
+    scheduler = HeapScheduler(clock)
+    fired = []
+    keep = scheduler.add(Trigger.of("daily", 9, 0), fired.append, "keep")
+    drop = scheduler.add(Trigger.of("daily", 8, 30), fired.append, "drop")
+
+    scheduler.cancel(drop)
+    scheduler.cancel(drop)
+    assert len(scheduler) == 1
+    # 취소된 항목은 힙에 남아 있어도 다음 깨어날 시각에서 빠짐
+    assert scheduler.next_deadline() == scheduler.deadline_of(keep)
+
+    clock.now += 2 * 3600
+    scheduler.run_pending()
+    assert fired == ["keep"]
+
+
+def test_cancelled_entries_are_compacted():
+    scheduler = HeapScheduler(Clock())
+    jobs = [scheduler.add(Trigger.of("daily", 9, 0), print, key) for key in range(3000)]
+    for job in jobs[:2000]:
+        scheduler.cancel(job)
+
+    # 취소된 항목이 절반을 넘으면 힙을 다시 만들어 메모리를 돌려줌
+    assert len(scheduler) == 1000
+    assert len(scheduler._heap) < 2000
+    assert len(scheduler._heap) - scheduler._stale == 1000
+
+
+def test_clear_drops_every_job():
+    clock = Clock()
+    scheduler = HeapScheduler(clock)
+    fired = []
+    scheduler.add(Trigger.of("daily", 9, 0), fired.append, "a")
+    scheduler.clear()
+    clock.now += 86400
+    assert scheduler.run_pending() == 0
+    assert len(scheduler) == 0
+    assert scheduler.next_deadline() is None
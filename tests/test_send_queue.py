@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from models.send_queue import PRIORITY_BULK, PRIORITY_INTERACTIVE, PrioritySendQueue
+
+
+def test_higher_priority_first_then_fifo():
+    async def main():
+        queue = PrioritySendQueue(10)
+        for item in ("b1", "b2"):
+            await queue.put(item, PRIORITY_BULK)
+        for item in ("i1", "i2"):
+            await queue.put(item, PRIORITY_INTERACTIVE)
+        return [await queue.get() for _ in range(4)]
+
+    assert asyncio.run(main()) == ["i1", "i2", "b1", "b2"]
+
+
+def test_full_queue_blocks_producers_until_space():
+    async def main():
+        queue = PrioritySendQueue(2)
+        await queue.put(1)
+        await queue.put(2)
+        blocked = asyncio.ensure_future(queue.put(3))
+        await asyncio.sleep(0)
+        assert not blocked.done() and queue.full()
+        assert queue.stats()["priorities"][PRIORITY_BULK]["waiting_producers"] == 1
+
+        assert await queue.get() == 1
+        await asyncio.wait_for(blocked, 1)
+        return [await queue.get() for _ in range(2)], len(queue)
+
+    assert asyncio.run(main()) == ([2, 3], 0)
+
+
+def test_interactive_producer_gets_the_free_slot_first():
+    async def main():
+        queue = PrioritySendQueue(1)
+        await queue.put("bulk0")
+        # 대량 전송 생산자가 먼저 기다려도 자리가 나면 "지금 전송"이 먼저 들어감
+        bulk = asyncio.ensure_future(queue.put("bulk1", PRIORITY_BULK))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(queue.put("now", PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+
+        order = [await queue.get()]
+        await asyncio.sleep(0)
+        order.append(await queue.get())
+        await asyncio.sleep(0)
+        order.append(await queue.get())
+        await asyncio.gather(bulk, interactive)
+        return order
+
+    assert asyncio.run(main()) == ["bulk0", "now", "bulk1"]
+
+
+def test_cancelled_producer_passes_its_slot_on():
+    async def main():
+        queue = PrioritySendQueue(1)
+        await queue.put("a")
+        first = asyncio.ensure_future(queue.put("b"))
+        second = asyncio.ensure_future(queue.put("c"))
+        await asyncio.sleep(0)
+
+        assert await queue.get() == "a"
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await queue.get()
+
+    assert asyncio.run(main()) == "c"
+
+
+def test_getter_waits_for_an_item_and_records_wait_time():
+    now = [0.0]
+
+    async def main():
+        queue = PrioritySendQueue(4, clock=lambda: now[0])
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        await queue.put("x", PRIORITY_INTERACTIVE)
+        now[0] = 2.5
+        await queue.put("y")
+        now[0] = 3.0
+        assert await getter == "x"
+        assert await queue.get() == "y"
+        return queue.stats()
+
+    stats = asyncio.run(main())
+    assert stats["depth"] == 0
+    assert stats["priorities"][PRIORITY_INTERACTIVE]["max_wait"] == 3.0
+    assert stats["priorities"][PRIORITY_BULK]["mean_wait"] == pytest.approx(0.5)
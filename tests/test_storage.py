@@ -0,0 +1,109 @@
+import sqlite3
+
+from models.schedule_store import ScheduledMessage, ScheduleStore
+from models.storage import Storage
+
+
+def make_storage(tmp_path, **kwargs) -> Storage:
+    return Storage(str(tmp_path / "storage.db"), **kwargs)
+
+
+def test_chat_ids_keep_order_across_reopen(tmp_path):
+    storage = make_storage(tmp_path)
+    storage.save_chat_ids(["a", "b", "c"])
+    storage.remove_chat_id("b")
+    storage.add_chat_id("d")
+    storage.add_chat_id("b")
+    storage.close()
+
+    storage = make_storage(tmp_path)
+    assert storage.load_chat_ids() == ["a", "c", "d", "b"]
+    storage.add_chat_id("e")
+    assert storage.load_chat_ids() == ["a", "c", "d", "b", "e"]
+    storage.close()
+
+
+def test_chat_changes_touch_only_their_rows(tmp_path):
+    storage = make_storage(tmp_path)
+    storage.save_chat_ids([str(i) for i in range(1000)])
+    storage.flush()
+    statements = []
+    storage._conn.set_trace_callback(statements.append)
+
+    storage.add_chat_id("new")
+    storage.remove_chat_id("5")
+    storage.flush()
+    storage._conn.set_trace_callback(None)
+    # 목록 전체를 지우고 다시 넣지 않고 바뀐 행만 씀
+    assert not any(statement == "DELETE FROM chats" for statement in statements)
+    assert len(storage.load_chat_ids()) == 1000
+    storage.close()
+
+
+def test_schedule_writes_are_batched(tmp_path):
+    storage = make_storage(tmp_path, batch_size=3, flush_interval=60)
+    record = ScheduledMessage(1, "m", 9, 0, "daily")
+    storage.save_schedule(record)
+    storage.update_next_fire(1, 100.0)
+    assert storage._pending_count() == 1
+
+    # 다른 연결에서는 flush 전까지 보이지 않음
+    other = sqlite3.connect(str(tmp_path / "storage.db"))
+    assert other.execute("SELECT COUNT(*) FROM schedules").fetchone()[0] == 0
+    storage.save_schedule(ScheduledMessage(2, "n", 9, 0, "daily"))
+    storage.delete_schedule(2)
+    storage.update_next_fire(3, 5.0)
+    assert storage._pending_count() == 0
+    assert other.execute("SELECT id, next_fire FROM schedules").fetchall() == [(1, 100.0)]
+    other.close()
+    storage.close()
+
+
+def test_old_database_is_migrated(tmp_path):
+    path = str(tmp_path / "storage.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE schedules (id INTEGER PRIMARY KEY, message TEXT NOT NULL, hour INTEGER NOT NULL, "
+                 "minute INTEGER NOT NULL, interval TEXT NOT NULL, enabled INTEGER NOT NULL DEFAULT 1, "
+                 "misfire TEXT NOT NULL DEFAULT 'coalesce', grace_time INTEGER NOT NULL DEFAULT 60, next_fire REAL)")
+    conn.execute("INSERT INTO schedules (id, message, hour, minute, interval) VALUES (7, 'old', 8, 30, 'daily')")
+    conn.commit()
+    conn.close()
+
+    storage = Storage(path)
+    record, next_fire = storage.load_schedule(7)
+    assert (record.message, record.time, record.media_path, next_fire) == ("old", "08:30", None, None)
+    storage.close()
+
+
+def test_load_window_reads_only_due_schedules_once(tmp_path):
+    storage = make_storage(tmp_path)
+    for schedule_id in range(10):
+        storage.save_schedule(ScheduledMessage(schedule_id, f"m{schedule_id}", 9, 0, "daily"),
+                              next_fire=float(schedule_id * 100))
+    store = ScheduleStore(storage=storage)
+    assert len(store) == 10
+    assert store.new_id() == 10
+
+    loaded = store.load_window(450.0, batch_size=2)
+    assert [(record.id, next_fire) for record, next_fire in loaded] == [(i, i * 100.0) for i in range(5)]
+    assert not store.is_resident(5)
+    assert store.load_window(450.0) == []
+    # 다음 구간은 이어서 읽음
+    assert [record.id for record, _ in store.load_window(700.0)] == [5, 6]
+    assert [record.id for record in store.upcoming(3)] == [0, 1, 2]
+
+    # 메모리에 없는 스케줄도 페이지/조회/삭제는 저장소를 통해 동작
+    assert [record.id for record in store.page(6, 3)] == [6, 7, 8]
+    assert store.get(9).message == "m9"
+    assert store.remove(9).id == 9
+    assert len(store) == 9
+    storage.close()
+
+
+def test_model_persists_chats(tmp_path, make_model):
+    model = make_model()
+    model.set_chat_ids(["1", " 2 ", ""])
+    model.add_chat_id("3")
+    model.remove_chat_id("1")
+    model.shutdown()
+    assert make_model().get_chat_ids() == ["2", "3"]
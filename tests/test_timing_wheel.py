@@ -0,0 +1,106 @@
+import random
+import time
+
+import pytest
+
+from models.scheduler import HeapScheduler, MisfirePolicy, Trigger
+from models.timing_wheel import TimingWheelScheduler
+
+START = 1_760_000_000.0
+
+
+class Clock:
+    def __init__(self, now: float = START):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_fires_like_the_heap_under_random_operations():
+    for seed in range(5):
+        rng = random.Random(seed)
+        clock = Clock()
+        engines = (HeapScheduler(clock), TimingWheelScheduler(clock))
+        fired = ([], [])
+        handles = ({}, {})
+        for step in range(300):
+            roll = rng.random()
+            if roll < 0.4:
+                trigger = Trigger.of(rng.choice(("hourly", "daily", "weekly")), rng.randrange(24), rng.randrange(60))
+                policy = MisfirePolicy.of(rng.choice(("skip", "coalesce", "all")), rng.choice((60, 7200)))
+                deadline = None if rng.random() < 0.7 else clock.now - rng.randrange(10 * 1440) * 60
+                for engine, log, jobs in zip(engines, fired, handles):
+                    jobs[step] = engine.add(trigger, lambda key, engine=engine, log=log, jobs=jobs:
+                                            log.append((key, engine.fired_at(jobs[key]))), step, policy, deadline)
+            elif roll < 0.55 and handles[0]:
+                key = rng.choice(list(handles[0]))
+                for engine, jobs in zip(engines, handles):
+                    engine.cancel(jobs.pop(key))
+            else:
+                clock.now += rng.choice((1, 60, 3600, 86400, 3 * 86400, rng.randrange(1, 9 * 86400)))
+                for engine in engines:
+                    engine.run_pending()
+            assert len(engines[0]) == len(engines[1])
+
+        # 같은 회차 안의 실행 순서는 엔진마다 다를 수 있음
+        assert sorted(fired[0]) == sorted(fired[1])
+        for key in handles[0]:
+            assert engines[0].deadline_of(handles[0][key]) == engines[1].deadline_of(handles[1][key])
+
+
+def test_cancel_frees_the_slot_for_reuse():
+    clock = Clock()
+    wheel = TimingWheelScheduler(clock)
+    trigger = Trigger.of("hourly", 0, 30)
+    first = wheel.add(trigger, print, "a")
+    second = wheel.add(trigger, print, "b")
+    wheel.cancel(first)
+    wheel.cancel(first)
+    assert len(wheel) == 1
+
+    third = wheel.add(trigger, print, "c")
+    assert third == first
+    assert len(wheel) == 2
+    assert wheel.deadline_of(second) == wheel.deadline_of(third)
+
+
+def test_shared_specs_are_stored_once():
+    wheel = TimingWheelScheduler(Clock())
+    for key in range(1000):
+        wheel.add(Trigger.of("daily", 9, 0), print, key)
+    assert len(wheel._spec_list) == 1
+    assert len(wheel) == 1000
+
+
+def test_fired_at_and_long_pause():
+    clock = Clock()
+    wheel = TimingWheelScheduler(clock)
+    seen = []
+    job = wheel.add(Trigger.of("daily", 9, 0), lambda key: seen.append(wheel.fired_at(job)), "a",
+                    MisfirePolicy.of("all", 3 * 86400))
+    assert wheel.fired_at(job) is None
+    deadline = wheel.deadline_of(job)
+
+    # 일주일 멈췄다 깨어나면 유예 시간(3일) 안에 든 실행만 한 번에 처리
+    clock.now = deadline + 7 * 86400
+    assert wheel.run_pending() == 4
+    assert seen == [deadline + day * 86400 for day in range(4, 8)]
+    assert wheel.deadline_of(job) == deadline + 8 * 86400
+    assert wheel.next_deadline() is not None
+
+
+def test_model_runs_schedules_on_the_wheel(make_model):
+    model = make_model(scheduler_backend="wheel")
+    assert isinstance(model._scheduler, TimingWheelScheduler)
+    record = model.add_scheduled_message("hello", "09:30", "daily")
+    assert len(model._scheduler) == 1
+    assert model._scheduler.deadline_of(model._jobs[record.id]) > time.time()
+
+    model.remove_scheduled_message(record.id)
+    assert len(model._scheduler) == 0
+
+
+def test_model_rejects_unknown_backend(make_model):
+    with pytest.raises(ValueError):
+        make_model(scheduler_backend="calendar")
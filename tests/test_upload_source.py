@@ -0,0 +1,74 @@
+import io
+
+from models.media_cache import Attachment
+
+from models.upload_source import MappedFile, StreamingInputFile, UploadSources
+
+
+def test_readers_have_independent_positions(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+    source = MappedFile(str(path))
+    first, second = source.reader(), source.reader()
+
+    assert first.read(10) == bytes(range(10))
+    assert second.read(3) == bytes(range(3))
+    assert first.tell() == 10
+    assert first.seek(-4, io.SEEK_END) == 1020
+    assert first.read() == bytes(range(252, 256))
+    assert first.read(5) == b""
+
+    buffer = bytearray(8)
+    assert second.readinto(buffer) == 8 and bytes(buffer) == bytes(range(3, 11))
+    source.close()
+
+
+def test_empty_file_reads_nothing(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    source = MappedFile(str(path))
+    assert source.size == 0
+    assert source.reader().read() == b""
+    source.close()
+
+
+def test_sources_are_shared_until_the_last_release(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"data")
+    sources = UploadSources()
+    first = sources.acquire(str(path))
+    second = sources.acquire(str(path))
+    assert first is second and len(sources) == 1
+
+    sources.release(str(path))
+    assert first.reader().read() == b"data"
+    sources.release(str(path))
+    assert len(sources) == 0
+    # 마지막 사용자가 놓으면 매핑이 닫힘
+    assert first.reader().read() == b""
+
+
+def test_streaming_input_file_does_not_read_the_file(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"x" * 100_000)
+    source = MappedFile(str(path))
+    upload = StreamingInputFile(source)
+
+    filename, reader, mimetype = upload.field_tuple
+    assert filename == "photo.jpg" and mimetype == "image/jpeg"
+    assert upload.input_file_content == b""
+    assert len(reader.read()) == 100_000
+    source.close()
+
+
+def test_model_streams_upload_and_releases_the_mapping(make_model, fake_api, tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"z" * 300_000)
+    model = make_model()
+    model.set_bot_token("1:token")
+    model.set_chat_ids(["1"])
+
+    result = model.send_message("caption", attachment=Attachment("document", str(path)))
+    assert result["sent_count"] == 1
+    assert fake_api.upload_bytes >= 300_000
+    assert len(model._upload_sources) == 0
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import pytest
+
+from views import virtual_list
+from views.telegram_view import TelegramView
+
+
+class FakeTreeview:
+    """VirtualTreeview가 쓰는 Treeview 기능만 흉내 (항목 순서와 호출 횟수 기록)"""
+
+    def __init__(self, *args, **kwargs):
+        self.order = []
+        self.values = {}
+        self.calls = {"insert": 0, "delete": 0, "item": 0}
+
+    def bind(self, *args):
+        pass
+
+    def insert(self, parent, index, iid, values):
+        self.calls["insert"] += 1
+        self.order.insert(index, iid)
+        self.values[iid] = values
+        return iid
+
+    def delete(self, *items):
+        self.calls["delete"] += len(items)
+        for item in items:
+            self.order.remove(item)
+            del self.values[item]
+
+    def item(self, item, values):
+        self.calls["item"] += 1
+        self.values[item] = values
+
+    def move(self, item, parent, index):
+        self.order.remove(item)
+        self.order.insert(index, item)
+
+
+class FakeScrollbar:
+    def __init__(self, *args, **kwargs):
+        self.position = None
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class Rows:
+    """fetch/count 대상 데이터 (불러온 페이지 기록)"""
+
+    def __init__(self, count):
+        self.rows = list(range(count))
+        self.fetched = []
+
+    def fetch(self, offset, limit):
+        self.fetched.append(offset)
+        return self.rows[offset:offset + limit]
+
+
+@pytest.fixture
+def make_list(monkeypatch):
+    monkeypatch.setattr(virtual_list, "ttk", SimpleNamespace(Treeview=FakeTreeview, Scrollbar=FakeScrollbar))
+
+    def make(rows, height=10):
+        view = virtual_list.VirtualTreeview(None, ("value",), rows.fetch, lambda: len(rows.rows),
+                                            lambda row: (f"row {row}",), lambda row: row, height=height)
+        view.refresh()
+        return view
+
+    return make
+
+
+def test_only_visible_rows_are_drawn_and_fetched(make_list):
+    rows = Rows(100_000)
+    view = make_list(rows)
+    assert view.tree.order == [str(row) for row in range(10)]
+    assert rows.fetched == [0]
+
+    view._on_scrollbar("moveto", "0.5")
+    assert view.tree.order == [str(row) for row in range(50_000, 50_010)]
+    assert rows.fetched == [0, 50_000 // virtual_list.PAGE_SIZE * virtual_list.PAGE_SIZE]
+    assert view.scrollbar.position == (0.5, 0.5001)
+
+
+def test_scrolling_updates_only_changed_rows(make_list):
+    view = make_list(Rows(1000))
+    view.tree.calls = {"insert": 0, "delete": 0, "item": 0}
+    view.scroll(3)
+    assert view.tree.order == [str(row) for row in range(3, 13)]
+    # 새로 보이는 세 행만 삽입하고 사라진 세 행만 삭제
+    assert (view.tree.calls["insert"], view.tree.calls["delete"]) == (3, 3)
+
+    view.scroll(-100)
+    assert view.offset == 0
+    view.scroll(10_000)
+    assert view.offset == 990
+
+
+def test_refresh_after_removal_pulls_the_window_up(make_list):
+    rows = Rows(30)
+    view = make_list(rows)
+    view.scroll(20)
+    del rows.rows[25:]
+    view.refresh()
+    assert view.offset == 15
+    assert view.tree.order == [str(row) for row in range(15, 25)]
+
+
+def test_page_cache_is_bounded(make_list):
+    rows = Rows(virtual_list.PAGE_SIZE * 20)
+    view = make_list(rows)
+    for page in range(20):
+        view._on_scrollbar("moveto", str(page / 20))
+    assert len(view._pages) == virtual_list.CACHED_PAGES
+    assert len(rows.fetched) == 20
+
+
+def test_pump_refreshes_the_list_once_and_keeps_other_events_in_order():
+    view = TelegramView.__new__(TelegramView)
+    batches = [("message_added", [1, 2]), ("scheduler_started", [None]), ("message_removed", [1]),
+               ("scheduler_stopped", [None])]
+    refreshes, logged, scheduled = [], [], []
+    view.viewmodel = SimpleNamespace(drain_events=lambda: batches)
+    view.message_list = SimpleNamespace(refresh=lambda: refreshes.append(True))
+    view.root = SimpleNamespace(after=lambda ms, callback: scheduled.append(callback))
+    view._log_lines = lambda lines, level=None: logged.extend(lines)
+
+    view._pump_events()
+    assert len(refreshes) == 1
+    assert logged == ["스케줄러 시작됨", "스케줄러 중지됨"]
+    assert scheduled == [view._pump_events]
+
+    batches = [("scheduler_started", [None])]
+    view._pump_events()
+    assert len(refreshes) == 1
@@ -0,0 +1,43 @@
+import threading
+from typing import Any, List, Tuple
+
+
+class UIEventBus:
+    """Model/ViewModel 이벤트를 UI 스레드로 넘기는 스레드 안전 대기열
+
+    스케줄러/전송 스레드는 publish()로 이벤트를 넣기만 하고, Tk mainloop가 root.after로
+    주기적으로 drain()해서 처리한다. 한 번에 꺼낸 이벤트 중 연달아 나온 같은 종류는 하나로 묶이므로
+    짧은 시간에 몰린 이벤트도 몇 번의 UI 갱신으로 처리되고, 종류가 다른 이벤트의 순서는 유지된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: List[Tuple[str, Any]] = []
+        self.published = 0
+        self.batches = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def publish(self, event_type: str, data: Any = None):
+        """아무 스레드에서나 호출 가능"""
+        with self._lock:
+            self._events.append((event_type, data))
+            self.published += 1
+
+    def drain(self) -> List[Tuple[str, List[Any]]]:
+        """쌓인 이벤트를 모두 꺼내 발생 순서대로 반환 (연달아 나온 같은 종류는 (종류, 데이터 목록) 하나로)
+
+        started, stopped, started처럼 종류가 번갈아 나오면 세 묶음 그대로 반환한다.
+        """
+        with self._lock:
+            events, self._events = self._events, []
+
+        batches: List[Tuple[str, List[Any]]] = []
+        for event_type, data in events:
+            if batches and batches[-1][0] == event_type:
+                batches[-1][1].append(data)
+            else:
+                batches.append((event_type, [data]))
+        self.batches += len(batches)
+        return batches
@@ -1,29 +1,59 @@
+import os
 from typing import Optional, List, Dict, Any
+from models.schedule_store import ScheduledMessage
 from models.telegram_model import TelegramModel
+from viewmodels.event_bus import UIEventBus
+
+# 채팅방/스케줄을 저장하는 기본 SQLite 파일 (프로젝트 루트)
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "telegram_scheduler.db")
+
+# connect() 한 번에 속하는 이벤트 (generation으로 이전 연결의 이벤트를 걸러냄)
+CONNECT_EVENTS = ("connect_progress", "connect_finished")
 
 
 class TelegramViewModel:
     """텔레그램 스케줄러의 비즈니스 로직을 담당하는 ViewModel 클래스"""
     
-    def __init__(self):
-        self.model = TelegramModel()
+    def __init__(self, db_path: Optional[str] = DEFAULT_DB_PATH):
+        self.model = TelegramModel(db_path=db_path)
         self.model.set_callback(self._on_model_callback)
-        self._view_callback: Optional[callable] = None
+        # Model 이벤트는 스케줄러/전송 스레드에서 올라오므로 대기열에 넣고 UI 스레드가 꺼내 처리
+        self.events = UIEventBus()
         
         # 상태 관리
         self.bot_token = ""
-        self.chat_ids = []  # 여러 채팅방 ID를 저장하는 리스트
+        self.chat_ids = list(self.model.get_chat_ids())  # 여러 채팅방 ID를 저장하는 리스트 (저장소에서 복원)
         self.is_connected = False
         self.scheduler_running = False
     
-    def set_view_callback(self, callback: callable):
-        """View에서 UI 업데이트를 위한 콜백 설정"""
-        self._view_callback = callback
-    
     def _on_model_callback(self, event_type: str, data: Any):
-        """Model에서 발생한 이벤트 처리"""
-        if self._view_callback:
-            self._view_callback(event_type, data)
+        """Model에서 발생한 이벤트 처리 (발생한 스레드에서 대기열에 넣기만 함)"""
+        self.events.publish(event_type, data)
+    
+    def _restore_scheduler(self):
+        """지난 실행 종료 시점에 스케줄러가 실행 중이었으면 연결 후 다시 시작"""
+        if not self.scheduler_running and self.model.was_scheduler_running():
+            self.start_scheduler()
+    
+    def drain_events(self) -> List[tuple]:
+        """쌓인 Model 이벤트를 발생 순서대로 반환 (연달아 나온 같은 종류는 묶음, UI 스레드에서 주기적으로 호출)
+        
+        connect()도 UI 스레드에서 호출되므로, 여기서 이전 연결의 이벤트를 버리고 연결 상태를 갱신하면
+        다시 연결한 뒤 늦게 도착한 결과가 상태를 덮어쓰지 않는다.
+        """
+        batches = []
+        for event_type, items in self.events.drain():
+            if event_type in CONNECT_EVENTS:
+                items = [data for data in items if data['generation'] == self.model.connect_generation]
+                if not items:
+                    continue
+            batches.append((event_type, items))
+            if event_type == "connect_finished":
+                self.is_connected = items[-1]['success']
+                if self.is_connected:
+                    self._restore_scheduler()
+        return batches
     
     def set_bot_token(self, token: str) -> bool:
         """봇 토큰 설정"""
@@ -33,6 +63,13 @@ class TelegramViewModel:
             self.is_connected = True
         return success
     
+    def connect(self, token: str, refresh: bool = False) -> bool:
+        """봇 연결 시작 (토큰/채팅방 확인은 백그라운드에서 진행되고 결과는 이벤트로 전달)"""
+        self.bot_token = token
+        started = self.model.connect(token, refresh)
+        self.is_connected = False
+        return started
+    
     def set_chat_ids(self, chat_ids: list):
         """채팅방 ID 목록 설정"""
         self.chat_ids = [chat_id.strip() for chat_id in chat_ids if chat_id.strip()]
@@ -60,13 +97,25 @@ class TelegramViewModel:
         """등록된 채팅방 ID 목록 반환"""
         return self.chat_ids
     
-    def add_scheduled_message(self, message: str, time_str: str, interval: str = "daily") -> bool:
-        """스케줄된 메시지 추가"""
-        if not message.strip():
+    def set_broadcast_strategy(self, strategy: str, staging_chat_id: Optional[str] = None) -> bool:
+        """브로드캐스트 방식 설정 (direct / copy / forward)"""
+        try:
+            self.model.set_broadcast_strategy(strategy, staging_chat_id)
+        except ValueError as e:
+            print(e)
+            return False
+        return True
+    
+    def add_scheduled_message(self, message: str, time_str: str, interval: str = "daily",
+                              misfire: str = "coalesce", media_path: Optional[str] = None,
+                              media_type: Optional[str] = None) -> bool:
+        """스케줄된 메시지 추가 (첨부 파일이 있으면 메시지 내용은 비워도 됨)"""
+        if not message.strip() and not media_path:
             return False
         
         try:
-            self.model.add_scheduled_message(message, time_str, interval)
+            self.model.add_scheduled_message(message, time_str, interval, misfire=misfire,
+                                             media_path=media_path or None, media_type=media_type)
             return True
         except Exception as e:
             print(f"메시지 추가 실패: {e}")
@@ -94,10 +143,31 @@ class TelegramViewModel:
         self.model.stop_scheduler()
         self.scheduler_running = False
     
-    def get_scheduled_messages(self) -> List[Dict]:
+    def shutdown(self):
+        """애플리케이션 종료 시 리소스 정리"""
+        self.model.shutdown()
+        self.scheduler_running = False
+    
+    def get_scheduled_messages(self) -> List[ScheduledMessage]:
         """스케줄된 메시지 목록 반환"""
         return self.model.get_scheduled_messages()
     
+    def get_scheduled_message(self, schedule_id: int) -> Optional[ScheduledMessage]:
+        """ID로 스케줄된 메시지 조회"""
+        return self.model.get_scheduled_message(schedule_id)
+    
+    def get_scheduled_messages_page(self, offset: int, limit: int) -> List[ScheduledMessage]:
+        """스케줄된 메시지 한 페이지 반환 (ID 순)"""
+        return self.model.get_scheduled_messages_page(offset, limit)
+    
+    def count_scheduled_messages(self) -> int:
+        """스케줄된 메시지 수"""
+        return self.model.count_scheduled_messages()
+    
+    def get_send_queue_stats(self) -> Dict[str, Any]:
+        """전송 대기열 길이와 대기 시간 통계"""
+        return self.model.get_send_queue_stats()
+    
     def validate_time_format(self, time_str: str) -> bool:
         """시간 형식 검증 (HH:MM)"""
         try:
@@ -0,0 +1,124 @@
+import logging
+import logging.handlers
+import queue
+import tkinter as tk
+from collections import deque
+from datetime import datetime
+from tkinter import ttk, scrolledtext
+from typing import Deque, List, Tuple
+
+# 화면에 남기는 최대 줄 수와 모아 둔 줄을 그리는 주기 (밀리초)
+DEFAULT_CAPACITY = 5000
+FLUSH_INTERVAL_MS = 50
+
+# 로그 파일 (전체 기록) 회전 설정
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+
+# 레벨 필터 선택지 -> 최소 레벨
+LEVEL_FILTERS = {
+    "전체": logging.DEBUG,
+    "정보": logging.INFO,
+    "경고": logging.WARNING,
+    "오류": logging.ERROR,
+}
+
+logger = logging.getLogger("telegram_scheduler")
+
+
+def setup_file_logging(path: str) -> logging.handlers.QueueListener:
+    """logger 기록을 회전 로그 파일에 남김 (파일 쓰기는 별도 스레드에서 처리해 UI를 막지 않음)
+
+    반환된 listener는 종료 시 stop()해야 남은 기록이 파일에 쓰인다.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    file_handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(records, file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
+class LogPanel:
+    """최근 capacity줄만 보관하는 링 버퍼 로그 창
+
+    줄이 들어올 때마다 그리지 않고 FLUSH_INTERVAL_MS마다 모아서 insert 한 번으로 그린다.
+    링 버퍼를 넘친 오래된 줄은 위젯에서도 잘라 내므로 오래 실행해도 위젯 크기가 일정하다.
+    레벨 필터를 바꾸면 링 버퍼에서 다시 그리며, 전체 기록은 logger(회전 로그 파일)에 남는다.
+    """
+
+    def __init__(self, parent, capacity: int = DEFAULT_CAPACITY, height: int = 6, width: int = 70):
+        self.capacity = capacity
+        self._lines: Deque[Tuple[int, str]] = deque(maxlen=capacity)
+        self._pending: List[Tuple[int, str]] = []
+        self._flush_scheduled = False
+        self._min_level = logging.DEBUG
+
+        self.frame = ttk.Frame(parent)
+        self.level_var = tk.StringVar(value="전체")
+        ttk.Label(self.frame, text="표시 수준:").grid(row=0, column=0, sticky=tk.W)
+        level_combo = ttk.Combobox(self.frame, textvariable=self.level_var, values=list(LEVEL_FILTERS),
+                                   state="readonly", width=8)
+        level_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 0), pady=(0, 5))
+        level_combo.bind("<<ComboboxSelected>>", self._on_level_changed)
+
+        self.text = scrolledtext.ScrolledText(self.frame, height=height, width=width)
+        self.text.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.text.tag_configure(logging.getLevelName(logging.WARNING), foreground="#b36b00")
+        self.text.tag_configure(logging.getLevelName(logging.ERROR), foreground="#c00000")
+
+        self.frame.columnconfigure(1, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+
+    def append(self, messages: List[str], level: int = logging.INFO):
+        """로그 줄 추가 (다음 프레임에 한 번에 그림)"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        for message in messages:
+            logger.log(level, message)
+            line = (level, f"[{timestamp}] {message}\n")
+            self._lines.append(line)
+            self._pending.append(line)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.text.after(FLUSH_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        # 한 프레임에 capacity줄보다 많이 들어왔으면 마지막 capacity줄만 그림
+        pending, self._pending = self._pending[-self.capacity:], []
+        self._insert(pending)
+
+    def _insert(self, lines: List[Tuple[int, str]]):
+        chunks = []
+        for level, line in lines:
+            if level >= self._min_level:
+                chunks.extend((line, logging.getLevelName(level)))
+        if not chunks:
+            return
+
+        at_bottom = self.text.yview()[1] >= 1.0
+        self.text.insert(tk.END, *chunks)
+        # 위젯의 줄 수를 capacity로 유지 (마지막 줄 뒤 빈 줄 포함)
+        excess = int(self.text.index("end-1c").split(".")[0]) - 1 - self.capacity
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+        # 사용자가 위로 스크롤해 읽는 중이면 끝으로 옮기지 않음
+        if at_bottom:
+            self.text.see(tk.END)
+
+    def _on_level_changed(self, event=None):
+        """필터를 바꾸면 링 버퍼에 남은 줄로 다시 그림"""
+        self._min_level = LEVEL_FILTERS.get(self.level_var.get(), logging.DEBUG)
+        # 아직 그리지 않은 줄도 링 버퍼에 들어 있으므로 함께 다시 그림
+        self._pending.clear()
+        self.text.delete("1.0", tk.END)
+        self._insert(list(self._lines))
+
+    def clear(self):
+        self._lines.clear()
+        self._pending.clear()
+        self.text.delete("1.0", tk.END)
@@ -1,7 +1,18 @@
+import logging
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from typing import Optional
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 from viewmodels.telegram_viewmodel import TelegramViewModel
+from views.log_panel import LogPanel, setup_file_logging
+from views.virtual_list import VirtualTreeview
+
+# ViewModel 이벤트 대기열을 비우는 주기 (밀리초)
+EVENT_PUMP_INTERVAL_MS = 50
+# 전송 결과 하나에서 로그에 남기는 오류 줄 수 (나머지는 개수만 표시)
+MAX_LOGGED_ERRORS = 20
+# 전체 로그 기록 파일 (프로젝트 루트, 크기가 차면 회전)
+LOG_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "telegram_scheduler.log")
 
 
 class TelegramView:
@@ -9,7 +20,7 @@ class TelegramView:
     
     def __init__(self):
         self.viewmodel = TelegramViewModel()
-        self.viewmodel.set_view_callback(self._on_viewmodel_callback)
+        self._log_listener = setup_file_logging(LOG_FILE_PATH)
         
         # 메인 윈도우 설정
         self.root = tk.Tk()
@@ -19,6 +30,13 @@ class TelegramView:
         
         self._setup_ui()
         self._setup_bindings()
+        
+        # 저장소에서 복원된 채팅방/스케줄 표시
+        self._update_chat_id_list()
+        self._update_message_list()
+        
+        # ViewModel 이벤트는 다른 스레드에서 올라오므로 mainloop에서 주기적으로 꺼내 처리
+        self.root.after(EVENT_PUMP_INTERVAL_MS, self._pump_events)
     
     def _setup_ui(self):
         """UI 구성 요소 설정"""
@@ -93,8 +111,29 @@ class TelegramView:
                                     values=["daily", "hourly", "weekly"], width=10, state="readonly")
         interval_combo.grid(row=0, column=3, padx=(5, 0))
         
+        ttk.Label(time_frame, text="놓친 실행:").grid(row=0, column=4, sticky=tk.W, padx=(10, 0))
+        self.misfire_var = tk.StringVar(value="coalesce")
+        misfire_combo = ttk.Combobox(time_frame, textvariable=self.misfire_var,
+                                     values=["skip", "coalesce", "all"], width=10, state="readonly")
+        misfire_combo.grid(row=0, column=5, padx=(5, 0))
+        
+        # 첨부 파일 (선택)
+        media_frame = ttk.Frame(message_frame)
+        media_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 5))
+        
+        ttk.Label(media_frame, text="첨부 파일:").grid(row=0, column=0, sticky=tk.W)
+        self.media_path_var = tk.StringVar()
+        ttk.Entry(media_frame, textvariable=self.media_path_var, width=30).grid(row=0, column=1, padx=(5, 5),
+                                                                              sticky=(tk.W, tk.E))
+        ttk.Button(media_frame, text="찾아보기", command=self._on_browse_media_clicked).grid(row=0, column=2)
+        self.media_type_var = tk.StringVar(value="photo")
+        media_type_combo = ttk.Combobox(media_frame, textvariable=self.media_type_var,
+                                        values=["photo", "document", "video"], width=10, state="readonly")
+        media_type_combo.grid(row=0, column=3, padx=(5, 0))
+        media_frame.columnconfigure(1, weight=1)
+        
         self.add_message_btn = ttk.Button(message_frame, text="메시지 추가", command=self._on_add_message_clicked)
-        self.add_message_btn.grid(row=3, column=0, pady=(10, 0))
+        self.add_message_btn.grid(row=4, column=0, pady=(10, 0))
         
         # 스케줄러 제어 섹션
         control_frame = ttk.LabelFrame(main_frame, text="스케줄러 제어", padding="10")
@@ -110,20 +149,24 @@ class TelegramView:
         list_frame = ttk.LabelFrame(main_frame, text="스케줄된 메시지", padding="10")
         list_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
-        # 트리뷰 설정
+        # 트리뷰 설정 (스케줄이 많아도 보이는 행만 저장소에서 페이지 단위로 불러와 그림)
         columns = ("시간", "반복", "메시지")
-        self.message_tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=8)
+        self.message_list = VirtualTreeview(
+            list_frame, columns,
+            fetch=self.viewmodel.get_scheduled_messages_page,
+            count=self.viewmodel.count_scheduled_messages,
+            values=self._message_values,
+            key=lambda msg: msg.id,
+        )
+        self.message_tree = self.message_list.tree
         
         for col in columns:
             self.message_tree.heading(col, text=col)
             self.message_tree.column(col, width=100)
         
         # 스크롤바
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.message_tree.yview)
-        self.message_tree.configure(yscrollcommand=scrollbar.set)
-        
         self.message_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.message_list.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # 삭제 버튼
         self.remove_btn = ttk.Button(list_frame, text="선택된 메시지 삭제", command=self._on_remove_clicked)
@@ -133,8 +176,9 @@ class TelegramView:
         log_frame = ttk.LabelFrame(main_frame, text="로그", padding="10")
         log_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=6, width=70)
-        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_panel = LogPanel(log_frame, height=6, width=70)
+        self.log_panel.frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text = self.log_panel.text
         
         # 그리드 가중치 설정
         self.root.columnconfigure(0, weight=1)
@@ -197,12 +241,13 @@ class TelegramView:
             messagebox.showerror("오류", "최소 하나의 채팅방 ID를 추가해주세요.")
             return
         
-        success = self.viewmodel.set_bot_token(token)
-        if success:
-            self._log(f"봇 연결 성공 - {len(chat_ids)}개 채팅방 등록됨")
-            messagebox.showinfo("성공", f"봇 연결이 완료되었습니다.\n{len(chat_ids)}개 채팅방이 등록되었습니다.")
+        # 토큰/채팅방 확인은 백그라운드에서 진행되고 결과는 connect_* 이벤트로 들어옴
+        if self.viewmodel.connect(token):
+            self.connect_btn.state(["disabled"])
+            self.status_label.config(text="상태: 연결 확인 중...", foreground="orange")
+            self._log(f"봇 연결 확인 중 - {len(chat_ids)}개 채팅방")
         else:
-            self._log("봇 연결 실패")
+            self._log("봇 연결 실패", logging.ERROR)
             messagebox.showerror("오류", "봇 연결에 실패했습니다. 토큰을 확인해주세요.")
     
     def _on_add_message_clicked(self):
@@ -210,9 +255,11 @@ class TelegramView:
         message = self.message_text.get("1.0", tk.END).strip()
         time_str = self.time_entry.get().strip()
         interval = self.interval_var.get()
+        misfire = self.misfire_var.get()
+        media_path = self.media_path_var.get().strip()
         
-        if not message:
-            messagebox.showerror("오류", "메시지 내용을 입력해주세요.")
+        if not message and not media_path:
+            messagebox.showerror("오류", "메시지 내용을 입력하거나 파일을 첨부해주세요.")
             return
         
         if not time_str:
@@ -223,14 +270,30 @@ class TelegramView:
             messagebox.showerror("오류", "시간 형식이 올바르지 않습니다. (HH:MM)")
             return
         
-        success = self.viewmodel.add_scheduled_message(message, time_str, interval)
+        success = self.viewmodel.add_scheduled_message(message, time_str, interval, misfire,
+                                                       media_path, self.media_type_var.get())
         if success:
             self.message_text.delete("1.0", tk.END)
             self.time_entry.delete(0, tk.END)
+            self.media_path_var.set("")
             self._log(f"메시지 추가됨: {time_str} ({interval}) - {message[:30]}...")
         else:
             messagebox.showerror("오류", "메시지 추가에 실패했습니다.")
     
+    def _on_browse_media_clicked(self):
+        """첨부 파일 선택"""
+        path = filedialog.askopenfilename(title="첨부 파일 선택")
+        if path:
+            self.media_path_var.set(path)
+            # 확장자로 첨부 종류를 미리 골라 둠
+            extension = path.rsplit(".", 1)[-1].lower()
+            if extension in ("jpg", "jpeg", "png", "webp"):
+                self.media_type_var.set("photo")
+            elif extension in ("mp4", "mov", "mkv"):
+                self.media_type_var.set("video")
+            else:
+                self.media_type_var.set("document")
+    
     def _on_start_clicked(self):
         """스케줄러 시작 버튼 클릭 이벤트"""
         success = self.viewmodel.start_scheduler()
@@ -253,43 +316,91 @@ class TelegramView:
             messagebox.showwarning("경고", "삭제할 메시지를 선택해주세요.")
             return
         
-        item = selection[0]
-        schedule_id = self.message_tree.item(item, "values")[0]  # 첫 번째 컬럼이 ID라고 가정
+        # 트리뷰 항목 ID가 곧 스케줄 ID
+        schedule_id = int(selection[0])
         
         if messagebox.askyesno("확인", "선택된 메시지를 삭제하시겠습니까?"):
-            self.viewmodel.remove_scheduled_message(int(schedule_id))
+            self.viewmodel.remove_scheduled_message(schedule_id)
             self._log(f"메시지 삭제됨: ID {schedule_id}")
     
     def _on_tree_double_click(self, event):
         """트리뷰 더블클릭 이벤트"""
         selection = self.message_tree.selection()
         if selection:
-            item = selection[0]
-            values = self.message_tree.item(item, "values")
-            messagebox.showinfo("메시지 내용", f"메시지: {values[2]}")
+            msg = self.viewmodel.get_scheduled_message(int(selection[0]))
+            if msg:
+                content = f"메시지: {msg.message}"
+                if msg.media_path:
+                    content += f"\n첨부 ({msg.media_type}): {msg.media_path}"
+                messagebox.showinfo("메시지 내용", content)
     
-    def _on_viewmodel_callback(self, event_type: str, data):
-        """ViewModel에서 발생한 이벤트 처리"""
-        if event_type == "message_added":
-            self._update_message_list()
-        elif event_type == "message_removed":
-            self._update_message_list()
-        elif event_type == "message_sent":
-            if data['success']:
-                self._log(f"메시지 전송 성공: {data['sent_count']}/{data['total_count']}개 채팅방 - {data['timestamp']}")
-                if data['errors']:
-                    for error in data['errors']:
-                        self._log(f"  오류: {error}")
-            else:
-                self._log(f"메시지 전송 실패: {data['timestamp']}")
-                if data['errors']:
-                    for error in data['errors']:
-                        self._log(f"  오류: {error}")
+    def _pump_events(self):
+        """ViewModel 이벤트 대기열을 비우고 다음 주기를 예약 (Tk 위젯은 이 스레드에서만 다룸)"""
+        try:
+            batches = self.viewmodel.drain_events()
+            # 목록은 저장소에서 다시 읽어 그리므로 추가/삭제는 모아서 한 번만 반영
+            self._apply_message_changes(any(event_type in ("message_added", "message_removed")
+                                            for event_type, _ in batches))
+            # 나머지 이벤트는 발생 순서대로 처리
+            for event_type, items in batches:
+                if event_type not in ("message_added", "message_removed"):
+                    self._on_viewmodel_events(event_type, items)
+        finally:
+            self.root.after(EVENT_PUMP_INTERVAL_MS, self._pump_events)
+    
+    def _on_viewmodel_events(self, event_type: str, items: list):
+        """ViewModel에서 발생한 이벤트 처리 (같은 종류의 이벤트는 묶어서 한 번에 갱신)"""
+        if event_type == "message_sent":
+            for data in items:
+                if data['success']:
+                    lines = [f"메시지 전송 성공: {data['sent_count']}/{data['total_count']}개 채팅방 - "
+                             f"{data['timestamp']}"]
+                    if data.get('retry_count'):
+                        lines.append(f"  재시도: {data['retry_count']}회")
+                    self._log_lines(lines)
+                else:
+                    self._log_lines([f"메시지 전송 실패: {data['timestamp']}"], logging.ERROR)
+                errors = data['errors']
+                lines = [f"  오류: {error}" for error in errors[:MAX_LOGGED_ERRORS]]
+                if len(errors) > MAX_LOGGED_ERRORS:
+                    lines.append(f"  ... 외 {len(errors) - MAX_LOGGED_ERRORS}개 오류")
+                self._log_lines(lines, logging.WARNING)
+        elif event_type == "connect_progress":
+            # 묶인 진행 이벤트 중 마지막 것만 상태에 표시하고, 전송할 수 없는 채팅방은 로그에 남김
+            last = items[-1]
+            self.status_label.config(text=f"상태: 채팅방 확인 중 {last['checked']}/{last['total']}")
+            blocked = [data['chat'] for data in items if data['chat'] is not None and not data['chat'].can_send]
+            lines = [f"  전송 불가: {info.chat_id} - {info.error or info.member_status}"
+                     for info in blocked[:MAX_LOGGED_ERRORS]]
+            if len(blocked) > MAX_LOGGED_ERRORS:
+                lines.append(f"  ... 외 {len(blocked) - MAX_LOGGED_ERRORS}개 채팅방")
+            self._log_lines(lines, logging.WARNING)
+        elif event_type == "connect_finished":
+            self._on_connect_finished(items[-1])
         elif event_type == "scheduler_started":
             self._log("스케줄러 시작됨")
         elif event_type == "scheduler_stopped":
             self._log("스케줄러 중지됨")
     
+    def _on_connect_finished(self, data: dict):
+        """연결 확인 결과 표시"""
+        self.connect_btn.state(["!disabled"])
+        if not data['success']:
+            self.status_label.config(text="상태: 연결 안됨", foreground="red")
+            self._log(f"봇 연결 실패: {data['error']}", logging.ERROR)
+            messagebox.showerror("오류", f"봇 연결에 실패했습니다. 토큰을 확인해주세요.\n{data['error']}")
+            return
+        
+        bot = data['bot']
+        sendable = sum(info.can_send for info in data['chats'])
+        source = " (저장된 확인 결과 사용)" if data.get('from_cache') else ""
+        self.status_label.config(
+            text=f"상태: 연결됨 - @{bot.username} ({sendable}/{data['total']}개 채팅방 전송 가능)",
+            foreground="green")
+        self._log(f"봇 연결 성공 - @{bot.username}, {sendable}/{data['total']}개 채팅방 전송 가능{source}")
+        messagebox.showinfo("성공", f"봇 연결이 완료되었습니다. (@{bot.username})\n"
+                                   f"{data['total']}개 채팅방 중 {sendable}개에 전송할 수 있습니다.")
+    
     def _update_chat_id_list(self):
         """채팅방 ID 목록 업데이트"""
         # 기존 항목 삭제
@@ -301,33 +412,43 @@ class TelegramView:
             self.chat_id_listbox.insert(tk.END, chat_id)
     
     def _update_message_list(self):
-        """메시지 목록 업데이트"""
-        # 기존 항목 삭제
-        for item in self.message_tree.get_children():
-            self.message_tree.delete(item)
-        
-        # 새 항목 추가
-        messages = self.viewmodel.get_scheduled_messages()
-        for msg in messages:
-            self.message_tree.insert("", "end", values=(
-                msg['id'],
-                msg['time'],
-                msg['interval'],
-                msg['message'][:50] + "..." if len(msg['message']) > 50 else msg['message']
-            ))
+        """메시지 목록 다시 그리기 (보이는 구간만)"""
+        self.message_list.refresh()
+    
+    def _apply_message_changes(self, changed: bool):
+        """스케줄이 추가/삭제되었으면 목록에 반영
+        
+        행 위치가 바뀌므로 페이지 캐시를 비우고 보이는 구간만 다시 그린다.
+        보이는 행은 스케줄 ID로 비교해 바뀐 행만 삽입/수정/삭제된다.
+        """
+        if changed:
+            self.message_list.refresh()
+    
+    @staticmethod
+    def _message_values(msg) -> tuple:
+        text = f"[{msg.media_type}] {msg.message}" if msg.media_type else msg.message
+        return (
+            msg.time,
+            msg.interval,
+            text[:50] + "..." if len(text) > 50 else text
+        )
     
-    def _log(self, message: str):
+    def _log(self, message: str, level: int = logging.INFO):
         """로그 메시지 추가"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        
-        self.log_text.insert(tk.END, log_message)
-        self.log_text.see(tk.END)
+        self._log_lines([message], level)
+    
+    def _log_lines(self, messages: list, level: int = logging.INFO):
+        """로그 메시지 여러 줄 추가 (화면에는 다음 프레임에 한 번에 그려지고, 전체 기록은 로그 파일에 남음)"""
+        if messages:
+            self.log_panel.append(messages, level)
     
     def run(self):
         """애플리케이션 실행"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.viewmodel.shutdown()
+            self._log_listener.stop()
 
 
 if __name__ == "__main__":
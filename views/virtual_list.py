@@ -0,0 +1,122 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, Dict, List, Sequence
+
+# 한 번에 불러오는 행 수와 메모리에 남겨 두는 페이지 수
+PAGE_SIZE = 200
+CACHED_PAGES = 8
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualTreeview:
+    """보이는 행만 그리는 Treeview (행 수와 상관없이 위젯에는 화면에 보이는 만큼만 들어감)
+
+    fetch(offset, limit)로 필요한 페이지만 불러오고 최근 페이지 몇 개를 캐시한다.
+    스크롤바와 마우스 휠은 Treeview 대신 이 클래스가 처리해 위치(offset)만 옮긴 뒤 다시 그린다.
+    다시 그릴 때는 행 키 -> 항목 ID 맵으로 바뀐 행만 삽입/수정/삭제한다.
+    항목 ID는 str(key(row))라 선택된 항목에서 바로 키를 얻을 수 있다.
+    """
+
+    def __init__(self, parent, columns: Sequence[str], fetch: Callable[[int, int], List],
+                 count: Callable[[], int], values: Callable[[object], tuple], key: Callable[[object], int],
+                 height: int = 8):
+        self._fetch = fetch
+        self._count = count
+        self._values = values
+        self._key = key
+
+        self.tree = ttk.Treeview(parent, columns=columns, show="headings", height=height)
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self._on_scrollbar)
+
+        self.offset = 0
+        self.total = 0
+        self.visible_rows = height
+        self._pages: "OrderedDict[int, List]" = OrderedDict()
+        self._items: Dict[int, str] = {}
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(3))
+
+    def refresh(self):
+        """데이터가 바뀌었을 때 호출 - 캐시를 비우고 보이는 구간만 다시 그림"""
+        self._pages.clear()
+        self.total = self._count()
+        self._render()
+
+    def scroll(self, rows: int) -> str:
+        self._move_to(self.offset + rows)
+        return "break"
+
+    def _move_to(self, offset: int):
+        offset = max(0, min(offset, self.total - self.visible_rows))
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def _window(self) -> List:
+        """offset부터 보이는 행 수만큼 반환 (필요한 페이지만 불러옴)"""
+        rows = []
+        position, end = self.offset, min(self.offset + self.visible_rows, self.total)
+        while position < end:
+            page_no = position // PAGE_SIZE
+            page = self._pages.get(page_no)
+            if page is None:
+                page = self._pages[page_no] = self._fetch(page_no * PAGE_SIZE, PAGE_SIZE)
+                if len(self._pages) > CACHED_PAGES:
+                    self._pages.popitem(last=False)
+            else:
+                self._pages.move_to_end(page_no)
+            start = position - page_no * PAGE_SIZE
+            chunk = page[start:start + end - position]
+            if not chunk:
+                break
+            rows.extend(chunk)
+            position += len(chunk)
+        return rows
+
+    def _render(self):
+        # 끝 근처에서 행이 삭제되었으면 위로 당겨 빈 줄이 생기지 않게 함
+        self.offset = max(0, min(self.offset, self.total - self.visible_rows))
+        rows = self._window()
+        keys = [self._key(row) for row in rows]
+
+        wanted = set(keys)
+        stale = [self._items.pop(key) for key in list(self._items) if key not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+        for index, (key, row) in enumerate(zip(keys, rows)):
+            item = self._items.get(key)
+            if item is None:
+                self._items[key] = self.tree.insert("", index, iid=str(key), values=self._values(row))
+            else:
+                self.tree.item(item, values=self._values(row))
+                self.tree.move(item, "", index)
+
+        if self.total:
+            self.scrollbar.set(self.offset / self.total, min(1.0, (self.offset + len(rows)) / self.total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str = "units"):
+        if action == "moveto":
+            self._move_to(int(float(amount) * self.total))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self._move_to(self.offset + int(amount) * step)
+
+    def _on_mouse_wheel(self, event) -> str:
+        # Windows는 한 칸에 120, macOS는 1 단위
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-delta * 3)
+
+    def _on_configure(self, event):
+        """위젯 크기가 바뀌면 보이는 행 수를 다시 계산"""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        # 제목 줄 한 줄을 뺀 높이
+        rows = max(1, event.height // row_height - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self._render()